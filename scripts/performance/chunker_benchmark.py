@@ -0,0 +1,102 @@
+import argparse
+import random
+import re
+import time
+
+from youtube_to_docs.utils import chunk_text_by_bytes
+
+WORDS = ["the", "budget", "committee", "año", "naïve", "über", "会議", "vote", "on"]
+
+
+def build_transcript(num_bytes: int, seed: int = 0) -> str:
+    """Builds a synthetic transcript of roughly num_bytes UTF-8 bytes."""
+    rng = random.Random(seed)
+    sentences = []
+    size = 0
+    while size < num_bytes:
+        sentence = " ".join(rng.choices(WORDS, k=rng.randint(4, 30))).capitalize()
+        sentence += rng.choice([".", "?", "!"])
+        sentences.append(sentence)
+        size += len(sentence.encode("utf-8")) + 1
+    return " ".join(sentences)
+
+
+def legacy_chunk_text_by_bytes(text: str, max_bytes: int) -> list[str]:
+    """The TTS chunker used before, re-encoding the chunk on every append."""
+    if len(text.encode("utf-8")) <= max_bytes:
+        return [text]
+    chunks = []
+    current_chunk = ""
+    for s in re.split(r"(?<=[.!?]) +", text):
+        if len((current_chunk + " " + s).encode("utf-8")) > max_bytes:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+                current_chunk = s
+            else:
+                for w in s.split(" "):
+                    if len((current_chunk + " " + w).encode("utf-8")) > max_bytes:
+                        if current_chunk:
+                            chunks.append(current_chunk.strip())
+                        current_chunk = w
+                    else:
+                        current_chunk = (current_chunk + " " + w).strip()
+        else:
+            current_chunk = (current_chunk + " " + s).strip()
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def timed(label: str, func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<40} {elapsed * 1000:10.2f} ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the text chunker.")
+    parser.add_argument("--bytes", type=int, default=1_048_576)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = build_transcript(args.bytes)
+    print(f"{len(text.encode('utf-8')) / 1_048_576:.1f} MB transcript\n")
+
+    for max_bytes in (2000, 4800):
+        chunks = chunk_text_by_bytes(text, max_bytes)
+        assert "".join(chunks) == text
+        print(f"max_bytes={max_bytes}: {len(chunks)} chunks")
+        timed(
+            "  legacy TTS chunker",
+            lambda: legacy_chunk_text_by_bytes(text, max_bytes),
+            args.repeat,
+        )
+        timed(
+            "  chunk_text_by_bytes",
+            lambda: chunk_text_by_bytes(text, max_bytes),
+            args.repeat,
+        )
+    # Without sentence ends every chunk is packed word by word
+    run_on = re.sub(r"[.!?]", ",", text)
+    timed(
+        "legacy TTS chunker (no sentence ends)",
+        lambda: legacy_chunk_text_by_bytes(run_on, 4800),
+        args.repeat,
+    )
+    timed(
+        "chunk_text_by_bytes (no sentence ends)",
+        lambda: chunk_text_by_bytes(run_on, 4800),
+        args.repeat,
+    )
+    timed(
+        "chunk_text_by_bytes (by line, 10 KB)",
+        lambda: chunk_text_by_bytes(text.replace("! ", "!\n"), 10_000, True),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import re
+import time
+
+from youtube_to_docs.srt import Cues, format_timestamp
+
+
+def build_srt(num_cues: int) -> str:
+    """Builds a synthetic SRT file with num_cues two-second cues."""
+    return "\n".join(
+        f"{i}\n{format_timestamp((i - 1) * 2000)} --> "
+        f"{format_timestamp(i * 2000 - 100)}\n"
+        f"Cue number {i} with <i>some</i> words in it.\n"
+        for i in range(1, num_cues + 1)
+    )
+
+
+def legacy_to_text(srt_content: str) -> str:
+    """The line-by-line stripping previously done in main()."""
+    text_blocks = []
+    for line in srt_content.strip().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if re.match(r"^\d+$", line):
+            continue
+        if "-->" in line:
+            continue
+        line = re.sub(r"<[^>]+>", "", line)
+        if line:
+            text_blocks.append(line)
+    return " ".join(text_blocks)
+
+
+def legacy_shift(srt_content: str, offset_seconds: float) -> str:
+    """Regex rewrite of every timestamp, as the offset/remap code used to do."""
+
+    def _replace(match: re.Match) -> str:
+        hrs, mins, secs, msecs = (int(g) for g in match.groups())
+        seconds = hrs * 3600 + mins * 60 + secs + msecs / 1000 + offset_seconds
+        return format_timestamp(int(round(seconds * 1000)))
+
+    return re.sub(r"(\d{2}):(\d{2}):(\d{2}),(\d{3})", _replace, srt_content)
+
+
+def timed(label: str, func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<40} {elapsed * 1000:10.2f} ms")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SRT cue engine.")
+    parser.add_argument("--cues", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    srt_content = build_srt(args.cues)
+    print(f"{args.cues} cues, {len(srt_content) / 1_048_576:.1f} MB of SRT\n")
+
+    cues = Cues.parse(srt_content)
+    assert cues.to_text() == legacy_to_text(srt_content)
+
+    timed("parse", lambda: Cues.parse(srt_content), args.repeat)
+    timed("serialize", cues.to_srt, args.repeat)
+    timed(
+        "to plain text (legacy regex lines)",
+        lambda: legacy_to_text(srt_content),
+        args.repeat,
+    )
+    timed(
+        "to plain text (parse + to_text)",
+        lambda: Cues.parse(srt_content).to_text(),
+        args.repeat,
+    )
+    timed("to plain text (parsed cues)", cues.to_text, args.repeat)
+    timed(
+        "shift 19 min (legacy regex)",
+        lambda: legacy_shift(srt_content, 1140),
+        args.repeat,
+    )
+    timed("shift 19 min (cues)", lambda: cues.shift(1_140_000), args.repeat)
+    timed("merge 10 chunks", lambda: Cues.merge([cues] * 10), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+
+from youtube_to_docs.video import create_video
+
+
+def make_inputs(temp_dir: str, minutes: float) -> tuple[str, str]:
+    """Creates a 1080p test image and a speech-like AAC track of the given length."""
+    from static_ffmpeg import run
+
+    ffmpeg_path, _ = run.get_or_fetch_platform_executables_else_raise()
+    image_path = os.path.join(temp_dir, "infographic.png")
+    audio_path = os.path.join(temp_dir, "summary.m4a")
+    subprocess.run(
+        [
+            ffmpeg_path,
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc2=size=1920x1080",
+            "-frames:v",
+            "1",
+            image_path,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    subprocess.run(
+        [
+            ffmpeg_path,
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=220:sample_rate=24000:duration={minutes * 60}",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "64k",
+            audio_path,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return image_path, audio_path
+
+
+def timed_encode(label: str, image: str, audio: str, output: str, fast: bool):
+    start = time.perf_counter()
+    if not create_video(image, audio, output, fast=fast):
+        raise RuntimeError(f"{label} encode failed")
+    elapsed = time.perf_counter() - start
+    size_mb = os.path.getsize(output) / 1_048_576
+    print(f"{label:<30} {elapsed:8.2f} s {size_mb:8.2f} MB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark still-image video encoding in create_video."
+    )
+    parser.add_argument("--minutes", type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        image, audio = make_inputs(temp_dir, args.minutes)
+        print(f"{args.minutes:g}-minute summary, 1920x1080 infographic\n")
+        full = timed_encode(
+            "25 fps, re-encoded audio",
+            image,
+            audio,
+            os.path.join(temp_dir, "full.mp4"),
+            fast=False,
+        )
+        fast = timed_encode(
+            "fast mode",
+            image,
+            audio,
+            os.path.join(temp_dir, "fast.mp4"),
+            fast=True,
+        )
+        print(f"\nSpeedup: {full / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keeps journals and caches written during tests out of the home dir."""
+    monkeypatch.setenv("YTD_CACHE_DIR", str(tmp_path / "ytd-cache"))
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--run-integration",
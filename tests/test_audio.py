@@ -0,0 +1,273 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from youtube_to_docs.audio import (
+    AudioCache,
+    PreparedAudio,
+    _keep_segments,
+    _parse_duration,
+    _parse_silences,
+    encode_pcm_stream,
+    prepare_stt_audio,
+)
+
+SILENCEDETECT_OUTPUT = """\
+Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'audio.m4a':
+  Duration: 00:01:00.00, start: 0.000000, bitrate: 129 kb/s
+[silencedetect @ 0x1] silence_start: 10
+[silencedetect @ 0x1] silence_end: 20 | silence_duration: 10
+[silencedetect @ 0x1] silence_start: 50
+"""
+
+
+class TestSilenceParsing(unittest.TestCase):
+    def test_parse_duration(self):
+        self.assertEqual(_parse_duration(SILENCEDETECT_OUTPUT), 60.0)
+        self.assertIsNone(_parse_duration("no duration here"))
+
+    def test_parse_silences_with_open_tail(self):
+        self.assertEqual(
+            _parse_silences(SILENCEDETECT_OUTPUT), [(10.0, 20.0), (50.0, None)]
+        )
+
+    def test_keep_segments_pads_cuts(self):
+        keep = _keep_segments([(10.0, 20.0), (50.0, None)], 60.0, padding=0.5)
+        self.assertEqual(keep, [(0.0, 10.5), (19.5, 50.5)])
+
+    def test_keep_segments_leading_silence(self):
+        keep = _keep_segments([(0.0, 5.0)], 30.0, padding=0.5)
+        self.assertEqual(keep, [(4.5, 30.0)])
+
+
+class TestPreparedAudio(unittest.TestCase):
+    def setUp(self):
+        # Kept: original 0-10 -> processed 0-10, original 20-50 -> processed 10-40
+        self.prepared = PreparedAudio(
+            path="audio.stt.flac",
+            duration_seconds=40.0,
+            segments=[(0.0, 0.0, 10.0), (10.0, 20.0, 30.0)],
+        )
+
+    def test_to_original_time(self):
+        self.assertEqual(self.prepared.to_original_time(5.0), 5.0)
+        self.assertEqual(self.prepared.to_original_time(10.0), 20.0)
+        self.assertEqual(self.prepared.to_original_time(15.5), 25.5)
+
+    def test_to_original_time_without_segments(self):
+        self.assertEqual(PreparedAudio(path="a.flac").to_original_time(7.25), 7.25)
+
+    def test_remap_srt(self):
+        srt = "1\n00:00:09,000 --> 00:00:12,500\nHello\n"
+        self.assertEqual(
+            self.prepared.remap_srt(srt),
+            "1\n00:00:09,000 --> 00:00:22,500\nHello\n",
+        )
+
+    def test_remap_srt_noop(self):
+        srt = "1\n00:00:09,000 --> 00:00:12,500\nHello\n"
+        self.assertEqual(PreparedAudio(path="a.flac").remap_srt(srt), srt)
+
+
+class TestPrepareSttAudio(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.audio_path = os.path.join(self.temp_dir, "vid1.m4a")
+        with open(self.audio_path, "wb") as f:
+            f.write(b"x" * 100)
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _fake_run(self, command, **kwargs):
+        if "null" in command:
+            return MagicMock(stderr=SILENCEDETECT_OUTPUT)
+        with open(command[-1], "wb") as f:
+            f.write(b"y" * 10)
+        return MagicMock(returncode=0)
+
+    @patch("youtube_to_docs.audio.subprocess.run")
+    @patch("static_ffmpeg.add_paths")
+    def test_prepare_flac(self, mock_add_paths, mock_run):
+        mock_run.side_effect = self._fake_run
+
+        prepared = prepare_stt_audio(
+            self.audio_path, self.temp_dir, codec="flac", trim_silence=False
+        )
+
+        self.assertEqual(prepared.path, os.path.join(self.temp_dir, "vid1.stt.flac"))
+        self.assertEqual(prepared.segments, [])
+        self.assertIsNone(prepared.duration_seconds)
+        args = mock_run.call_args[0][0]
+        self.assertEqual(args[args.index("-ac") + 1], "1")
+        self.assertEqual(args[args.index("-ar") + 1], "16000")
+        self.assertEqual(args[args.index("-c:a") + 1], "flac")
+        self.assertNotIn("-af", args)
+
+    @patch("youtube_to_docs.audio.subprocess.run")
+    @patch("static_ffmpeg.add_paths")
+    def test_prepare_opus_with_silence_trim(self, mock_add_paths, mock_run):
+        mock_run.side_effect = self._fake_run
+
+        prepared = prepare_stt_audio(
+            self.audio_path, self.temp_dir, codec="opus", trim_silence=True
+        )
+
+        self.assertTrue(prepared.path.endswith("vid1.stt.ogg"))
+        self.assertEqual(mock_run.call_count, 2)
+        encode_args = mock_run.call_args[0][0]
+        self.assertEqual(encode_args[encode_args.index("-c:a") + 1], "libopus")
+        self.assertIn("aselect", encode_args[encode_args.index("-af") + 1])
+        self.assertEqual(len(prepared.segments), 2)
+        self.assertAlmostEqual(prepared.duration_seconds or 0, 40.75)
+
+    @patch.dict(os.environ, {"YTD_STT_TRIM_SILENCE": "1"})
+    @patch("youtube_to_docs.audio.subprocess.run")
+    @patch("static_ffmpeg.add_paths")
+    def test_trim_silence_from_env(self, mock_add_paths, mock_run):
+        mock_run.side_effect = self._fake_run
+        prepared = prepare_stt_audio(self.audio_path, self.temp_dir)
+        self.assertTrue(prepared.segments)
+
+    @patch("youtube_to_docs.audio.subprocess.run")
+    @patch("static_ffmpeg.add_paths")
+    def test_keeps_original_when_copy_is_larger(self, mock_add_paths, mock_run):
+        def larger_copy(command, **kwargs):
+            with open(command[-1], "wb") as f:
+                f.write(b"y" * 500)
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = larger_copy
+
+        prepared = prepare_stt_audio(
+            self.audio_path, self.temp_dir, codec="flac", trim_silence=False
+        )
+
+        self.assertEqual(prepared.path, self.audio_path)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "vid1.stt.flac")))
+
+    @patch("youtube_to_docs.audio.subprocess.run")
+    @patch("static_ffmpeg.add_paths")
+    def test_failure_returns_original(self, mock_add_paths, mock_run):
+        mock_run.side_effect = subprocess.CalledProcessError(1, "ffmpeg")
+
+        prepared = prepare_stt_audio(self.audio_path, self.temp_dir)
+
+        self.assertEqual(prepared.path, self.audio_path)
+        self.assertEqual(prepared.segments, [])
+
+
+class TestAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = AudioCache(os.path.join(self.temp_dir, "cache"), max_bytes=25)
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _download(self, name, size=10):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        return path
+
+    def test_put_and_get(self):
+        source = self._download("vid1.m4a")
+        cached = self.cache.put(source, "vid1", "stt")
+
+        self.assertEqual(cached, self.cache.path("vid1", "stt"))
+        self.assertFalse(os.path.exists(source))
+        self.assertEqual(self.cache.get("vid1", "stt"), cached)
+        self.assertIsNone(self.cache.get("vid1", "archive"))
+
+    def test_evicts_least_recently_used(self):
+        first = self.cache.put(self._download("vid1.m4a"), "vid1", "stt")
+        second = self.cache.put(self._download("vid2.m4a"), "vid2", "stt")
+        os.utime(first, (1, 1))
+        os.utime(second, (2, 2))
+        # Reading vid1 makes vid2 the least recently used entry
+        self.cache.get("vid1", "stt")
+
+        self.cache.put(self._download("vid3.m4a"), "vid3", "stt")
+
+        self.assertIsNotNone(self.cache.get("vid1", "stt"))
+        self.assertIsNone(self.cache.get("vid2", "stt"))
+        self.assertIsNotNone(self.cache.get("vid3", "stt"))
+
+    def test_oversized_file_not_cached(self):
+        source = self._download("vid1.m4a", size=30)
+        self.assertEqual(self.cache.put(source, "vid1", "stt"), source)
+        self.assertIsNone(self.cache.get("vid1", "stt"))
+
+    def test_disabled(self):
+        cache = AudioCache(os.path.join(self.temp_dir, "off"), max_bytes=0)
+        source = self._download("vid1.m4a")
+        self.assertEqual(cache.put(source, "vid1", "stt"), source)
+        self.assertIsNone(cache.get("vid1", "stt"))
+
+    @patch.dict(os.environ, {"YTD_AUDIO_CACHE_MAX_BYTES": "1234"})
+    def test_max_bytes_from_env(self):
+        self.assertEqual(AudioCache().max_bytes, 1234)
+
+
+class TestEncodePcmStream(unittest.TestCase):
+    @patch("youtube_to_docs.audio.subprocess.Popen")
+    @patch("static_ffmpeg.add_paths")
+    def test_pipes_chunks_to_ffmpeg(self, mock_add_paths, mock_popen):
+        process = mock_popen.return_value
+        process.communicate.return_value = (b"", b"")
+        process.returncode = 0
+
+        written = encode_pcm_stream(
+            iter([b"\x00\x01", b"", b"\x02\x03"]), 24000, "out.opus", "opus"
+        )
+
+        self.assertEqual(written, 4)
+        command = mock_popen.call_args.args[0]
+        self.assertEqual(command[command.index("-ar") + 1], "24000")
+        self.assertIn("libopus", command)
+        self.assertEqual(command[-1], "out.opus")
+        process.stdin.write.assert_any_call(b"\x00\x01")
+        process.stdin.write.assert_any_call(b"\x02\x03")
+
+    @patch("youtube_to_docs.audio.subprocess.Popen")
+    def test_no_audio_starts_no_process(self, mock_popen):
+        self.assertEqual(encode_pcm_stream(iter([]), 24000, "out.m4a", "aac"), 0)
+        mock_popen.assert_not_called()
+
+    @patch("youtube_to_docs.audio.subprocess.Popen")
+    @patch("static_ffmpeg.add_paths")
+    def test_ffmpeg_failure_raises(self, mock_add_paths, mock_popen):
+        def _popen(command, stdin, stderr):
+            stderr.write(b"Unknown encoder")
+            return process
+
+        process = MagicMock()
+        process.communicate.return_value = (None, None)
+        process.returncode = 1
+        mock_popen.side_effect = _popen
+
+        with self.assertRaisesRegex(RuntimeError, "Unknown encoder"):
+            encode_pcm_stream(iter([b"\x00\x00"]), 24000, "out.mp3", "mp3")
+
+    @patch("youtube_to_docs.audio.subprocess.Popen")
+    @patch("static_ffmpeg.add_paths")
+    def test_stderr_is_not_a_pipe(self, mock_add_paths, mock_popen):
+        process = mock_popen.return_value
+        process.communicate.return_value = (None, None)
+        process.returncode = 0
+
+        encode_pcm_stream(iter([b"\x00\x00"]), 24000, "out.mp3", "mp3")
+
+        # An undrained stderr pipe can deadlock ffmpeg while stdin is written
+        self.assertNotEqual(mock_popen.call_args.kwargs["stderr"], subprocess.PIPE)
+
+
+if __name__ == "__main__":
+    unittest.main()
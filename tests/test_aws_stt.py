@@ -1,15 +1,20 @@
 import json
 import os
+import threading
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
-from youtube_to_docs import llms
+from youtube_to_docs import llms, stt
 
 
 class TestAWSSTT(unittest.TestCase):
     def setUp(self):
         self.env_patcher = patch.dict(os.environ, {"YTD_S3_BUCKET_NAME": "test-bucket"})
         self.env_patcher.start()
+        # Managers cache their boto3 clients; start each test with fresh mocks
+        stt._managers.clear()
+        stt._lifecycle_checked.clear()
 
     def tearDown(self):
         self.env_patcher.stop()
@@ -75,6 +80,322 @@ class TestAWSSTT(unittest.TestCase):
         self.assertIn("Hello world!", srt)
         self.assertIn("00:00:00,000 --> 00:00:01,000", srt)
 
+    @patch("boto3.client")
+    @patch("time.sleep", return_value=None)
+    def test_manager_polls_all_jobs_together(self, mock_sleep, mock_boto_client):
+        """Jobs submitted up front are polled together with adaptive backoff."""
+        mock_s3 = MagicMock()
+        mock_transcribe = MagicMock()
+        mock_boto_client.side_effect = lambda service_name, **kwargs: (
+            mock_s3 if service_name == "s3" else mock_transcribe
+        )
+
+        provider = llms.AWSProvider("aws-transcribe")
+        self.assertTrue(provider.supports_background_stt)
+        self.assertTrue(provider.submit_transcription("a.flac", "url1"))
+        self.assertTrue(provider.submit_transcription("b.flac", "url2"))
+        self.assertEqual(mock_transcribe.start_transcription_job.call_count, 2)
+        start_kwargs = mock_transcribe.start_transcription_job.call_args.kwargs
+        self.assertEqual(start_kwargs["MediaFormat"], "flac")
+
+        # Job 1 finishes on the third poll round, job 2 on the second
+        polls = {"count": 0}
+
+        def get_job(TranscriptionJobName):
+            polls["count"] += 1
+            round_num = (polls["count"] + 1) // 2
+            done = round_num >= (3 if TranscriptionJobName.endswith("1") else 2)
+            return {
+                "TranscriptionJob": {
+                    "TranscriptionJobStatus": "COMPLETED" if done else "IN_PROGRESS"
+                }
+            }
+
+        manager = stt.get_aws_transcribe_manager("test-bucket", "us-east-1")
+        self.assertEqual(len(manager.jobs), 2)
+        for key, name in zip(list(manager.jobs), ["job_1", "job_2"]):
+            manager.jobs[key].job_name = name
+
+        mock_transcribe.get_transcription_job.side_effect = get_job
+        mock_body = MagicMock()
+        mock_body.read.return_value = json.dumps(
+            {"results": {"transcripts": [{"transcript": "Hi"}], "items": []}}
+        ).encode("utf-8")
+        mock_s3.get_object.return_value = {"Body": mock_body}
+
+        transcript, _, _, _ = llms._transcribe_aws("aws-transcribe", "a.flac", "url1")
+        self.assertEqual(transcript, "Hi")
+        # Job 2 was collected while waiting for job 1, without a second wait
+        job_2 = manager.jobs[("url2", "en")]
+        self.assertIsNotNone(job_2.result)
+        # Back off between rounds: initial delay, then reset after job 2 finishes
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(delays, [stt.POLL_INITIAL_DELAY_SEC] * 2)
+
+        transcript, _, _, _ = llms._transcribe_aws("aws-transcribe", "b.flac", "url2")
+        self.assertEqual(transcript, "Hi")
+        self.assertFalse(manager.jobs)
+        # Only one pair of clients was created for all jobs
+        self.assertEqual(mock_boto_client.call_count, 2)
+
+    def _finished_job_manager(self, get_object):
+        """A manager with one completed job whose transcript is get_object."""
+        manager = stt.AWSTranscribeManager("test-bucket", "us-east-1")
+        manager.transcribe_client.get_transcription_job.return_value = {
+            "TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}
+        }
+        manager.s3_client.get_object.side_effect = get_object
+        manager.jobs[("url1", "en")] = stt.TranscribeJob("job_1", "m.flac", "o.json")
+        return manager
+
+    @staticmethod
+    def _transcript_object(text):
+        body = MagicMock()
+        body.read.return_value = json.dumps(
+            {"results": {"transcripts": [{"transcript": text}], "items": []}}
+        ).encode("utf-8")
+        return {"Body": body}
+
+    @patch("boto3.client")
+    def test_poll_downloads_outside_the_lock(self, mock_boto_client):
+        """Other threads can use the manager while a transcript downloads."""
+        blocked = []
+
+        def get_object(Bucket, Key):
+            other = threading.Thread(
+                target=lambda: (manager.pending_count(), manager.has_job(("x", "en")))
+            )
+            other.start()
+            other.join(timeout=2)
+            blocked.append(other.is_alive())
+            return self._transcript_object("Hi")
+
+        manager = self._finished_job_manager(get_object)
+
+        self.assertEqual(manager.poll(), 1)
+        self.assertEqual(blocked, [False])
+        self.assertEqual(manager.jobs[("url1", "en")].result, ("Hi", "", 0, 0))
+
+    @patch("boto3.client")
+    def test_concurrent_polls_collect_a_job_once(self, mock_boto_client):
+        downloading = threading.Event()
+        release = threading.Event()
+
+        def get_object(Bucket, Key):
+            downloading.set()
+            release.wait(timeout=2)
+            return self._transcript_object("Hi")
+
+        manager = self._finished_job_manager(get_object)
+        first = threading.Thread(target=manager.poll)
+        first.start()
+        self.assertTrue(downloading.wait(timeout=2))
+        # The job is claimed by the first poll, so this one skips it
+        self.assertEqual(manager.poll(), 0)
+        release.set()
+        first.join(timeout=2)
+
+        manager.s3_client.get_object.assert_called_once()
+        self.assertEqual(manager.jobs[("url1", "en")].result, ("Hi", "", 0, 0))
+
+    @patch("boto3.client")
+    @patch("time.sleep", return_value=None)
+    def test_transcribe_aws_journal(self, mock_sleep, mock_boto_client):
+        """Jobs are journaled on submit and forgotten once collected."""
+        mock_s3 = MagicMock()
+        mock_transcribe = MagicMock()
+        mock_boto_client.side_effect = lambda service_name, **kwargs: (
+            mock_s3 if service_name == "s3" else mock_transcribe
+        )
+        journal = stt.STTJournal()
+        key = stt.STTJournal.key("aws", "aws-transcribe", "http://url", "en")
+
+        mock_transcribe.get_transcription_job.return_value = {
+            "TranscriptionJob": {"TranscriptionJobStatus": "IN_PROGRESS"}
+        }
+        self.assertTrue(llms._submit_aws_transcription("audio.m4a", "http://url"))
+        entry = journal.get(key)
+        self.assertIsNotNone(entry)
+        assert entry is not None
+        self.assertTrue(entry["job_name"].startswith("ytd_transcribe_"))
+        self.assertTrue(entry["media_key"].endswith(".m4a"))
+
+        mock_transcribe.get_transcription_job.return_value = {
+            "TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}
+        }
+        mock_body = MagicMock()
+        mock_body.read.return_value = b'{"results": {"transcripts": []}}'
+        mock_s3.get_object.return_value = {"Body": mock_body}
+        llms._transcribe_aws("aws-transcribe", "audio.m4a", "http://url")
+
+        self.assertIsNone(journal.get(key))
+        mock_s3.delete_object.assert_any_call(
+            Bucket="test-bucket", Key=entry["media_key"]
+        )
+
+    @patch("boto3.client")
+    @patch("time.sleep", return_value=None)
+    def test_transcribe_aws_reattaches_from_journal(self, mock_sleep, mock_boto_client):
+        """A job journaled by an interrupted run is collected, not resubmitted."""
+        mock_s3 = MagicMock()
+        mock_transcribe = MagicMock()
+        mock_boto_client.side_effect = lambda service_name, **kwargs: (
+            mock_s3 if service_name == "s3" else mock_transcribe
+        )
+        key = stt.STTJournal.key("aws", "aws-transcribe", "http://url", "en")
+        stt.STTJournal().put(
+            key,
+            {
+                "provider": "aws",
+                "model": "aws-transcribe",
+                "url": "http://url",
+                "language": "en",
+                "bucket": "test-bucket",
+                "region": "us-east-1",
+                "job_name": "ytd_transcribe_old",
+                "media_key": "temp_audio/ytd_transcribe_old.m4a",
+                "output_key": "transcripts/ytd_transcribe_old.json",
+            },
+        )
+
+        self.assertEqual(stt.resume_stt_operations("aws-transcribe", ["http://url"]), 1)
+
+        mock_transcribe.get_transcription_job.return_value = {
+            "TranscriptionJob": {"TranscriptionJobStatus": "COMPLETED"}
+        }
+        mock_body = MagicMock()
+        mock_body.read.return_value = json.dumps(
+            {"results": {"transcripts": [{"transcript": "Resumed"}]}}
+        ).encode("utf-8")
+        mock_s3.get_object.return_value = {"Body": mock_body}
+
+        transcript, _, _, _ = llms._transcribe_aws(
+            "aws-transcribe", "audio.m4a", "http://url"
+        )
+
+        self.assertEqual(transcript, "Resumed")
+        mock_s3.upload_file.assert_not_called()
+        mock_transcribe.start_transcription_job.assert_not_called()
+        mock_s3.get_object.assert_called_once_with(
+            Bucket="test-bucket", Key="transcripts/ytd_transcribe_old.json"
+        )
+        self.assertIsNone(stt.STTJournal().get(key))
+
+    @patch.dict(os.environ, {"YTD_STT_STAGING_TTL_DAYS": "7"})
+    @patch("boto3.client")
+    def test_submit_reuses_staged_audio(self, mock_boto_client):
+        """Audio staged under its content hash is reused, not uploaded again."""
+        import tempfile
+
+        from youtube_to_docs.utils import file_sha256
+
+        mock_s3 = MagicMock()
+        mock_transcribe = MagicMock()
+        mock_boto_client.side_effect = lambda service_name, **kwargs: (
+            mock_s3 if service_name == "s3" else mock_transcribe
+        )
+        mock_s3.get_bucket_lifecycle_configuration.return_value = {
+            "Rules": [{"ID": "existing", "Status": "Enabled"}]
+        }
+        mock_s3.head_object.return_value = {
+            "LastModified": datetime.now(timezone.utc) - timedelta(days=2)
+        }
+
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            f.write(b"audio")
+            audio_path = f.name
+        self.addCleanup(os.remove, audio_path)
+
+        self.assertTrue(llms._submit_aws_transcription(audio_path, "http://url"))
+
+        media_key = f"temp_audio/ytd_{file_sha256(audio_path)}.flac"
+        mock_s3.head_object.assert_called_once_with(Bucket="test-bucket", Key=media_key)
+        mock_s3.upload_file.assert_not_called()
+        uri = mock_transcribe.start_transcription_job.call_args.kwargs["Media"]
+        self.assertEqual(uri["MediaFileUri"], f"s3://test-bucket/{media_key}")
+
+        # The staging rule is added next to the bucket's existing rules
+        rules = mock_s3.put_bucket_lifecycle_configuration.call_args.kwargs[
+            "LifecycleConfiguration"
+        ]["Rules"]
+        self.assertEqual([r["ID"] for r in rules][0], "existing")
+        self.assertEqual(rules[1]["Filter"], {"Prefix": "temp_audio/"})
+        self.assertEqual(rules[1]["Expiration"], {"Days": 7})
+
+    @patch.dict(os.environ, {"YTD_STT_STAGING_TTL_DAYS": "7"})
+    @patch("boto3.client")
+    def test_submit_reuploads_staged_audio_near_expiry(self, mock_boto_client):
+        """A staged object about to expire is uploaded again under its key."""
+        import tempfile
+
+        from youtube_to_docs.utils import file_sha256
+
+        mock_s3 = MagicMock()
+        mock_boto_client.side_effect = lambda service_name, **kwargs: (
+            mock_s3 if service_name == "s3" else MagicMock()
+        )
+        mock_s3.get_bucket_lifecycle_configuration.return_value = {"Rules": []}
+        mock_s3.head_object.return_value = {
+            "LastModified": datetime.now(timezone.utc) - timedelta(days=6, hours=12)
+        }
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            f.write(b"audio")
+            audio_path = f.name
+        self.addCleanup(os.remove, audio_path)
+
+        self.assertTrue(llms._submit_aws_transcription(audio_path, "http://url"))
+
+        media_key = f"temp_audio/ytd_{file_sha256(audio_path)}.flac"
+        self.assertEqual(mock_s3.upload_file.call_args.args[2], media_key)
+
+    @patch.dict(os.environ, {"YTD_STT_STAGING_TTL_DAYS": "7"})
+    @patch("boto3.client")
+    def test_submit_staging_without_lifecycle_permission(self, mock_boto_client):
+        """If no expiry rule can be set, staged audio gets a one-off key."""
+        import tempfile
+
+        mock_s3 = MagicMock()
+        mock_boto_client.side_effect = lambda service_name, **kwargs: (
+            mock_s3 if service_name == "s3" else MagicMock()
+        )
+        mock_s3.get_bucket_lifecycle_configuration.side_effect = Exception(
+            "AccessDenied"
+        )
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            f.write(b"audio")
+            audio_path = f.name
+        self.addCleanup(os.remove, audio_path)
+
+        self.assertTrue(llms._submit_aws_transcription(audio_path, "http://url"))
+
+        key = mock_s3.upload_file.call_args.args[2]
+        self.assertTrue(key.startswith("temp_audio/ytd_transcribe_"))
+        mock_s3.head_object.assert_not_called()
+        (manager,) = stt._managers.values()
+        self.assertFalse(any(job.keep_media for job in manager.jobs.values()))
+
+    @patch.dict(os.environ, {"YTD_STT_STAGING_TTL_DAYS": "0"})
+    @patch("boto3.client")
+    def test_submit_staging_opt_out(self, mock_boto_client):
+        """With a TTL of 0, each job uploads under its own key."""
+        import tempfile
+
+        mock_s3 = MagicMock()
+        mock_boto_client.side_effect = lambda service_name, **kwargs: (
+            mock_s3 if service_name == "s3" else MagicMock()
+        )
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            f.write(b"audio")
+            audio_path = f.name
+        self.addCleanup(os.remove, audio_path)
+
+        self.assertTrue(llms._submit_aws_transcription(audio_path, "http://url"))
+
+        key = mock_s3.upload_file.call_args.args[2]
+        self.assertTrue(key.startswith("temp_audio/ytd_transcribe_"))
+        mock_s3.head_object.assert_not_called()
+        mock_s3.put_bucket_lifecycle_configuration.assert_not_called()
+
     @patch("boto3.client")
     def test_transcribe_aws_no_bucket(self, mock_boto_client):
         """Test _transcribe_aws failure when bucket is missing."""
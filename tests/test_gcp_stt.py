@@ -1,6 +1,7 @@
 import os
 import sys
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 # Add project root to path
@@ -182,6 +183,272 @@ class TestGCPSTT(unittest.TestCase):
             # Verify NO download_as_text called
             mock_blob.download_as_text.assert_not_called()
 
+    @patch.dict(
+        os.environ,
+        {"GOOGLE_CLOUD_PROJECT": "test-project", "YTD_GCS_BUCKET_NAME": "test-bucket"},
+    )
+    def test_transcribe_gcp_reattaches_from_journal(self):
+        """A journaled operation is re-attached instead of re-uploading audio."""
+        from youtube_to_docs.stt import STTJournal
+
+        gcs_uri = "gs://test-bucket/temp/ytd_audio_old.flac"
+        journal = STTJournal()
+        key = STTJournal.key("gcp", "gcp-chirp3", "http://url", "en-US")
+        journal.put(
+            key,
+            {
+                "provider": "gcp",
+                "model": "gcp-chirp3",
+                "url": "http://url",
+                "language": "en-US",
+                "bucket": "test-bucket",
+                "inline": True,
+                "chunks": [
+                    {
+                        "uri": gcs_uri,
+                        "index": 0,
+                        "offset": 0.0,
+                        "blob": "temp/ytd_audio_old.flac",
+                    }
+                ],
+                "operations": [{"name": "operations/old", "uris": [gcs_uri]}],
+            },
+        )
+
+        mock_speech_module = MagicMock()
+        mock_storage_module = MagicMock()
+        mock_types_module = MagicMock()
+
+        with patch.dict(
+            sys.modules,
+            {
+                "google.cloud.speech_v2": mock_speech_module,
+                "google.cloud.storage": mock_storage_module,
+                "google.cloud.speech_v2.types": mock_types_module,
+            },
+        ):
+            from youtube_to_docs import llms
+
+            mock_client_instance = MagicMock()
+            mock_speech_module.SpeechClient.return_value = mock_client_instance
+            mock_client_instance.get_operation.return_value = MagicMock(done=True)
+            mock_client_instance.get_operation.return_value.HasField.return_value = (
+                False
+            )
+
+            mock_batch_result = MagicMock()
+            mock_batch_result.error = None
+            mock_alt = MagicMock(transcript="Resumed Transcript", words=[])
+            mock_batch_result.inline_result.transcript.results = [
+                MagicMock(alternatives=[mock_alt])
+            ]
+            deserialize = mock_types_module.cloud_speech.BatchRecognizeResponse
+            deserialize.deserialize.return_value.results = {gcs_uri: mock_batch_result}
+
+            mock_storage_client = MagicMock()
+            mock_storage_module.Client.return_value = mock_storage_client
+            mock_bucket = MagicMock()
+            mock_storage_client.bucket.return_value = mock_bucket
+
+            transcript, _, _, _ = llms._transcribe_gcp(
+                "gcp-chirp3", "audio.flac", "http://url", duration_seconds=100.0
+            )
+
+            self.assertEqual(transcript, "Resumed Transcript")
+            mock_client_instance.get_operation.assert_called_once_with(
+                request={"name": "operations/old"}
+            )
+            mock_client_instance.batch_recognize.assert_not_called()
+            mock_bucket.blob.return_value.upload_from_filename.assert_not_called()
+            mock_bucket.blob.assert_any_call("temp/ytd_audio_old.flac")
+            self.assertIsNone(journal.get(key))
+
+    @patch.dict(
+        os.environ,
+        {
+            "GOOGLE_CLOUD_PROJECT": "test-project",
+            "YTD_GCS_BUCKET_NAME": "test-bucket",
+            "YTD_STT_STAGING_TTL_DAYS": "7",
+        },
+    )
+    @patch("youtube_to_docs.llms.subprocess.run")
+    def test_transcribe_gcp_chunk_cache(self, mock_run):
+        """Only uncached chunks are transcribed; gaps are not cached."""
+        import tempfile
+
+        from youtube_to_docs.srt import Cues
+        from youtube_to_docs.stt import STTChunkCache
+        from youtube_to_docs.utils import file_sha256
+
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            f.write(b"long audio")
+            audio_path = f.name
+        self.addCleanup(os.remove, audio_path)
+
+        audio_hash = file_sha256(audio_path)
+        cache = STTChunkCache()
+        cache.put(
+            audio_hash,
+            "gcp-chirp3",
+            "en-US",
+            1,
+            1140,
+            "One.",
+            Cues([1141000], [1142000], ["One."]),
+        )
+
+        mock_speech_module = MagicMock()
+        mock_storage_module = MagicMock()
+        mock_types_module = MagicMock()
+
+        with patch.dict(
+            sys.modules,
+            {
+                "google.cloud.speech_v2": mock_speech_module,
+                "google.cloud.storage": mock_storage_module,
+                "google.cloud.speech_v2.types": mock_types_module,
+            },
+        ):
+            from youtube_to_docs import llms
+
+            mock_client_instance = MagicMock()
+            mock_speech_module.SpeechClient.return_value = mock_client_instance
+            mock_op = MagicMock()
+            mock_client_instance.batch_recognize.return_value = mock_op
+
+            chunk_0 = MagicMock()
+            chunk_0.error = None
+            chunk_0.inline_result.transcript.results = [
+                {
+                    "alternatives": [
+                        {
+                            "transcript": "Zero.",
+                            "words": [
+                                {
+                                    "word": "Zero.",
+                                    "startOffset": "1s",
+                                    "endOffset": "2s",
+                                }
+                            ],
+                        }
+                    ]
+                }
+            ]
+            chunk_2 = MagicMock()
+            chunk_2.error.code = 3
+            chunk_2.error.message = "boom"
+            staged = f"gs://test-bucket/temp/ytd_chunk_{audio_hash}"
+            mock_op.result.return_value.results = {
+                f"{staged}_000.flac": chunk_0,
+                f"{staged}_002.flac": chunk_2,
+            }
+
+            mock_storage_client = MagicMock()
+            mock_storage_module.Client.return_value = mock_storage_client
+            mock_bucket = mock_storage_client.bucket.return_value
+            mock_bucket.get_blob.return_value = None
+
+            transcript, srt, _, _ = llms._transcribe_gcp(
+                "gcp-chirp3", audio_path, "http://url", duration_seconds=3000.0
+            )
+
+        # Chunk 1 came from the cache, so only chunks 0 and 2 were cut
+        self.assertEqual(mock_run.call_count, 2)
+        self.assertEqual(transcript, "Zero. One.")
+        self.assertTrue(srt.startswith("1\n00:00:01,000 --> 00:00:02,000\nZero."))
+        self.assertIn("2\n00:19:01,000 --> 00:19:02,000\nOne.", srt)
+        self.assertIsNotNone(cache.get(audio_hash, "gcp-chirp3", "en-US", 0, 0))
+        self.assertIsNone(cache.get(audio_hash, "gcp-chirp3", "en-US", 2, 2280))
+        # Content-addressed chunks are kept for reuse instead of deleted
+        mock_bucket.blob.return_value.delete.assert_not_called()
+
+    def test_chunk_cache_stores_silent_chunks(self):
+        import tempfile
+
+        from youtube_to_docs.llms import _process_gcp_batch_result
+        from youtube_to_docs.srt import Cues
+        from youtube_to_docs.stt import STTChunkCache
+
+        # A silent chunk succeeds with nothing in it; a failed one is None
+        silent = MagicMock()
+        silent.error = None
+        silent.inline_result.transcript.results = []
+        self.assertEqual(
+            _process_gcp_batch_result(silent, MagicMock(), 0), ("", Cues())
+        )
+        failed = MagicMock()
+        failed.error.code = 3
+        self.assertIsNone(_process_gcp_batch_result(failed, MagicMock(), 0))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = STTChunkCache(cache_dir)
+            self.assertIsNone(cache.get("hash", "gcp-chirp3", "en-US", 0, 0))
+            cache.put("hash", "gcp-chirp3", "en-US", 0, 0, "", Cues())
+            self.assertEqual(
+                cache.get("hash", "gcp-chirp3", "en-US", 0, 0), ("", Cues())
+            )
+
+    @patch.dict(
+        os.environ,
+        {
+            "GOOGLE_CLOUD_PROJECT": "test-project",
+            "YTD_GCS_BUCKET_NAME": "test-bucket",
+            "YTD_STT_STAGING_TTL_DAYS": "7",
+        },
+    )
+    def test_transcribe_gcp_reuses_staged_audio(self):
+        """Audio already staged under its content hash is not uploaded again."""
+        import tempfile
+
+        from youtube_to_docs.utils import file_sha256
+
+        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
+            f.write(b"short audio")
+            audio_path = f.name
+        self.addCleanup(os.remove, audio_path)
+        gcs_uri = f"gs://test-bucket/temp/ytd_audio_{file_sha256(audio_path)}.flac"
+
+        mock_speech_module = MagicMock()
+        mock_storage_module = MagicMock()
+        mock_types_module = MagicMock()
+
+        with patch.dict(
+            sys.modules,
+            {
+                "google.cloud.speech_v2": mock_speech_module,
+                "google.cloud.storage": mock_storage_module,
+                "google.cloud.speech_v2.types": mock_types_module,
+            },
+        ):
+            from youtube_to_docs import llms
+
+            mock_client_instance = MagicMock()
+            mock_speech_module.SpeechClient.return_value = mock_client_instance
+            mock_result = MagicMock()
+            mock_result.error = None
+            mock_result.inline_result.transcript.results = [
+                {"alternatives": [{"transcript": "Staged"}]}
+            ]
+            mock_client_instance.batch_recognize.return_value.result.return_value = (
+                MagicMock(results={gcs_uri: mock_result})
+            )
+
+            mock_bucket = MagicMock()
+            mock_bucket.lifecycle_rules = []
+            mock_storage_module.Client.return_value.bucket.return_value = mock_bucket
+            mock_bucket.get_blob.return_value.time_created = datetime.now(timezone.utc)
+
+            transcript, _, _, _ = llms._transcribe_gcp(
+                "gcp-chirp3", audio_path, "http://url", duration_seconds=100.0
+            )
+
+        self.assertEqual(transcript, "Staged")
+        mock_bucket.blob.return_value.upload_from_filename.assert_not_called()
+        mock_bucket.blob.return_value.delete.assert_not_called()
+        mock_bucket.add_lifecycle_delete_rule.assert_called_once_with(
+            age=7, matches_prefix=["temp/"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
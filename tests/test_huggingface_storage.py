@@ -118,6 +118,31 @@ class TestHuggingFaceStorage(unittest.TestCase):
         url = "https://huggingface.co/datasets/tester/x/blob/main/dir/bar.png"
         self.assertEqual(self.storage.get_name(url), "bar.png")
 
+    def test_list_files_merges_repo_and_staged_files(self):
+        self.mock_api.list_repo_files.return_value = [
+            "audio-files/a.m4a",
+            "audio-files/nested/b.m4a",
+            "summary-files/c.md",
+        ]
+        self.storage.write_bytes("audio-files/d.m4a", b"d")
+
+        files = self.storage.list_files("audio-files")
+
+        self.assertEqual(sorted(files), ["a.m4a", "d.m4a"])
+        self.assertTrue(files["a.m4a"].endswith("/blob/main/audio-files/a.m4a"))
+
+    @patch("huggingface_hub.hf_hub_download")
+    def test_get_local_file_returns_hub_cache_path(self, mock_download):
+        self.mock_api.file_exists.return_value = True
+        mock_download.return_value = "/hf-cache/snapshots/abc/audio-files/a.m4a"
+
+        local_path = self.storage.get_local_file(
+            "audio-files/a.m4a", download_dir="/tmp/unused-download-dir"
+        )
+
+        self.assertEqual(local_path, "/hf-cache/snapshots/abc/audio-files/a.m4a")
+        mock_download.assert_called_once()
+
     def test_load_dataframe_missing_returns_none(self):
         self.mock_api.file_exists.return_value = False
         self.assertIsNone(self.storage.load_dataframe("youtube-docs.csv"))
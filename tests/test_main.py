@@ -598,6 +598,68 @@ class TestMain(unittest.TestCase):
         self.assertIn("Summary Text gemini-test from youtube (es)", df.columns)
         self.assertIn("Transcript File human generated (es)", df.columns)
 
+    @patch("youtube_to_docs.main.get_youtube_service")
+    @patch("youtube_to_docs.main.resolve_video_ids")
+    @patch("youtube_to_docs.main.get_video_details")
+    @patch("youtube_to_docs.main.fetch_transcript")
+    @patch("youtube_to_docs.main.get_model_pricing")
+    @patch("youtube_to_docs.main.generate_summary")
+    @patch("youtube_to_docs.main.generate_tags")
+    @patch("os.makedirs")
+    def test_several_translate_languages(
+        self,
+        mock_makedirs,
+        mock_gen_tags,
+        mock_gen_summary,
+        mock_get_pricing,
+        mock_fetch_trans,
+        mock_details,
+        mock_resolve,
+        mock_svc,
+    ):
+        mock_gen_tags.return_value = ("tag1, tag2", 10, 5)
+        mock_resolve.return_value = ["vid1"]
+        mock_details.return_value = (
+            "Title 1",
+            "Desc",
+            "2023-01-01",
+            "Chan",
+            "Tags",
+            "0:01:00",
+            "url1",
+            60.0,
+        )
+        mock_fetch_trans.return_value = ("Transcript", False, "")
+        mock_gen_summary.return_value = ("Summary", 100, 50)
+        mock_get_pricing.return_value = (0.0, 0.0)
+
+        with patch(
+            "sys.argv",
+            [
+                "main.py",
+                "vid1",
+                "-o",
+                self.outfile,
+                "-m",
+                "gemini-test",
+                "--translate",
+                "gemini-test-es,fr,korean",
+            ],
+        ):
+            with patch("builtins.open", mock_open()):
+                main.main()
+
+        df = pl.read_csv(self.outfile)
+        self.assertEqual(len(df), 1)
+        self.assertIn("Summary Text gemini-test from youtube", df.columns)
+        for lang in ("es", "fr", "ko"):
+            self.assertIn(f"Summary Text gemini-test from youtube ({lang})", df.columns)
+            self.assertIn(f"Transcript File human generated ({lang})", df.columns)
+        # English is processed before the translated languages
+        languages = [c.kwargs["language"] for c in mock_fetch_trans.call_args_list]
+        self.assertEqual(languages[0], "en")
+        self.assertCountEqual(languages[1:], ["es", "fr", "ko"])
+
     @patch("youtube_to_docs.main.get_youtube_service")
     @patch("youtube_to_docs.main.resolve_video_ids")
     @patch("youtube_to_docs.main.get_video_details")
@@ -1026,6 +1088,190 @@ class TestMain(unittest.TestCase):
         )
         self.assertTrue(any_results_header)
 
+    @patch("youtube_to_docs.main.prepare_stt_audio")
+    @patch("youtube_to_docs.main.extract_audio")
+    @patch("youtube_to_docs.main.get_provider")
+    def test_submit_background_stt(
+        self, mock_get_provider, mock_extract_audio, mock_prepare
+    ):
+        from youtube_to_docs.audio import AudioCache, PreparedAudio
+        from youtube_to_docs.providers import BaseProvider, STTProvider
+        from youtube_to_docs.storage import MemoryStorage
+
+        class MockBackgroundProvider(BaseProvider, STTProvider):
+            supports_background_stt = True
+
+            def transcribe(self, *args, **kwargs):
+                return "", "", 0, 0
+
+        provider = MockBackgroundProvider("aws-transcribe")
+        cast(Any, provider).submit_transcription = MagicMock(return_value=True)
+        mock_get_provider.return_value = provider
+        mock_extract_audio.return_value = self.dummy_audio
+        mock_prepare.return_value = PreparedAudio(path="vid.stt.flac")
+
+        storage = MemoryStorage()
+        storage.write_text("transcripts/done.txt", "already transcribed")
+        existing_df = pl.DataFrame(
+            [
+                {
+                    "URL": "https://www.youtube.com/watch?v=vid2",
+                    "Transcript File aws-transcribe generated": (
+                        "transcripts/done.txt"
+                    ),
+                }
+            ]
+        )
+
+        prefetched = main._submit_background_stt(
+            ["vid1", "vid2"],
+            "aws-transcribe",
+            ["en"],
+            None,
+            existing_df,
+            storage,
+            "transcripts",
+            self.test_dir,
+            AudioCache(max_bytes=0),
+        )
+
+        # vid2 already has a transcript, so only vid1 is submitted
+        self.assertEqual(list(prefetched), ["vid1"])
+        self.assertFalse(prefetched["vid1"][1] is None)
+        self.assertEqual(prefetched["vid1"][0], self.dummy_audio)
+        cast(Any, provider).submit_transcription.assert_called_once()
+        args = cast(Any, provider).submit_transcription.call_args
+        self.assertEqual(args.args[0], "vid.stt.flac")
+        self.assertEqual(args.args[1], "https://www.youtube.com/watch?v=vid1")
+
+    @patch.dict(os.environ, {"YTD_STT_SUBMIT_MAX_WORKERS": "2"})
+    @patch("youtube_to_docs.main.prepare_stt_audio")
+    @patch("youtube_to_docs.main.extract_audio")
+    @patch("youtube_to_docs.main.get_provider")
+    def test_submit_background_stt_releases_files_in_waves(
+        self, mock_get_provider, mock_extract_audio, mock_prepare
+    ):
+        from youtube_to_docs.audio import AudioCache, PreparedAudio
+        from youtube_to_docs.providers import BaseProvider, STTProvider
+        from youtube_to_docs.storage import MemoryStorage
+
+        on_disk: list[int] = []
+
+        def extract(video_id, output_dir, profile):
+            os.makedirs(output_dir, exist_ok=True)
+            path = os.path.join(output_dir, f"{video_id}.m4a")
+            with open(path, "wb") as f:
+                f.write(b"audio")
+            on_disk.append(
+                sum(name.endswith(".m4a") for name in os.listdir(output_dir))
+            )
+            return path
+
+        def prepare(audio_path, output_dir):
+            stt_path = os.path.splitext(audio_path)[0] + ".stt.flac"
+            with open(stt_path, "wb") as f:
+                f.write(b"stt")
+            return PreparedAudio(path=stt_path, duration_seconds=5.0)
+
+        class MockBackgroundProvider(BaseProvider, STTProvider):
+            supports_background_stt = True
+
+            def transcribe(self, *args, **kwargs):
+                return "", "", 0, 0
+
+        provider = MockBackgroundProvider("aws-transcribe")
+        cast(Any, provider).submit_transcription = MagicMock(return_value=True)
+        mock_get_provider.return_value = provider
+        mock_extract_audio.side_effect = extract
+        mock_prepare.side_effect = prepare
+        audio_dir = os.path.join(self.test_dir, "audio")
+        video_ids = [f"vid{i}" for i in range(6)]
+
+        prefetched = main._submit_background_stt(
+            video_ids,
+            "aws-transcribe",
+            ["en"],
+            None,
+            None,
+            MemoryStorage(),
+            "transcripts",
+            audio_dir,
+            AudioCache(max_bytes=0),
+        )
+
+        self.assertEqual(sorted(prefetched), video_ids)
+        self.assertEqual(provider.submit_transcription.call_count, 6)
+        # At most one wave of downloads was ever on disk
+        self.assertLessEqual(max(on_disk), 2)
+        # Submitted videos release both the download and the STT copy
+        self.assertEqual(os.listdir(audio_dir), [])
+        self.assertEqual(prefetched["vid0"][0], "")
+        self.assertEqual(prefetched["vid0"][1].duration_seconds, 5.0)
+
+    @patch("youtube_to_docs.main.get_provider")
+    def test_submit_background_stt_unsupported_provider(self, mock_get_provider):
+        from youtube_to_docs.providers import BaseProvider, STTProvider
+
+        class MockSTTProvider(BaseProvider, STTProvider):
+            def transcribe(self, *args, **kwargs):
+                return "", "", 0, 0
+
+        mock_get_provider.return_value = MockSTTProvider("gemini-test")
+        prefetched = main._submit_background_stt(
+            ["vid1"], "gemini-test", ["en"], None, None, MagicMock(), "t", "a"
+        )
+        self.assertEqual(prefetched, {})
+
+    @patch("youtube_to_docs.main.extract_audio")
+    def test_fetch_audio_uses_cache(self, mock_extract_audio):
+        from youtube_to_docs.audio import AudioCache
+
+        cache = AudioCache(os.path.join(self.test_dir, "cache"), max_bytes=1000)
+        mock_extract_audio.return_value = self.dummy_audio
+
+        first = main._fetch_audio("vid1", self.test_dir, cache)
+        second = main._fetch_audio("vid1", self.test_dir, cache)
+
+        self.assertEqual(first, cache.path("vid1", "archive"))
+        self.assertEqual(second, first)
+        self.assertTrue(os.path.exists(first))
+        self.assertFalse(os.path.exists(self.dummy_audio))
+        mock_extract_audio.assert_called_once_with(
+            "vid1", self.test_dir, profile="archive"
+        )
+
+    @patch.dict(os.environ, {"YTD_AUDIO_PROFILE": "stt"})
+    @patch("youtube_to_docs.main.extract_audio")
+    def test_fetch_audio_caches_stored_audio_by_source(self, mock_extract_audio):
+        from youtube_to_docs.audio import AudioCache
+
+        cache = AudioCache(os.path.join(self.test_dir, "cache"), max_bytes=1000)
+        storage = MagicMock()
+        storage.exists.return_value = True
+        storage.get_local_file.return_value = self.dummy_audio
+
+        first = main._fetch_audio(
+            "vid1", self.test_dir, cache, storage=storage, stored_path="a/vid1.m4a"
+        )
+        # A later run finds it without downloading or fetching it again
+        second = main._fetch_audio("vid1", self.test_dir, cache)
+
+        self.assertEqual(first, cache.path("vid1", "stored"))
+        self.assertEqual(second, first)
+        self.assertIsNone(cache.get("vid1", "stt"))
+        mock_extract_audio.assert_not_called()
+
+    def test_cleanup_video_temp_files(self):
+        for name in ("vid1.m4a", "vid1.stt.flac", "vid2.m4a"):
+            with open(os.path.join(self.test_dir, name), "wb") as f:
+                f.write(b"x")
+
+        main._cleanup_video_temp_files(self.test_dir, "vid1")
+
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "vid1.m4a")))
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "vid1.stt.flac")))
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "vid2.m4a")))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -99,6 +99,18 @@ class TestMemoryStorage(unittest.TestCase):
     def test_get_name_returns_basename(self):
         self.assertEqual(self.storage.get_name("dir/sub/file.md"), "file.md")
 
+    # -- list_files --
+
+    def test_list_files_returns_direct_children(self):
+        self.storage.write_bytes("audio-files/a.m4a", b"a")
+        self.storage.write_text("audio-files/b.txt", "b")
+        self.storage.write_bytes("audio-files/nested/c.m4a", b"c")
+        self.storage.write_bytes("other/d.m4a", b"d")
+        self.assertEqual(
+            self.storage.list_files("./audio-files"),
+            {"a.m4a": "audio-files/a.m4a", "b.txt": "audio-files/b.txt"},
+        )
+
     # -- get_local_file --
 
     def test_get_local_file_returns_none_for_missing(self):
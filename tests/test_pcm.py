@@ -0,0 +1,106 @@
+import unittest
+from array import array
+from unittest.mock import patch
+
+import numpy as np
+
+from youtube_to_docs import pcm
+
+
+def tone(seconds: float, rate: int, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * rate)) / rate
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def silence(seconds: float, rate: int) -> np.ndarray:
+    return np.zeros(int(seconds * rate), dtype=np.float32)
+
+
+class TestCrossfadePcm(unittest.TestCase):
+    def test_blends_seams(self):
+        first = array("h", [1000] * 8).tobytes()
+        second = array("h", [-1000] * 8).tobytes()
+
+        # 2 ms at 1 kHz is a 2-sample overlap
+        joined = array("h", b"".join(pcm.crossfade_pcm([first, second], 1000, 2)))
+
+        self.assertEqual(len(joined), 14)
+        self.assertEqual(joined[:6].tolist(), [1000] * 6)
+        self.assertEqual(joined[6:8].tolist(), [333, -333])
+        self.assertEqual(joined[8:].tolist(), [-1000] * 6)
+
+
+class TestPcmStages(unittest.TestCase):
+    def test_pcm_round_trip(self):
+        raw = array("h", [0, 1, -1, 32767, -32768]).tobytes()
+        self.assertEqual(pcm.to_pcm(pcm.to_samples(raw)), raw)
+
+    def test_resample_changes_length(self):
+        samples = tone(1.0, 16000)
+        self.assertEqual(len(pcm.resample(samples, 16000, 24000)), 24000)
+        self.assertIs(pcm.resample(samples, 16000, 16000), samples)
+
+    def test_cap_silences(self):
+        rate = 24000
+        samples = np.concatenate(
+            [
+                silence(1.0, rate),
+                tone(0.5, rate),
+                silence(2.0, rate),
+                tone(0.5, rate),
+                silence(1.0, rate),
+            ]
+        )
+
+        capped = pcm.cap_silences(samples, rate)
+
+        # 0.1 s kept at each edge and the 2 s pause capped to 0.6 s
+        self.assertAlmostEqual(len(capped) / rate, 1.8, places=2)
+
+    def test_short_pauses_are_kept(self):
+        rate = 24000
+        samples = np.concatenate([tone(0.5, rate), silence(0.3, rate), tone(0.5, rate)])
+        self.assertIs(pcm.cap_silences(samples, rate), samples)
+
+    def test_normalize_loudness(self):
+        rate = 24000
+        quiet = pcm.normalize_loudness(tone(1.0, rate, 0.02), rate)
+        loud = pcm.normalize_loudness(tone(1.0, rate, 0.8), rate)
+
+        for samples in (quiet, loud):
+            rms = float(np.sqrt(np.mean(samples**2)))
+            self.assertAlmostEqual(rms, pcm.TARGET_RMS, places=3)
+            self.assertLessEqual(float(np.max(np.abs(samples))), pcm.PEAK_LIMIT)
+
+
+class TestPostprocessSpeech(unittest.TestCase):
+    def test_resamples_and_joins_chunks(self):
+        chunks = [
+            pcm.to_pcm(np.concatenate([tone(0.5, 16000), silence(1.0, 16000)])),
+            pcm.to_pcm(tone(0.5, 16000)),
+        ]
+
+        stream, rate = pcm.postprocess_speech(iter(chunks), 16000)
+        audio = pcm.to_samples(b"".join(stream))
+
+        self.assertEqual(rate, 24000)
+        # Trailing silence trimmed to 0.1 s, seam overlapped by 20 ms
+        self.assertAlmostEqual(len(audio) / rate, 1.08, places=2)
+
+    def test_disabled_by_sample_rate_zero(self):
+        chunks = [array("h", [1, 2]).tobytes()]
+        with patch.dict("os.environ", {"YTD_TTS_SAMPLE_RATE": "0"}):
+            stream, rate = pcm.postprocess_speech(iter(chunks), 16000)
+        self.assertEqual(rate, 16000)
+        self.assertEqual(b"".join(stream), chunks[0])
+
+    def test_without_numpy_only_crossfades(self):
+        chunks = [array("h", [1, 2]).tobytes()]
+        with patch.object(pcm, "np", None):
+            stream, rate = pcm.postprocess_speech(iter(chunks), 16000)
+        self.assertEqual(rate, 16000)
+        self.assertEqual(b"".join(stream), chunks[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
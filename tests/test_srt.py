@@ -0,0 +1,114 @@
+import unittest
+
+from youtube_to_docs.srt import Cues, cues_from_words, format_timestamp, to_ms
+
+SAMPLE_SRT = """1
+00:00:01,000 --> 00:00:02,500
+Hello <i>there</i>
+second line
+
+2
+00:00:03,000 --> 00:00:04,000
+General Kenobi.
+"""
+
+
+class TestCues(unittest.TestCase):
+    def test_format_timestamp(self):
+        self.assertEqual(format_timestamp(0), "00:00:00,000")
+        self.assertEqual(format_timestamp(3_723_004), "01:02:03,004")
+        self.assertEqual(format_timestamp(to_ms(1.001)), "00:00:01,001")
+
+    def test_parse(self):
+        cues = Cues.parse(SAMPLE_SRT)
+        self.assertEqual(list(cues.start_ms), [1000, 3000])
+        self.assertEqual(list(cues.end_ms), [2500, 4000])
+        self.assertEqual(
+            cues.text, ["Hello <i>there</i>\nsecond line", "General Kenobi."]
+        )
+
+    def test_parse_crlf_and_dot_millis(self):
+        cues = Cues.parse("1\r\n00:00:01.5 --> 00:00:02.250\r\nHi\r\n")
+        self.assertEqual(list(cues), [(1500, 2250, "Hi")])
+
+    def test_parse_empty_cue_does_not_swallow_next(self):
+        srt = (
+            "1\n00:00:01,000 --> 00:00:02,000\n\n2\n00:00:03,000 --> 00:00:04,000\nB\n"
+        )
+        self.assertEqual(Cues.parse(srt).text, ["", "B"])
+
+    def test_parse_missing_blank_separator(self):
+        srt = (
+            "1\n00:00:01,000 --> 00:00:02,000\nA\n"
+            "2\n00:00:03,000 --> 00:00:04,000\nB\n"
+            "00:00:05,000 --> 00:00:06,000\nC\n"
+        )
+        cues = Cues.parse(srt)
+        self.assertEqual(cues.text, ["A", "B", "C"])
+        self.assertEqual(list(cues.start_ms), [1000, 3000, 5000])
+
+    def test_parse_hourless_timings(self):
+        cues = Cues.parse("1\n00:01,000 --> 01:02,500\nHi\n")
+        self.assertEqual(list(cues), [(1000, 62500, "Hi")])
+
+    def test_parse_strips_code_fences(self):
+        srt = "```srt\n1\n00:00:01,000 --> 00:00:02,000\nHi\n```\n"
+        self.assertEqual(Cues.parse(srt).to_text(), "Hi")
+
+    def test_round_trip(self):
+        cues = Cues.parse(SAMPLE_SRT)
+        self.assertEqual(cues.to_srt(), SAMPLE_SRT)
+        self.assertEqual(Cues.parse(cues.to_srt()), cues)
+
+    def test_to_srt_start_index(self):
+        srt = Cues([0], [1000], ["A"]).to_srt(start_index=5)
+        self.assertEqual(srt, "5\n00:00:00,000 --> 00:00:01,000\nA\n")
+
+    def test_to_text_strips_tags(self):
+        self.assertEqual(
+            Cues.parse(SAMPLE_SRT).to_text(), "Hello there second line General Kenobi."
+        )
+
+    def test_shift_and_merge(self):
+        first = Cues([0], [1000], ["A"])
+        second = Cues([0], [500], ["B"]).shift(60_000)
+        merged = Cues.merge([first, second])
+        self.assertEqual(list(merged), [(0, 1000, "A"), (60_000, 60_500, "B")])
+        self.assertEqual(
+            merged.to_srt(),
+            "1\n00:00:00,000 --> 00:00:01,000\nA\n\n"
+            "2\n00:01:00,000 --> 00:01:00,500\nB\n",
+        )
+
+    def test_map_times(self):
+        cues = Cues([1000], [2000], ["A"]).map_times(lambda ms: ms * 2)
+        self.assertEqual(list(cues), [(2000, 4000, "A")])
+
+    def test_mismatched_arrays(self):
+        with self.assertRaises(ValueError):
+            Cues([0], [], ["A"])
+
+
+class TestCueBuilder(unittest.TestCase):
+    def test_breaks_on_sentence_end(self):
+        cues = cues_from_words(
+            [
+                ("Hi.", 0.0, 0.5),
+                ("How", 0.6, 0.8),
+                ("are", 0.8, 1.0),
+                ("you?", 1.0, 1.2),
+            ]
+        )
+        self.assertEqual(list(cues), [(0, 500, "Hi."), (600, 1200, "How are you?")])
+
+    def test_breaks_on_length(self):
+        words = [("word", float(i), i + 0.5) for i in range(20)]
+        cues = cues_from_words(words, max_chars=20, break_on_sentence_end=False)
+        # Each word counts its trailing space: the fifth word passes 20 chars
+        self.assertEqual(len(cues), 4)
+        self.assertEqual(cues.text[0], "word word word word word")
+        self.assertEqual(cues.end_ms[0], 4500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
+import os
+import tempfile
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
 from youtube_to_docs.storage import GoogleDriveStorage
+from youtube_to_docs.utils import thread_map
 
 
 class TestGoogleDriveStorage(unittest.TestCase):
@@ -43,6 +47,65 @@ class TestGoogleDriveStorage(unittest.TestCase):
         # Assert service create call
         self.mock_service.files().create.assert_called_once()
 
+    def test_list_files_pages_and_primes_cache(self):
+        files_api = self.mock_service.files.return_value
+        files_api.list.return_value.execute.side_effect = [
+            {
+                "files": [{"id": "1", "name": "a.m4a", "webViewLink": "link-a"}],
+                "nextPageToken": "next",
+            },
+            {"files": [{"id": "2", "name": "b.m4a", "webViewLink": "link-b"}]},
+        ]
+
+        with patch.object(self.storage, "_get_parent_id", return_value="parent_id"):
+            files = self.storage.list_files("audio-files")
+
+        self.assertEqual(files, {"a.m4a": "link-a", "b.m4a": "link-b"})
+        self.assertEqual(files_api.list.call_args.kwargs["pageToken"], "next")
+        self.assertEqual(self.storage.get_full_path("audio-files/b.m4a"), "link-b")
+
+    @patch("youtube_to_docs.storage.MediaIoBaseDownload")
+    def test_get_local_file_streams_link_to_disk(self, mock_download):
+        def downloader(fh, request):
+            fh.write(b"audio data")
+            instance = MagicMock()
+            instance.next_chunk.return_value = (None, True)
+            return instance
+
+        mock_download.side_effect = downloader
+        link = "https://drive.google.com/file/d/abc123/view?usp=drivesdk"
+        with (
+            tempfile.TemporaryDirectory() as download_dir,
+            patch.object(self.storage, "exists", return_value=True),
+            patch.object(self.storage, "get_name", return_value="summary.m4a"),
+            patch.object(self.storage, "read_bytes") as mock_read_bytes,
+        ):
+            local_path = self.storage.get_local_file(link, download_dir=download_dir)
+
+            self.assertEqual(local_path, os.path.join(download_dir, "summary.m4a"))
+            with open(local_path, "rb") as f:
+                self.assertEqual(f.read(), b"audio data")
+        mock_read_bytes.assert_not_called()
+        self.mock_service.files().get_media.assert_called_with(fileId="abc123")
+
+    def test_calls_are_serialized_across_threads(self):
+        """The shared Drive client is never used by two threads at once."""
+        active = []
+        overlaps = []
+
+        def get_file_id(path):
+            active.append(path)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.remove(path)
+            return "id"
+
+        with patch.object(self.storage, "_get_file_id", side_effect=get_file_id):
+            results = thread_map(self.storage.exists, [f"f{i}" for i in range(8)], 8)
+
+        self.assertEqual(results, [True] * 8)
+        self.assertEqual(max(overlaps), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -126,6 +126,32 @@ class TestTranscript(unittest.TestCase):
         ids = transcript.resolve_video_ids("@channel", mock_service)
         self.assertEqual(ids, ["vid_from_channel"])
 
+    def _extract_audio_opts(self, **kwargs):
+        with (
+            patch("static_ffmpeg.add_paths"),
+            patch("yt_dlp.YoutubeDL") as mock_ydl_cls,
+        ):
+            mock_ydl = mock_ydl_cls.return_value.__enter__.return_value
+            mock_ydl.extract_info.return_value = None
+            transcript.extract_audio("vid1", "out", **kwargs)
+            return mock_ydl_cls.call_args.args[0]
+
+    def test_extract_audio_archive_profile(self):
+        opts = self._extract_audio_opts()
+        self.assertEqual(opts["format"], "bestaudio[ext=m4a]/bestaudio")
+        self.assertEqual(opts["postprocessors"][0]["preferredquality"], "192")
+        self.assertEqual(opts["concurrent_fragment_downloads"], 4)
+
+    def test_extract_audio_stt_profile(self):
+        with patch.dict(os.environ, {"YTD_YTDLP_CONCURRENT_FRAGMENTS": "8"}):
+            opts = self._extract_audio_opts(profile="stt")
+        self.assertTrue(opts["format"].startswith("worstaudio[ext=m4a][abr>=?48]"))
+        postprocessor = opts["postprocessors"][0]
+        self.assertEqual(postprocessor["key"], "FFmpegExtractAudio")
+        self.assertEqual(postprocessor["preferredcodec"], "m4a")
+        self.assertEqual(postprocessor["preferredquality"], "64")
+        self.assertEqual(opts["concurrent_fragment_downloads"], 8)
+
     def test_get_video_details_none(self):
         details = transcript.get_video_details("vid1", None)
         self.assertEqual(
@@ -1,16 +1,28 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from youtube_to_docs import translate as translate_mod
 from youtube_to_docs.providers import BaseProvider, LLMProvider, TranslationProvider
 from youtube_to_docs.translate import (
     _translate_aws,
+    _translate_aws_batch,
     _translate_gcp,
+    _translate_gcp_batch,
+    _translate_gcp_documents,
     parse_suggest_captions_arg,
     parse_translate_arg,
+    parse_translate_languages,
     process_translate,
+    translate_documents,
+    translate_srt,
     translate_text,
 )
 
+EN_SRT = (
+    "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n"
+    "2\n00:00:03,000 --> 00:00:04,500\nGood morning\n"
+)
+
 
 class TestParseTranslateArg(unittest.TestCase):
     def test_simple_model_and_lang(self):
@@ -102,7 +114,34 @@ class TestParseTranslateArg(unittest.TestCase):
             parse_translate_arg("")
 
 
+class TestParseTranslateLanguages(unittest.TestCase):
+    def test_single_language(self):
+        self.assertEqual(
+            parse_translate_languages("gemini-3.5-flash-lite-es"),
+            ("gemini-3.5-flash-lite", ["es"]),
+        )
+
+    def test_bare_languages_after_first(self):
+        self.assertEqual(
+            parse_translate_languages("aws-translate-es, fr,korean,es"),
+            ("aws-translate", ["es", "fr", "ko"]),
+        )
+
+    def test_full_items_with_same_model(self):
+        self.assertEqual(
+            parse_translate_languages("gcp-translate-es,gcp-translate-french"),
+            ("gcp-translate", ["es", "fr"]),
+        )
+
+    def test_mixed_models_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_translate_languages("gcp-translate-es,aws-translate-fr")
+
+
 class TestTranslateAws(unittest.TestCase):
+    def setUp(self):
+        translate_mod._clients.clear()
+
     @patch("youtube_to_docs.translate.boto3")
     def test_calls_aws_translate(self, mock_boto3):
         mock_client = MagicMock()
@@ -134,8 +173,23 @@ class TestTranslateAws(unittest.TestCase):
 
         mock_boto3.client.assert_called_once_with("translate", region_name="eu-west-1")
 
+    @patch("youtube_to_docs.translate.boto3")
+    def test_reuses_client(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.translate_text.return_value = {"TranslatedText": "Hola"}
+
+        _translate_aws("Hello", "es")
+        _translate_aws("Hello", "es")
+
+        mock_boto3.client.assert_called_once_with("translate", region_name="us-east-1")
+        self.assertEqual(mock_client.translate_text.call_count, 2)
+
 
 class TestTranslateGcp(unittest.TestCase):
+    def setUp(self):
+        translate_mod._clients.clear()
+
     @patch("youtube_to_docs.translate.google_translate")
     def test_calls_gcp_translate(self, mock_google_translate):
         mock_client = MagicMock()
@@ -159,16 +213,14 @@ class TestTranslateGcp(unittest.TestCase):
     def test_joins_translated_chunks(self, mock_google_translate):
         mock_client = MagicMock()
         mock_google_translate.Client.return_value = mock_client
-        # Return different text per call to verify chunk joining
-        mock_client.translate.side_effect = [
-            {"translatedText": "Hola"},
-            {"translatedText": ""},
-            {"translatedText": " mundo"},
-        ]
+        # Return different text per chunk to verify chunk joining (chunks are
+        # translated concurrently, so the calls may arrive in any order)
+        chunk_translations = {"Hello": "Hola", "\n": "", "world": " mundo"}
+        mock_client.translate.side_effect = lambda chunk, **kwargs: {
+            "translatedText": chunk_translations[chunk]
+        }
 
         # Force two chunks by using a tiny max_bytes
-        from youtube_to_docs import translate as translate_mod
-
         original_limit = translate_mod._GCP_TRANSLATE_CHAR_LIMIT
         translate_mod._GCP_TRANSLATE_CHAR_LIMIT = 5
         try:
@@ -178,6 +230,29 @@ class TestTranslateGcp(unittest.TestCase):
 
         self.assertEqual(result, "Hola mundo")
 
+    @patch("youtube_to_docs.translate.google_translate")
+    def test_reuses_client_and_keeps_chunk_order(self, mock_google_translate):
+        import time
+
+        mock_client = MagicMock()
+        mock_google_translate.Client.return_value = mock_client
+
+        def _translate(chunk, **kwargs):
+            # Later chunks finish first
+            time.sleep(0.01 * (5 - int(chunk.strip())))
+            return {"translatedText": f"<{chunk.strip()}>"}
+
+        mock_client.translate.side_effect = _translate
+        text = "".join(f"{i}\n" for i in range(5))
+
+        with patch.object(translate_mod, "_GCP_TRANSLATE_CHAR_LIMIT", 2):
+            first, _, _ = _translate_gcp(text, "es")
+            second, _, _ = _translate_gcp(text, "fr")
+
+        self.assertEqual(first, "<0><1><2><3><4>")
+        self.assertEqual(second, first)
+        mock_google_translate.Client.assert_called_once_with()
+
     @patch("youtube_to_docs.translate.google_translate", None)
     def test_returns_error_when_library_missing(self):
         result, in_tok, out_tok = _translate_gcp("Hello", "es")
@@ -289,6 +364,105 @@ class TestTranslateText(unittest.TestCase):
 
         provider_instance.generate_content.assert_not_called()
 
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_uses_translation_memory(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockTranslationProvider("aws-translate")
+        provider_instance.translate = MagicMock(
+            side_effect=["Error: throttled", "Hola", "Adiós"]
+        )
+        mock_get_provider.return_value = provider_instance
+
+        self.assertEqual(
+            translate_text("aws-translate", "Hello", "es"), ("Error: throttled", 0, 0)
+        )
+        self.assertEqual(translate_text("aws-translate", "Hello", "es"), ("Hola", 0, 0))
+        self.assertEqual(translate_text("aws-translate", "Hello", "es"), ("Hola", 0, 0))
+        self.assertEqual(provider_instance.translate.call_count, 2)
+
+
+class TestTranslateLongText(unittest.TestCase):
+    def _provider(self, generate):
+        from typing import Any
+
+        provider_instance: Any = MockLLMProvider("gemini-3.5-flash-lite")
+        provider_instance.generate_content = MagicMock(side_effect=generate)
+        return provider_instance
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_chunks_translated_in_order(self, mock_get_provider):
+        import time
+
+        def _generate(prompt):
+            paragraph = prompt.rsplit("\n\n", 1)[1]
+            # Later chunks finish first
+            time.sleep(0.01 * (5 - int(paragraph[1])))
+            return paragraph.upper(), 2, 3
+
+        provider_instance = self._provider(_generate)
+        mock_get_provider.return_value = provider_instance
+        text = "".join(f"p{i} words\n" for i in range(5))
+
+        with patch.object(translate_mod, "_LLM_TRANSLATE_CHUNK_BYTES", 10):
+            result, in_tok, out_tok = translate_text(
+                "gemini-3.5-flash-lite", text, "es"
+            )
+
+        self.assertEqual(result, "".join(f"P{i} WORDS\n" for i in range(5)))
+        self.assertEqual((in_tok, out_tok), (10, 15))
+        self.assertEqual(provider_instance.generate_content.call_count, 5)
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_truncated_chunk_is_retried(self, mock_get_provider):
+        provider_instance = self._provider(
+            [("Uno dos", 1, 1), ("T", 1, 1), ("Tres cuatro", 1, 1)]
+        )
+        mock_get_provider.return_value = provider_instance
+
+        with (
+            patch.object(translate_mod, "_LLM_TRANSLATE_CHUNK_BYTES", 10),
+            patch.dict("os.environ", {"YTD_LLM_MAX_CONCURRENCY": "1"}),
+        ):
+            result, _, _ = translate_text(
+                "gemini-3.5-flash-lite", "One two\nThree four", "es"
+            )
+
+        self.assertEqual(result, "Uno dos\nTres cuatro")
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_incomplete_translation_is_an_error(self, mock_get_provider):
+        provider_instance = self._provider(
+            [("Uno dos", 1, 1), ("", 1, 1), ("Error: quota", 0, 0)]
+        )
+        mock_get_provider.return_value = provider_instance
+
+        with (
+            patch.object(translate_mod, "_LLM_TRANSLATE_CHUNK_BYTES", 10),
+            patch.dict("os.environ", {"YTD_LLM_MAX_CONCURRENCY": "1"}),
+        ):
+            result, _, _ = translate_text(
+                "gemini-3.5-flash-lite", "One two\nThree four", "es"
+            )
+
+        self.assertTrue(result.startswith("Error:"))
+        self.assertIn("chunks 2 of 2", result)
+
+    def test_rate_limiter_is_shared_per_model(self):
+        from youtube_to_docs import providers
+
+        providers._rate_limiters.clear()
+        with patch.dict("os.environ", {"YTD_LLM_MAX_CONCURRENCY": "2"}):
+            limiter = providers.get_rate_limiter("gemini-test")
+        self.assertIs(providers.get_rate_limiter("gemini-test"), limiter)
+        self.assertIsNot(providers.get_rate_limiter("other-model"), limiter)
+        self.assertTrue(limiter.acquire(blocking=False))
+        self.assertTrue(limiter.acquire(blocking=False))
+        self.assertFalse(limiter.acquire(blocking=False))
+        limiter.release()
+        limiter.release()
+        providers._rate_limiters.clear()
+
 
 class TestProcessTranslate(unittest.TestCase):
     def _make_storage(self):
@@ -296,6 +470,10 @@ class TestProcessTranslate(unittest.TestCase):
         storage.write_text.side_effect = lambda path, text: path
         return storage
 
+    @staticmethod
+    def _translate_documents(model, texts, lang):
+        return ["traducido"] * len(texts), 10, 5
+
     def _base_row(self, model="gemini-3.5-flash-lite", transcript_arg="youtube"):
         return {
             f"Summary Text {model} from {transcript_arg}": "English summary",
@@ -304,9 +482,9 @@ class TestProcessTranslate(unittest.TestCase):
             f"Tags {transcript_arg} {model} model": "tag1, tag2",
         }
 
-    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
     def test_translates_all_columns(self, mock_translate):
-        mock_translate.return_value = ("traducido", 10, 5)
+        mock_translate.side_effect = self._translate_documents
         model = "gemini-3.5-flash-lite"
         transcript_arg = "youtube"
         row = self._base_row(model, transcript_arg)
@@ -340,9 +518,9 @@ class TestProcessTranslate(unittest.TestCase):
             result[f"Tags {transcript_arg} {model} model (es)"], "traducido"
         )
 
-    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
     def test_skips_already_translated_columns(self, mock_translate):
-        mock_translate.return_value = ("traducido", 10, 5)
+        mock_translate.side_effect = self._translate_documents
         model = "gemini-3.5-flash-lite"
         transcript_arg = "youtube"
         row = self._base_row(model, transcript_arg)
@@ -370,9 +548,9 @@ class TestProcessTranslate(unittest.TestCase):
             "already translated",
         )
 
-    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
     def test_skips_missing_english_columns(self, mock_translate):
-        mock_translate.return_value = ("traducido", 10, 5)
+        mock_translate.side_effect = self._translate_documents
         model = "gemini-3.5-flash-lite"
         transcript_arg = "youtube"
         # Row has no English content at all
@@ -397,9 +575,9 @@ class TestProcessTranslate(unittest.TestCase):
         self.assertNotIn(f"Summary Text {model} from {transcript_arg} (es)", result)
         mock_translate.assert_not_called()
 
-    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
     def test_translates_secondary_youtube_columns(self, mock_translate):
-        mock_translate.return_value = ("traducido", 10, 5)
+        mock_translate.side_effect = self._translate_documents
         model = "gemini-3.5-flash-lite"
         transcript_arg = "gemini-3.5-flash-lite"
         row = self._base_row(model, transcript_arg)
@@ -427,9 +605,9 @@ class TestProcessTranslate(unittest.TestCase):
         self.assertIn(f"One Sentence Summary {model} from youtube (fr)", result)
         self.assertIn(f"QA Text {model} from youtube (fr)", result)
 
-    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
     def test_saves_translated_files(self, mock_translate):
-        mock_translate.return_value = ("traducido", 10, 5)
+        mock_translate.side_effect = self._translate_documents
         model = "gemini-3.5-flash-lite"
         transcript_arg = "youtube"
         row = self._base_row(model, transcript_arg)
@@ -450,12 +628,14 @@ class TestProcessTranslate(unittest.TestCase):
             storage=storage,
         )
 
-        # translate_text should have been called for each translatable column
-        self.assertEqual(mock_translate.call_count, 4)
+        # One batched call translates every translatable column
+        mock_translate.assert_called_once()
+        self.assertEqual(len(mock_translate.call_args.args[1]), 4)
+        self.assertEqual(storage.write_text.call_count, 4)
 
-    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
     def test_multiple_models(self, mock_translate):
-        mock_translate.return_value = ("traducido", 10, 5)
+        mock_translate.side_effect = self._translate_documents
         model_a = "gemini-3.5-flash-lite"
         model_b = "bedrock-nova-2-lite-v1"
         transcript_arg = "youtube"
@@ -483,9 +663,9 @@ class TestProcessTranslate(unittest.TestCase):
             self.assertIn(f"Summary Text {model} from {transcript_arg} (de)", result)
             self.assertIn(f"QA Text {model} from {transcript_arg} (de)", result)
 
-    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
     def test_file_col_stored_in_row(self, mock_translate):
-        mock_translate.return_value = ("traducido", 10, 5)
+        mock_translate.side_effect = self._translate_documents
         model = "gemini-3.5-flash-lite"
         transcript_arg = "youtube"
         row = self._base_row(model, transcript_arg)
@@ -511,6 +691,151 @@ class TestProcessTranslate(unittest.TestCase):
         self.assertIn(f"QA File {model} from {transcript_arg} (es)", result)
         self.assertIn(f"Tags File {transcript_arg} {model} model (es)", result)
 
+    @patch("youtube_to_docs.translate.translate_text")
+    @patch("youtube_to_docs.translate.translate_documents")
+    def test_batched_translates_fields_together(self, mock_docs, mock_translate):
+        mock_docs.side_effect = lambda model, texts, lang: (
+            [f"{text} (es)" for text in texts],
+            10,
+            5,
+        )
+        model = "gemini-3.5-flash-lite"
+        transcript_arg = "youtube"
+        row = self._base_row(model, transcript_arg)
+        row[f"QA Text {model} from {transcript_arg} (es)"] = "already translated"
+        storage = self._make_storage()
+
+        result = process_translate(
+            row=row,
+            translate_model=model,
+            translate_lang="es",
+            transcript_arg=transcript_arg,
+            model_names=[model],
+            summaries_dir="summary-files",
+            one_sentence_summaries_dir="one-sentence-summary-files",
+            qa_dir="qa-files",
+            tags_dir="tag-files",
+            video_id="abc123",
+            safe_title="My Video",
+            storage=storage,
+        )
+
+        mock_translate.assert_not_called()
+        mock_docs.assert_called_once_with(
+            model, ["English summary", "One sentence.", "tag1, tag2"], "es"
+        )
+        self.assertEqual(
+            result[f"Tags {transcript_arg} {model} model (es)"], "tag1, tag2 (es)"
+        )
+        self.assertEqual(
+            result[f"QA Text {model} from {transcript_arg} (es)"],
+            "already translated",
+        )
+        self.assertEqual(storage.write_text.call_count, 3)
+
+    @patch("youtube_to_docs.translate.translate_documents")
+    @patch("youtube_to_docs.translate.translate_text")
+    def test_unbatched_translates_fields_one_by_one(self, mock_translate, mock_docs):
+        mock_translate.return_value = ("traducido", 10, 5)
+        model = "gemini-3.5-flash-lite"
+        transcript_arg = "youtube"
+        row = self._base_row(model, transcript_arg)
+
+        result = process_translate(
+            row=row,
+            translate_model=model,
+            translate_lang="es",
+            transcript_arg=transcript_arg,
+            model_names=[model],
+            summaries_dir="summary-files",
+            one_sentence_summaries_dir="one-sentence-summary-files",
+            qa_dir="qa-files",
+            tags_dir="tag-files",
+            video_id="abc123",
+            safe_title="My Video",
+            storage=self._make_storage(),
+            batched=False,
+        )
+
+        mock_docs.assert_not_called()
+        self.assertEqual(mock_translate.call_count, 4)
+        self.assertEqual(
+            result[f"Tags {transcript_arg} {model} model (es)"], "traducido"
+        )
+
+
+class TestTranslateDocuments(unittest.TestCase):
+    def setUp(self):
+        translate_mod._clients.clear()
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_llm_translates_json_object(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockLLMProvider("gemini-3.5-flash-lite")
+        provider_instance.generate_content = MagicMock(
+            return_value=('```json\n{"0": "Resumen\\n- punto", "1": "a, b"}\n```', 9, 4)
+        )
+        mock_get_provider.return_value = provider_instance
+
+        result = translate_documents(
+            "gemini-3.5-flash-lite", ["Summary\n- point", "a, b"], "es"
+        )
+
+        self.assertEqual(result, (["Resumen\n- punto", "a, b"], 9, 4))
+        provider_instance.generate_content.assert_called_once()
+        prompt = provider_instance.generate_content.call_args[0][0]
+        self.assertIn('{"0": "Summary\\n- point", "1": "a, b"}', prompt)
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_llm_missing_key_translated_alone(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockLLMProvider("gemini-3.5-flash-lite")
+        provider_instance.generate_content = MagicMock(
+            side_effect=[('{"0": "Hola"}', 5, 5), ("Adiós", 1, 1)]
+        )
+        mock_get_provider.return_value = provider_instance
+
+        result = translate_documents(
+            "gemini-3.5-flash-lite", ["Hello", "Goodbye"], "es"
+        )
+
+        self.assertEqual(result, (["Hola", "Adiós"], 6, 6))
+        second_prompt = provider_instance.generate_content.call_args[0][0]
+        self.assertTrue(second_prompt.endswith("\n\nGoodbye"))
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_translation_provider_uses_documents(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockTranslationProvider("aws-translate")
+        provider_instance.translate_documents = MagicMock(
+            side_effect=[["Hola\nmundo", "Error: throttled"], ["Adiós"]]
+        )
+        mock_get_provider.return_value = provider_instance
+
+        first = translate_documents("aws-translate", ["Hello\nworld", "Bye"], "es")
+        second = translate_documents("aws-translate", ["Hello\nworld", "Bye"], "es")
+
+        self.assertEqual(first, (["Hola\nmundo", "Error: throttled"], 0, 0))
+        self.assertEqual(second, (["Hola\nmundo", "Adiós"], 0, 0))
+        # Only the failed text is sent again
+        provider_instance.translate_documents.assert_called_with(["Bye"], "es")
+
+    @patch("youtube_to_docs.translate._translate_gcp")
+    @patch("youtube_to_docs.translate._translate_gcp_batch")
+    def test_gcp_documents_keep_long_texts_apart(self, mock_batch, mock_single):
+        mock_batch.return_value = ["Hola\nmundo", "Adiós"]
+        mock_single.return_value = ("largo", 0, 0)
+        long_text = "x" * (translate_mod._GCP_TRANSLATE_CHAR_LIMIT + 1)
+
+        result = _translate_gcp_documents(["Hello\nworld", long_text, "Bye"], "es")
+
+        self.assertEqual(result, ["Hola\nmundo", "largo", "Adiós"])
+        mock_batch.assert_called_once_with(["Hello\nworld", "Bye"], "es")
+        mock_single.assert_called_once_with(long_text, "es")
+
 
 class TestParseSuggestCaptionsArg(unittest.TestCase):
     def test_model_only_no_source(self):
@@ -571,6 +896,163 @@ class TestParseSuggestCaptionsArg(unittest.TestCase):
                 self.assertIsNone(source)
 
 
+class TestTranslateSrt(unittest.TestCase):
+    def setUp(self):
+        translate_mod._clients.clear()
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_llm_receives_only_cue_text(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockLLMProvider("gemini-3.5-flash-lite")
+        provider_instance.generate_content = MagicMock(
+            return_value=('```json\n["Hola", "Buenos días"]\n```', 20, 10)
+        )
+        mock_get_provider.return_value = provider_instance
+
+        result, in_tok, out_tok = translate_srt("gemini-3.5-flash-lite", EN_SRT, "es")
+
+        self.assertEqual(
+            result,
+            "1\n00:00:01,000 --> 00:00:02,000\nHola\n\n"
+            "2\n00:00:03,000 --> 00:00:04,500\nBuenos días\n",
+        )
+        self.assertEqual((in_tok, out_tok), (20, 10))
+        prompt = provider_instance.generate_content.call_args[0][0]
+        self.assertIn('["Hello", "Good morning"]', prompt)
+        self.assertNotIn("-->", prompt)
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_llm_length_mismatch_splits_batch(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockLLMProvider("gemini-3.5-flash-lite")
+        provider_instance.generate_content = MagicMock(
+            side_effect=[
+                ('["Hola Buenos días"]', 5, 5),
+                ('["Hola"]', 1, 1),
+                ("[]", 1, 1),
+                ("Buenos días", 1, 1),
+            ]
+        )
+        mock_get_provider.return_value = provider_instance
+
+        result, in_tok, _ = translate_srt("gemini-3.5-flash-lite", EN_SRT, "es")
+
+        self.assertIn("\nHola\n", result)
+        self.assertIn("\nBuenos días\n", result)
+        self.assertEqual(in_tok, 8)
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_translation_provider_uses_batch(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockTranslationProvider("gcp-translate")
+        provider_instance.translate_batch = MagicMock(
+            return_value=["Hola", "Buenos días"]
+        )
+        mock_get_provider.return_value = provider_instance
+
+        result, _, _ = translate_srt("gcp-translate", EN_SRT, "es")
+
+        provider_instance.translate_batch.assert_called_once_with(
+            ["Hello", "Good morning"], "es"
+        )
+        self.assertIn("00:00:03,000 --> 00:00:04,500\nBuenos días", result)
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_repeated_cues_translated_once(self, mock_get_provider):
+        from typing import Any
+
+        provider_instance: Any = MockTranslationProvider("gcp-translate")
+        provider_instance.translate_batch = MagicMock(return_value=["[Música]"])
+        mock_get_provider.return_value = provider_instance
+        srt = (
+            "1\n00:00:01,000 --> 00:00:02,000\n[Music]\n\n"
+            "2\n00:00:03,000 --> 00:00:04,000\n[Music]\n"
+        )
+
+        first, _, _ = translate_srt("gcp-translate", srt, "es")
+        second, _, _ = translate_srt("gcp-translate", srt, "es")
+
+        provider_instance.translate_batch.assert_called_once_with(["[Music]"], "es")
+        self.assertEqual(first.count("[Música]"), 2)
+        self.assertEqual(second, first)
+
+    @patch("youtube_to_docs.translate.translate_text")
+    def test_plain_text_falls_back(self, mock_translate_text):
+        mock_translate_text.return_value = ("Hola", 1, 1)
+        self.assertEqual(
+            translate_srt("gemini-3.5-flash-lite", "Hello", "es"), ("Hola", 1, 1)
+        )
+
+    @patch("youtube_to_docs.translate.google_translate")
+    def test_gcp_batch_uses_list_input(self, mock_google_translate):
+        mock_client = MagicMock()
+        mock_google_translate.Client.return_value = mock_client
+        mock_client.translate.return_value = [
+            {"translatedText": "Hola"},
+            {"translatedText": "Adiós"},
+        ]
+
+        result = _translate_gcp_batch(["Hello", "Goodbye"], "es")
+
+        self.assertEqual(result, ["Hola", "Adiós"])
+        mock_client.translate.assert_called_once_with(
+            ["Hello", "Goodbye"],
+            target_language="es",
+            source_language="en",
+            format_="text",
+        )
+
+    @patch("youtube_to_docs.translate.boto3")
+    def test_aws_batch_one_line_per_text(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.translate_text.return_value = {
+            "TranslatedText": "Hola\nAdiós < BR > amigo"
+        }
+
+        result = _translate_aws_batch(["Hello", "Goodbye\nfriend"], "es")
+
+        # Line breaks inside a cue are escaped in the batch and restored
+        self.assertEqual(result, ["Hola", "Adiós\namigo"])
+        mock_client.translate_text.assert_called_once_with(
+            Text="Hello\nGoodbye<br>friend",
+            SourceLanguageCode="en",
+            TargetLanguageCode="es",
+        )
+
+    @patch("youtube_to_docs.translate.boto3")
+    def test_aws_batch_budget_counts_separators(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.translate_text.side_effect = lambda Text, **kwargs: {
+            "TranslatedText": Text
+        }
+        limit = translate_mod._AWS_TRANSLATE_BYTE_LIMIT // 4
+        texts = ["x" * (limit // 2), "y" * (limit // 2)]
+
+        self.assertEqual(_translate_aws_batch(texts, "es"), texts)
+        # The two texts fill the budget exactly; the "\n" between them does not fit
+        self.assertEqual(mock_client.translate_text.call_count, 2)
+
+    @patch("youtube_to_docs.translate.boto3")
+    def test_aws_batch_line_mismatch_retries_per_text(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        mock_client.translate_text.side_effect = [
+            {"TranslatedText": "Hola Adiós"},
+            {"TranslatedText": "Hola"},
+            {"TranslatedText": "Adiós"},
+        ]
+
+        self.assertEqual(
+            _translate_aws_batch(["Hello", "Goodbye"], "es"), ["Hola", "Adiós"]
+        )
+        self.assertEqual(mock_client.translate_text.call_count, 3)
+
+
 class MockLLMProvider(BaseProvider, LLMProvider):
     def generate_content(self, prompt: str, **kwargs):
         return "response", 0, 0
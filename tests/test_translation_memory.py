@@ -0,0 +1,96 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from youtube_to_docs.translation_memory import (
+    TranslationMemory,
+    get_translation_memory,
+    normalize_segment,
+    translation_memory_max_bytes,
+)
+
+
+class TestTranslationMemory(unittest.TestCase):
+    def setUp(self):
+        self.memory = TranslationMemory()
+
+    def tearDown(self):
+        self.memory.close()
+
+    def test_put_and_get(self):
+        self.memory.put("aws-translate", "es", "Hello", "Hola")
+        self.assertEqual(self.memory.get("aws-translate", "es", "Hello"), "Hola")
+        self.assertIsNone(self.memory.get("aws-translate", "fr", "Hello"))
+        self.assertIsNone(self.memory.get("gcp-translate", "es", "Hello"))
+
+    def test_normalizes_trailing_whitespace_only(self):
+        self.assertEqual(normalize_segment("Hello \n world \n\n"), "Hello\n world")
+        self.assertNotEqual(normalize_segment("- a\n- b"), normalize_segment("- a - b"))
+        self.assertNotEqual(normalize_segment("  code"), normalize_segment("code"))
+        self.memory.put("aws-translate", "es", "Hello\nworld", "Hola\nmundo")
+        self.assertEqual(
+            self.memory.get("aws-translate", "es", "Hello \nworld\n"), "Hola\nmundo"
+        )
+        self.assertIsNone(self.memory.get("aws-translate", "es", "Hello world"))
+
+    def test_persists_across_instances(self):
+        self.memory.put("aws-translate", "es", "Hello", "Hola")
+        self.memory.close()
+        reopened = TranslationMemory(self.memory.path)
+        try:
+            self.assertEqual(reopened.get("aws-translate", "es", "Hello"), "Hola")
+        finally:
+            reopened.close()
+
+    def test_skips_errors(self):
+        self.memory.put("aws-translate", "es", "Hello", "Error: boom")
+        self.assertIsNone(self.memory.get("aws-translate", "es", "Hello"))
+
+    def test_get_many_counts_hits_and_misses(self):
+        self.memory.put_many("m", "es", {"a": "A", "b": "B"})
+        found = self.memory.get_many("m", "es", ["a", "b", "c", "a"])
+        self.assertEqual(found, {"a": "A", "b": "B"})
+        self.assertEqual((self.memory.hits, self.memory.misses), (2, 1))
+        self.assertIn("2 hits, 1 misses", self.memory.summary())
+
+    def test_evicts_least_recently_used(self):
+        memory = TranslationMemory(
+            os.path.join(os.path.dirname(self.memory.path), "small.sqlite"),
+            max_bytes=10,
+        )
+        try:
+            memory.put("m", "es", "aa", "AA")
+            memory.put("m", "es", "bb", "BB")
+            with patch("youtube_to_docs.translation_memory.time.time") as mock_time:
+                mock_time.return_value = 1e12
+                memory.get("m", "es", "aa")
+                memory.put("m", "es", "cc", "CC")
+            self.assertEqual(memory.get("m", "es", "aa"), "AA")
+            self.assertIsNone(memory.get("m", "es", "bb"))
+            self.assertEqual(memory.get("m", "es", "cc"), "CC")
+        finally:
+            memory.close()
+
+    def test_disabled_when_zero(self):
+        memory = TranslationMemory(self.memory.path, max_bytes=0)
+        memory.put("m", "es", "a", "A")
+        self.assertIsNone(memory.get("m", "es", "a"))
+        self.assertFalse(os.path.exists(self.memory.path))
+
+    def test_max_bytes_env(self):
+        with patch.dict(os.environ, {"YTD_TRANSLATION_MEMORY_MAX_BYTES": "5"}):
+            self.assertEqual(translation_memory_max_bytes(), 5)
+        with patch.dict(os.environ, {"YTD_TRANSLATION_MEMORY_MAX_BYTES": "x"}):
+            self.assertEqual(translation_memory_max_bytes(), 100 * 1024**2)
+
+    def test_shared_instance_follows_cache_dir(self):
+        first = get_translation_memory()
+        self.assertIs(get_translation_memory(), first)
+        self.assertEqual(
+            first.path,
+            os.path.join(os.environ["YTD_CACHE_DIR"], "translation-memory.sqlite"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
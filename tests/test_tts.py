@@ -1,10 +1,16 @@
 import os
+import sys
+import threading
+import time
 import unittest
+from array import array
 from unittest.mock import MagicMock, patch
 
 import polars as pl
 
+from youtube_to_docs import tts as tts_mod
 from youtube_to_docs.providers import BaseProvider, TTSProvider
+from youtube_to_docs.storage import serialized
 from youtube_to_docs.tts import (
     generate_speech,
     generate_speech_aws_polly,
@@ -13,10 +19,28 @@ from youtube_to_docs.tts import (
     is_gcp_tts_model,
     parse_tts_arg,
     process_tts,
+    save_speech,
+    write_wav_chunks,
 )
 
 
+def capture_uploads(storage, saved_path):
+    """Records (target_path, content) for each storage.upload_file call."""
+    uploads = []
+
+    def _upload(local_path, target_path, content_type=None):
+        with open(local_path, "rb") as f:
+            uploads.append((target_path, f.read()))
+        return saved_path
+
+    storage.upload_file.side_effect = _upload
+    return uploads
+
+
 class TestTTS(unittest.TestCase):
+    def setUp(self):
+        tts_mod._clients.clear()
+
     def test_parse_tts_arg(self):
         # Test with hyphen
         model, voice = parse_tts_arg("gemini-3.1-flash-tts-preview-Kore")
@@ -81,6 +105,35 @@ class TestTTS(unittest.TestCase):
         self.assertEqual(audio_data, b"")
         self.assertEqual(rate, 0)
 
+    @patch("google.genai", create=True)
+    @patch.dict(os.environ, {"GEMINI_API_KEY": "fake_key"})
+    def test_generate_speech_chunks_in_parallel(self, mock_genai):
+        import time
+
+        mock_client = MagicMock()
+        mock_genai.Client.return_value = mock_client
+
+        def _generate(model, contents, config):
+            # Later chunks finish first; each returns 10 samples of its letter
+            time.sleep(0.01 * (ord("e") - ord(contents[0])))
+            part = MagicMock()
+            part.inline_data.data = array("h", [ord(contents[0])] * 10).tobytes()
+            return MagicMock(candidates=[MagicMock(content=MagicMock(parts=[part]))])
+
+        mock_client.models.generate_content.side_effect = _generate
+        text = " ".join(f"{letter * 1500}." for letter in "abcde")
+
+        chunks, rate = tts_mod.generate_speech_gemini_stream(text, "model", "voice")
+
+        self.assertEqual(rate, 24000)
+        self.assertEqual(
+            [array("h", chunk).tolist() for chunk in chunks],
+            [[ord(letter)] * 10 for letter in "abcde"],
+        )
+        self.assertEqual(mock_client.models.generate_content.call_count, 5)
+        mock_genai.Client.assert_called_once_with(api_key="fake_key")
+
+    @patch.dict(os.environ, {"YTD_TTS_SAMPLE_RATE": "0"})
     @patch("youtube_to_docs.providers.get_provider")
     def test_process_tts(
         self,
@@ -117,8 +170,10 @@ class TestTTS(unittest.TestCase):
             return False
 
         mock_storage.exists.side_effect = exists_side_effect
+        # Storage without folder listing falls back to exists() per file
+        mock_storage.list_files.return_value = None
         mock_storage.read_text.return_value = "Summary text"
-        mock_storage.write_bytes.return_value = "/saved/path.wav"
+        uploads = capture_uploads(mock_storage, "/saved/path.wav")
         mock_storage.get_full_path.return_value = "/full/path/summary2 - tts-arg.wav"
 
         from typing import Any
@@ -128,7 +183,9 @@ class TestTTS(unittest.TestCase):
         mock_get_provider.return_value = provider_instance
 
         # Execute
-        updated_df = process_tts(df, "tts-arg", mock_storage, "/tmp")
+        updated_df = process_tts(
+            df, "tts-arg", mock_storage, "/tmp", audio_format="wav"
+        )
 
         # Verify
         self.assertIn("Summary Audio File 1 tts-arg File", updated_df.columns)
@@ -138,15 +195,16 @@ class TestTTS(unittest.TestCase):
             "Summary text", "arg", "en-US"
         )
 
-        # Check storage writes
-        mock_storage.write_bytes.assert_called_once()
-        args, _ = mock_storage.write_bytes.call_args
-        self.assertTrue(args[0].endswith("summary1 - tts-arg.wav"))
+        # Check storage uploads
+        self.assertEqual(len(uploads), 1)
+        target_path, wav_content = uploads[0]
+        self.assertTrue(target_path.endswith("summary1 - tts-arg.wav"))
+        mock_storage.write_bytes.assert_not_called()
 
         # Verify content is a valid WAV container
-        wav_content = args[1]
         self.assertTrue(wav_content.startswith(b"RIFF"))
         self.assertIn(b"WAVE", wav_content)
+        self.assertTrue(wav_content.endswith(b"1234"))
 
         # Check DataFrame content
         new_col = updated_df["Summary Audio File 1 tts-arg File"]
@@ -177,7 +235,7 @@ class TestTTS(unittest.TestCase):
 
         mock_storage.exists.side_effect = exists_side_effect
         mock_storage.read_text.return_value = "Texto resumen"
-        mock_storage.write_bytes.return_value = "/saved/es.wav"
+        uploads = capture_uploads(mock_storage, "/saved/es.wav")
 
         from typing import Any
 
@@ -186,22 +244,290 @@ class TestTTS(unittest.TestCase):
         mock_get_provider.return_value = provider_instance
 
         # Execute
-        process_tts(df, "tts-arg", mock_storage, "/tmp")
+        process_tts(df, "tts-arg", mock_storage, "/tmp", audio_format="wav")
 
         # Verify generate_speech called with 'es-US'
         provider_instance.generate_speech.assert_called_once_with(
             "Texto resumen", "arg", "es-US"
         )
 
-        # Verify write was called
-        mock_storage.write_bytes.assert_called_once()
-        args, _ = mock_storage.write_bytes.call_args
-        self.assertTrue(args[1].startswith(b"RIFF"))
+        # Verify the WAV was uploaded
+        self.assertEqual(len(uploads), 1)
+        self.assertTrue(uploads[0][1].startswith(b"RIFF"))
+
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_process_tts_uses_folder_listing(self, mock_get_provider):
+        df = pl.DataFrame(
+            {
+                "Summary File 1": [f"/path/to/summary{i}.md" for i in range(6)],
+                "Summary File 1 (es)": [f"/path/to/resumen{i}.md" for i in range(6)],
+            }
+        )
+        mock_storage = MagicMock()
+        mock_storage.exists.return_value = True
+        mock_storage.read_text.return_value = "Summary text"
+        mock_storage.list_files.return_value = {
+            "summary0 - tts-arg.wav": "https://drive/summary0",
+            "resumen0 - tts-arg.wav": "https://drive/resumen0",
+        }
+        capture_uploads(mock_storage, "/saved/path.wav")
+
+        provider_instance = MockTTSProvider("tts")
+        provider_instance.generate_speech = MagicMock(return_value=(b"12", 16000))
+        mock_get_provider.return_value = provider_instance
+
+        with patch.dict("os.environ", {"YTD_TTS_ROW_MAX_WORKERS": "4"}):
+            updated_df = process_tts(
+                df, "tts-arg", mock_storage, "/tmp", audio_format="wav"
+            )
+
+        mock_storage.list_files.assert_called_once_with(
+            os.path.join("/tmp", "audio-files")
+        )
+        # Only summary files are checked; audio existence comes from the listing
+        for call in mock_storage.exists.call_args_list:
+            self.assertTrue(call.args[0].endswith(".md"))
+        mock_storage.get_full_path.assert_not_called()
+        self.assertEqual(provider_instance.generate_speech.call_count, 10)
+        self.assertEqual(
+            updated_df["Summary Audio File 1 tts-arg File"].to_list(),
+            ["https://drive/summary0"] + ["/saved/path.wav"] * 5,
+        )
+        self.assertEqual(
+            updated_df["Summary Audio File 1 (es) tts-arg File"][0],
+            "https://drive/resumen0",
+        )
+
+    @patch("static_ffmpeg.add_paths")
+    @patch("youtube_to_docs.tts.save_speech")
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_process_tts_defaults_to_aac(
+        self, mock_get_provider, mock_save, mock_add_paths
+    ):
+        df = pl.DataFrame({"Summary File 1": ["/path/to/summary.md"]})
+        mock_storage = MagicMock()
+        mock_storage.exists.side_effect = lambda path: path.endswith(".md")
+        mock_storage.read_text.return_value = "Summary"
+        mock_save.return_value = "/saved/summary.m4a"
+
+        provider_instance = MockTTSProvider("tts")
+        provider_instance.generate_speech = MagicMock(return_value=(b"12", 16000))
+        mock_get_provider.return_value = provider_instance
+
+        updated_df = process_tts(df, "tts-arg", mock_storage, "/tmp")
+
+        target_path = mock_save.call_args.args[1]
+        self.assertTrue(target_path.endswith("summary - tts-arg.m4a"))
+        self.assertEqual(mock_save.call_args.args[4], "aac")
+        # The post-processing stage resamples the 16 kHz speech
+        self.assertEqual(mock_save.call_args.args[3], 24000)
+        self.assertEqual(
+            updated_df["Summary Audio File 1 tts-arg File"][0], "/saved/summary.m4a"
+        )
+
+    @patch.dict(sys.modules, {"static_ffmpeg": None})
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_process_tts_default_format_without_ffmpeg(self, mock_get_provider):
+        df = pl.DataFrame({"Summary File 1": ["/path/to/summary.md"]})
+        mock_storage = MagicMock()
+        mock_storage.exists.return_value = True
+
+        # The default AAC output needs ffmpeg; fail before any synthesis
+        with self.assertRaisesRegex(ImportError, "--tts-format wav"):
+            process_tts(df, "tts-arg", mock_storage, "/tmp")
+        mock_get_provider.assert_not_called()
+        mock_storage.read_text.assert_not_called()
+
+    @patch.dict(sys.modules, {"static_ffmpeg": None})
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_process_tts_wav_without_ffmpeg(self, mock_get_provider):
+        df = pl.DataFrame({"Summary File 1": ["/path/to/summary.md"]})
+        mock_storage = MagicMock()
+        mock_storage.exists.side_effect = lambda path: path.endswith(".md")
+        mock_storage.list_files.return_value = None
+        mock_storage.read_text.return_value = "Summary"
+        capture_uploads(mock_storage, "/saved/summary.wav")
+        provider_instance = MockTTSProvider("tts")
+        provider_instance.generate_speech = MagicMock(return_value=(b"12", 16000))
+        mock_get_provider.return_value = provider_instance
+
+        updated_df = process_tts(
+            df, "tts-arg", mock_storage, "/tmp", audio_format="wav"
+        )
+
+        self.assertEqual(
+            updated_df["Summary Audio File 1 tts-arg File"][0], "/saved/summary.wav"
+        )
+
+    @patch("static_ffmpeg.add_paths")
+    @patch("youtube_to_docs.tts.save_speech")
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_process_tts_reuses_audio_in_other_format(
+        self, mock_get_provider, mock_save, mock_add_paths
+    ):
+        df = pl.DataFrame(
+            {"Summary File 1": ["/path/to/summary0.md", "/path/to/summary1.md"]}
+        )
+        mock_storage = MagicMock()
+        mock_storage.exists.side_effect = lambda path: (
+            path.endswith(".md") or path.endswith("summary1 - tts-arg.wav")
+        )
+        mock_storage.list_files.return_value = None
+        mock_storage.get_full_path.side_effect = lambda path: f"/full{path}"
+        mock_storage.read_text.return_value = "Summary"
+        mock_save.return_value = "/saved/summary0.m4a"
+
+        provider_instance = MockTTSProvider("tts")
+        provider_instance.generate_speech = MagicMock(return_value=(b"12", 16000))
+        mock_get_provider.return_value = provider_instance
+
+        updated_df = process_tts(df, "tts-arg", mock_storage, "/tmp")
+
+        # The .wav written by an earlier run is kept; only summary0 is new
+        mock_save.assert_called_once()
+        self.assertEqual(
+            updated_df["Summary Audio File 1 tts-arg File"].to_list(),
+            [
+                "/saved/summary0.m4a",
+                "/full" + os.path.join("/tmp", "audio-files", "summary1 - tts-arg.wav"),
+            ],
+        )
+
+
+@serialized
+class _OverlapTrackingStorage:
+    """Storage whose calls record how many threads are inside it at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.guard = threading.Lock()
+
+    def _enter(self):
+        with self.guard:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.005)
+        with self.guard:
+            self.active -= 1
+
+    def ensure_directory(self, path):
+        self._enter()
+
+    def list_files(self, path):
+        self._enter()
+        return {}
+
+    def exists(self, path):
+        self._enter()
+        return True
+
+    def read_text(self, path):
+        self._enter()
+        return "Summary text"
+
+    def upload_file(self, local_path, target_path, content_type=None):
+        self._enter()
+        return target_path
+
+
+class TestProcessTTSThreads(unittest.TestCase):
+    @patch("youtube_to_docs.providers.get_provider")
+    def test_storage_calls_never_overlap(self, mock_get_provider):
+        """Rows are voiced in parallel, but a non-thread-safe backend made safe
+        with ``@serialized`` (Drive, SharePoint, Hugging Face) is only ever
+        entered by one thread at a time."""
+        synthesizing = []
+        overlaps = []
+
+        def _generate(text, voice, language_code=None, **kwargs):
+            synthesizing.append(1)
+            overlaps.append(len(synthesizing))
+            time.sleep(0.02)
+            synthesizing.pop()
+            return b"12", 16000
+
+        provider_instance = MockTTSProvider("tts")
+        provider_instance.generate_speech = MagicMock(side_effect=_generate)
+        mock_get_provider.return_value = provider_instance
+        df = pl.DataFrame(
+            {"Summary File 1": [f"/path/to/summary{i}.md" for i in range(8)]}
+        )
+        storage = _OverlapTrackingStorage()
+
+        with patch.dict("os.environ", {"YTD_TTS_ROW_MAX_WORKERS": "4"}):
+            updated_df = process_tts(df, "tts-arg", storage, "/tmp", audio_format="wav")
+
+        self.assertEqual(storage.max_active, 1)
+        self.assertGreater(max(overlaps), 1)
+        self.assertEqual(
+            updated_df["Summary Audio File 1 tts-arg File"].to_list(),
+            [
+                os.path.join("/tmp", "audio-files", f"summary{i} - tts-arg.wav")
+                for i in range(8)
+            ],
+        )
+
+
+class TestWavWriter(unittest.TestCase):
+    def test_write_wav_chunks_patches_header(self):
+        import io
+        import wave
+
+        buffer = io.BytesIO()
+        written = write_wav_chunks(buffer, iter([b"\x01\x00" * 10, b"", b"\x02\x00"]))
+        self.assertEqual(written, 22)
+
+        buffer.seek(0)
+        with wave.open(buffer, "rb") as wf:
+            self.assertEqual(wf.getframerate(), 24000)
+            self.assertEqual(wf.getnframes(), 11)
+            self.assertEqual(wf.readframes(11)[-2:], b"\x02\x00")
+
+    def test_save_speech_uploads_and_removes_temp_file(self):
+        storage = MagicMock()
+        local_paths = []
+        storage.upload_file.side_effect = lambda local, target, content_type: (
+            local_paths.append(local) or "/saved.wav"
+        )
+
+        result = save_speech(storage, "audio/x.wav", iter([b"\x00\x00"]), 16000)
+
+        self.assertEqual(result, "/saved.wav")
+        storage.upload_file.assert_called_once()
+        self.assertEqual(
+            storage.upload_file.call_args.kwargs["content_type"], "audio/wav"
+        )
+        self.assertFalse(os.path.exists(local_paths[0]))
+
+    @patch("youtube_to_docs.tts.encode_pcm_stream")
+    def test_save_speech_encodes_compressed_format(self, mock_encode):
+        storage = MagicMock()
+        storage.upload_file.return_value = "/saved.m4a"
+        mock_encode.return_value = 2
+
+        result = save_speech(storage, "audio/x.m4a", iter([b"\x00\x00"]), 24000, "aac")
+
+        self.assertEqual(result, "/saved.m4a")
+        chunks, rate, local_path, audio_format = mock_encode.call_args.args
+        self.assertEqual((rate, audio_format), (24000, "aac"))
+        self.assertTrue(local_path.endswith(".m4a"))
+        self.assertEqual(
+            storage.upload_file.call_args.kwargs["content_type"], "audio/mp4"
+        )
+
+    def test_save_speech_skips_empty_audio(self):
+        storage = MagicMock()
+        self.assertIsNone(save_speech(storage, "audio/x.wav", iter([]), 16000))
+        storage.upload_file.assert_not_called()
 
 
 class TestGCPTTS(unittest.TestCase):
     """Tests for GCP Chirp3 TTS functionality."""
 
+    def setUp(self):
+        tts_mod._clients.clear()
+
     def test_parse_tts_arg_gcp_simple(self):
         """Test parsing gcp-chirp3 without a voice (defaults to Kore)."""
         model, voice = parse_tts_arg("gcp-chirp3")
@@ -277,7 +603,7 @@ class TestGCPTTS(unittest.TestCase):
 
         mock_storage.exists.side_effect = exists_side_effect
         mock_storage.read_text.return_value = "Summary text"
-        mock_storage.write_bytes.return_value = "/saved/path.wav"
+        uploads = capture_uploads(mock_storage, "/saved/path.wav")
 
         from typing import Any
 
@@ -286,7 +612,9 @@ class TestGCPTTS(unittest.TestCase):
         mock_get_provider.return_value = provider_instance
 
         # Execute with GCP model
-        updated_df = process_tts(df, "gcp-chirp3-Kore", mock_storage, "/tmp")
+        updated_df = process_tts(
+            df, "gcp-chirp3-Kore", mock_storage, "/tmp", audio_format="wav"
+        )
 
         # Verify GCP function was called
         provider_instance.generate_speech.assert_called_once_with(
@@ -296,16 +624,18 @@ class TestGCPTTS(unittest.TestCase):
         # Verify new column was created
         self.assertIn("Summary Audio File 1 gcp-chirp3-Kore File", updated_df.columns)
 
-        # Verify WAV file was written
-        mock_storage.write_bytes.assert_called_once()
-        args, _ = mock_storage.write_bytes.call_args
-        self.assertTrue(args[0].endswith(".wav"))
-        self.assertTrue(args[1].startswith(b"RIFF"))
+        # Verify WAV file was uploaded
+        self.assertEqual(len(uploads), 1)
+        self.assertTrue(uploads[0][0].endswith(".wav"))
+        self.assertTrue(uploads[0][1].startswith(b"RIFF"))
 
 
 class TestAWSPolly(unittest.TestCase):
     """Tests for AWS Polly TTS functionality."""
 
+    def setUp(self):
+        tts_mod._clients.clear()
+
     def test_parse_tts_arg_aws_simple(self):
         """Test parsing aws-polly without a voice (defaults to Ruth)."""
         model, voice = parse_tts_arg("aws-polly")
@@ -356,6 +686,29 @@ class TestAWSPolly(unittest.TestCase):
         self.assertEqual(kwargs["Engine"], "long-form")
         self.assertEqual(kwargs["OutputFormat"], "pcm")
 
+    @patch("youtube_to_docs.tts.boto3", create=True)
+    def test_generate_speech_aws_polly_chunks_in_order(self, mock_boto3):
+        """Long texts are synthesized in chunks with one reused client."""
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+
+        def _synthesize(Text, **kwargs):
+            stream = MagicMock()
+            stream.__enter__.return_value.read.return_value = Text[:1].encode()
+            return {"AudioStream": stream}
+
+        mock_client.synthesize_speech.side_effect = _synthesize
+        text = " ".join(f"{letter * 900}." for letter in "abcde")
+
+        with patch.dict("sys.modules", {"boto3": mock_boto3}):
+            audio_data, _ = generate_speech_aws_polly(text, "Ruth")
+            generate_speech_aws_polly("Hello", "Ruth")
+
+        # Three chunks of two sentences at most, joined in order
+        self.assertEqual(audio_data, b"ace")
+        self.assertEqual(mock_client.synthesize_speech.call_count, 4)
+        mock_boto3.client.assert_called_once_with("polly")
+
     def test_generate_speech_aws_polly_import_error(self):
         """Test AWS Polly TTS when boto3 is not installed."""
         with patch.dict("sys.modules", {"boto3": None}):
@@ -381,7 +734,7 @@ class TestAWSPolly(unittest.TestCase):
 
         mock_storage.exists.side_effect = exists_side_effect
         mock_storage.read_text.return_value = "Summary text"
-        mock_storage.write_bytes.return_value = "/saved/path.wav"
+        uploads = capture_uploads(mock_storage, "/saved/path.wav")
 
         from typing import Any
 
@@ -390,7 +743,9 @@ class TestAWSPolly(unittest.TestCase):
         mock_get_provider.return_value = provider_instance
 
         # Execute with AWS Polly model
-        updated_df = process_tts(df, "aws-polly", mock_storage, "/tmp")
+        updated_df = process_tts(
+            df, "aws-polly", mock_storage, "/tmp", audio_format="wav"
+        )
 
         # Verify AWS function was called
         # Note: process_tts now passes (text, voice_name, lang_code)
@@ -401,11 +756,10 @@ class TestAWSPolly(unittest.TestCase):
         # Verify new column was created
         self.assertIn("Summary Audio File 1 aws-polly File", updated_df.columns)
 
-        # Verify WAV file was written
-        mock_storage.write_bytes.assert_called_once()
-        args, _ = mock_storage.write_bytes.call_args
-        self.assertTrue(args[0].endswith(".wav"))
-        self.assertTrue(args[1].startswith(b"RIFF"))
+        # Verify WAV file was uploaded
+        self.assertEqual(len(uploads), 1)
+        self.assertTrue(uploads[0][0].endswith(".wav"))
+        self.assertTrue(uploads[0][1].startswith(b"RIFF"))
 
 
 class MockTTSProvider(BaseProvider, TTSProvider):
@@ -32,8 +32,12 @@ def test_tts_filtering():
     mock_storage.exists.return_value = False  # Assume audio doesn't exist
     mock_storage.write_bytes.return_value = "/saved/audio.wav"
 
-    # Mock generate_speech to avoid API calls
-    with patch("youtube_to_docs.tts.generate_speech") as mock_gen:
+    # Mock generate_speech to avoid API calls, and the ffmpeg lookup the
+    # default AAC format performs up front
+    with (
+        patch("youtube_to_docs.tts.generate_speech") as mock_gen,
+        patch("static_ffmpeg.add_paths"),
+    ):
         mock_gen.return_value = b"fake_pcm_data"
 
         # --- Test 1: Only English ---
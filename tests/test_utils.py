@@ -1,3 +1,4 @@
+import random
 import unittest
 
 import polars as pl
@@ -151,3 +152,79 @@ class TestQAProcessing(unittest.TestCase):
         # Nan strings should be handled before calling this, but if passed:
         # It won't have 2 lines, so returns as is.
         self.assertEqual(utils.add_question_numbers("nan"), "nan")
+
+
+class TestChunkTextByBytes(unittest.TestCase):
+    ALPHABET = ["a", "b", " ", "  ", ".", "!", "?", "\n", "é", "中", "😀", "\t"]
+
+    def test_properties_on_random_text(self):
+        rng = random.Random(44)
+        for _ in range(300):
+            text = "".join(rng.choices(self.ALPHABET, k=rng.randint(0, 120)))
+            max_bytes = rng.randint(4, 40)
+            by_line = rng.random() < 0.5
+            case = repr((text, max_bytes, by_line))
+            chunks = utils.chunk_text_by_bytes(text, max_bytes, by_line)
+            self.assertEqual("".join(chunks), text, case)
+            for chunk in chunks:
+                self.assertTrue(chunk, case)
+                self.assertLessEqual(len(chunk.encode("utf-8")), max_bytes, case)
+
+    def test_prefers_sentence_then_word_boundaries(self):
+        text = "One two. Three four five six seven. Eight."
+        self.assertEqual(
+            utils.chunk_text_by_bytes(text, 20),
+            ["One two. ", "Three four five six ", "seven. Eight."],
+        )
+
+    def test_by_line_keeps_lines_together(self):
+        text = "1\nHello. World.\n\n2\nAgain.\n"
+        self.assertEqual(
+            utils.chunk_text_by_bytes(text, 18, by_line=True),
+            ["1\nHello. World.\n\n", "2\nAgain.\n"],
+        )
+
+    def test_splits_long_word_on_code_points(self):
+        self.assertEqual(utils.chunk_text_by_bytes("é" * 5, 5), ["éé", "éé", "é"])
+
+    def test_short_text_is_one_chunk(self):
+        self.assertEqual(utils.chunk_text_by_bytes("Hi.", 10), ["Hi."])
+        self.assertEqual(utils.chunk_text_by_bytes("", 10), [])
+
+
+class TestThreadMap(unittest.TestCase):
+    def test_keeps_order(self):
+        import time
+
+        def _slow_square(x):
+            time.sleep(0.01 * (5 - x))
+            return x * x
+
+        self.assertEqual(utils.thread_map(_slow_square, range(5), 4), [0, 1, 4, 9, 16])
+
+    def test_serial_when_one_worker(self):
+        self.assertEqual(utils.thread_map(str, [1, 2], 1), ["1", "2"])
+
+    def test_propagates_exceptions(self):
+        def _fail(x):
+            raise ValueError(x)
+
+        with self.assertRaises(ValueError):
+            utils.thread_map(_fail, [1, 2], 2)
+
+    def test_imap_yields_in_order_with_bounded_lookahead(self):
+        import threading
+
+        started = []
+        lock = threading.Lock()
+
+        def _record(x):
+            with lock:
+                started.append(x)
+            return x * 2
+
+        results = utils.thread_imap(_record, range(10), 2)
+        self.assertEqual(next(results), 0)
+        # Only a pool's worth of items is submitted ahead of the consumer
+        self.assertLessEqual(len(started), 3)
+        self.assertEqual(list(results), [2, 4, 6, 8, 10, 12, 14, 16, 18])
@@ -1,12 +1,32 @@
 import os
 import tempfile
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
 import polars as pl
 
-from youtube_to_docs.storage import Storage
-from youtube_to_docs.video import create_video, process_videos
+from youtube_to_docs.storage import LocalStorage, Storage
+from youtube_to_docs.video import (
+    create_video,
+    encode_still,
+    mux_video,
+    process_videos,
+    video_max_workers,
+)
+
+
+def _download_side_effect(content_for):
+    """Fakes Storage.get_local_file for a remote backend."""
+
+    def get_local_file(path, download_dir=None):
+        os.makedirs(download_dir, exist_ok=True)
+        local_path = os.path.join(download_dir, os.path.basename(path))
+        with open(local_path, "wb") as f:
+            f.write(content_for(path))
+        return local_path
+
+    return get_local_file
 
 
 class TestVideo(unittest.TestCase):
@@ -46,6 +66,38 @@ class TestVideo(unittest.TestCase):
         self.assertIn(self.audio_path, args)
         self.assertIn(self.output_path, args)
 
+    @patch("youtube_to_docs.video.subprocess.run")
+    @patch("static_ffmpeg.run.get_or_fetch_platform_executables_else_raise")
+    def test_create_video_fast_mode(self, mock_get_ffmpeg, mock_run):
+        mock_get_ffmpeg.return_value = ("/usr/bin/ffmpeg", None)
+        m4a_path = os.path.join(self.temp_dir, "test_audio.m4a")
+
+        self.assertTrue(create_video(self.image_path, m4a_path, self.output_path))
+        args = mock_run.call_args[0][0]
+        self.assertEqual(args[args.index("-framerate") + 1], "1")
+        self.assertEqual(args[args.index("-preset") + 1], "ultrafast")
+        # A keyframe every couple of seconds keeps the 1 fps video seekable
+        self.assertEqual(args[args.index("-g") + 1], "2")
+        # AAC audio is copied, not re-encoded
+        self.assertEqual(args[args.index("-c:a") + 1], "copy")
+
+        # WAV audio still has to be encoded
+        create_video(self.image_path, self.audio_path, self.output_path)
+        args = mock_run.call_args[0][0]
+        self.assertEqual(args[args.index("-c:a") + 1], "aac")
+
+    @patch("youtube_to_docs.video.subprocess.run")
+    @patch("static_ffmpeg.run.get_or_fetch_platform_executables_else_raise")
+    def test_create_video_full_rate(self, mock_get_ffmpeg, mock_run):
+        mock_get_ffmpeg.return_value = ("/usr/bin/ffmpeg", None)
+        m4a_path = os.path.join(self.temp_dir, "test_audio.m4a")
+
+        create_video(self.image_path, m4a_path, self.output_path, fast=False)
+        args = mock_run.call_args[0][0]
+        self.assertNotIn("-framerate", args)
+        self.assertNotIn("-preset", args)
+        self.assertEqual(args[args.index("-c:a") + 1], "aac")
+
     @patch("youtube_to_docs.video.subprocess.run")
     @patch("static_ffmpeg.run.get_or_fetch_platform_executables_else_raise")
     def test_create_video_failure(self, mock_get_ffmpeg, mock_run):
@@ -57,11 +109,179 @@ class TestVideo(unittest.TestCase):
         result = create_video(self.image_path, self.audio_path, self.output_path)
         self.assertFalse(result)
 
+    @patch("youtube_to_docs.video.subprocess.run")
+    @patch("static_ffmpeg.run.get_or_fetch_platform_executables_else_raise")
+    def test_encode_still_and_mux_video(self, mock_get_ffmpeg, mock_run):
+        mock_get_ffmpeg.return_value = ("/usr/bin/ffmpeg", "/usr/bin/ffprobe")
+        still_path = os.path.join(self.temp_dir, "still.mp4")
+
+        self.assertTrue(encode_still(self.image_path, still_path, 12.5))
+        args = mock_run.call_args[0][0]
+        self.assertEqual(args[args.index("-t") + 1], "12.500")
+        self.assertEqual(args[args.index("-g") + 1], "2")
+        self.assertIn("-an", args)
+        self.assertNotIn(self.audio_path, args)
+
+        m4a_path = os.path.join(self.temp_dir, "test_audio.m4a")
+        self.assertTrue(mux_video(still_path, m4a_path, self.output_path))
+        args = mock_run.call_args[0][0]
+        # The picture is never re-encoded when muxing
+        self.assertEqual(args[args.index("-c:v") + 1], "copy")
+        self.assertEqual(args[args.index("-c:a") + 1], "copy")
+        self.assertNotIn("libx264", args)
+
+    def _shared_image_storage(self, images):
+        mock_storage = MagicMock(spec=Storage)
+        mock_storage.exists.side_effect = lambda path: "video-files" not in path
+        mock_storage.get_local_file.side_effect = _download_side_effect(
+            lambda path: images.get(path, b"audio")
+        )
+        mock_storage.upload_file.side_effect = lambda local, target, **_: target
+        df = pl.DataFrame(
+            {
+                "Title": ["Test Video"],
+                "Summary Infographic File m1 img": ["/info/en.png"],
+                "Summary Infographic File m1 (es) img": ["/info/es.png"],
+                "Summary Infographic File m1 (fr) img": ["/info/fr.png"],
+                "Summary Audio File m1 tts File": ["/audio/en.m4a"],
+                "Summary Audio File m1 (es) tts File": ["/audio/es.m4a"],
+                "Summary Audio File m1 (fr) tts File": ["/audio/fr.m4a"],
+            }
+        )
+        return mock_storage, df
+
+    @patch("youtube_to_docs.video.create_video")
+    @patch("youtube_to_docs.video.mux_video", return_value=True)
+    @patch("youtube_to_docs.video.encode_still", return_value=True)
+    @patch("youtube_to_docs.video.probe_duration")
+    def test_process_videos_encodes_shared_image_once(
+        self, mock_probe, mock_encode, mock_mux, mock_create
+    ):
+        mock_probe.side_effect = [30.0, 45.0, 40.0]
+        images = {p: b"same image" for p in ("/info/en.png", "/info/es.png")}
+        images["/info/fr.png"] = b"other image"
+        mock_storage, df = self._shared_image_storage(images)
+        mock_create.return_value = True
+
+        updated_df = process_videos(df, mock_storage, base_dir=self.temp_dir)
+
+        # en and es share one encode, long enough for the longer audio
+        mock_encode.assert_called_once()
+        self.assertEqual(mock_encode.call_args[0][2], 46.0)
+        self.assertEqual(mock_mux.call_count, 2)
+        # fr has its own image and is rendered in one pass
+        mock_create.assert_called_once()
+        self.assertEqual(
+            updated_df["Video File"][0],
+            os.path.join(self.temp_dir, "video-files", "en.mp4"),
+        )
+        self.assertTrue(updated_df["Video File (es)"][0].endswith("es.mp4"))
+        self.assertTrue(updated_df["Video File (fr)"][0].endswith("fr.mp4"))
+        # Each infographic is fetched once, each audio once
+        self.assertEqual(mock_storage.get_local_file.call_count, 6)
+
+    @patch("youtube_to_docs.video.create_video", return_value=True)
+    @patch("youtube_to_docs.video.encode_still")
+    @patch("youtube_to_docs.video.probe_duration", return_value=None)
+    def test_process_videos_falls_back_without_duration(
+        self, mock_probe, mock_encode, mock_create
+    ):
+        images = {p: b"same image" for p in ("/info/en.png", "/info/es.png")}
+        images["/info/fr.png"] = b"same image"
+        mock_storage, df = self._shared_image_storage(images)
+
+        updated_df = process_videos(df, mock_storage, base_dir=self.temp_dir)
+
+        mock_encode.assert_not_called()
+        self.assertEqual(mock_create.call_count, 3)
+        self.assertTrue(updated_df["Video File (fr)"][0].endswith("fr.mp4"))
+
+    def test_video_max_workers(self):
+        with patch.dict(os.environ, {"YTD_VIDEO_MAX_WORKERS": "3"}):
+            self.assertEqual(video_max_workers(), 3)
+        with patch.dict(os.environ, {"YTD_VIDEO_MAX_WORKERS": "0"}):
+            self.assertEqual(video_max_workers(), 1)
+        with patch.dict(os.environ, {"YTD_VIDEO_MAX_WORKERS": "many"}):
+            self.assertEqual(video_max_workers(), 2)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(video_max_workers(), 2)
+
+    @patch.dict(os.environ, {"YTD_VIDEO_MAX_WORKERS": "4"})
+    def test_process_videos_renders_rows_in_parallel(self):
+        mock_storage = MagicMock(spec=Storage)
+        mock_storage.exists.side_effect = lambda path: "video-files" not in path
+        mock_storage.get_local_file.side_effect = _download_side_effect(
+            lambda path: path.encode()
+        )
+        uploads = {}
+
+        def upload_side_effect(local_path, target_path, **_):
+            with open(local_path, "rb") as f:
+                uploads[target_path] = f.read()
+            return target_path
+
+        mock_storage.upload_file.side_effect = upload_side_effect
+        barrier = threading.Barrier(3, timeout=5)
+
+        def create_video_side_effect(img, audio, output):
+            # Every row must be encoding at the same time to pass the barrier
+            barrier.wait()
+            with open(img, "rb") as f_img, open(audio, "rb") as f_audio:
+                content = f_img.read() + b"+" + f_audio.read()
+            with open(output, "wb") as f:
+                f.write(content)
+            return True
+
+        df = pl.DataFrame(
+            {
+                "Summary Infographic File m1 img": [f"/info/{i}.png" for i in range(3)],
+                "Summary Audio File m1 tts File": [f"/audio/{i}.m4a" for i in range(3)],
+            }
+        )
+        with patch(
+            "youtube_to_docs.video.create_video", side_effect=create_video_side_effect
+        ):
+            updated_df = process_videos(df, mock_storage, base_dir=self.temp_dir)
+
+        for i in range(3):
+            target = updated_df["Video File"][i]
+            self.assertTrue(target.endswith(f"{i}.mp4"))
+            # Temp files are unique per task, so no row overwrote another
+            self.assertEqual(uploads[target], f"/info/{i}.png+/audio/{i}.m4a".encode())
+
+    @patch("youtube_to_docs.video.create_video", return_value=True)
+    def test_process_videos_uses_local_files_in_place(self, mock_create):
+        storage = LocalStorage()
+        info_path = os.path.join(self.temp_dir, "info.png")
+        audio_path = os.path.join(self.temp_dir, "summary.m4a")
+        for path in (info_path, audio_path):
+            with open(path, "wb") as f:
+                f.write(b"data")
+        df = pl.DataFrame(
+            {
+                "Summary Infographic File m1 img": [info_path],
+                "Summary Audio File m1 tts File": [audio_path],
+            }
+        )
+
+        with patch.object(storage, "upload_file", return_value="link"):
+            updated_df = process_videos(df, storage, base_dir=self.temp_dir)
+
+        self.assertEqual(updated_df["Video File"][0], "link")
+        # ffmpeg reads the originals, which are left alone afterwards
+        image_arg, audio_arg, _ = mock_create.call_args[0]
+        self.assertEqual(image_arg, os.path.abspath(info_path))
+        self.assertEqual(audio_arg, os.path.abspath(audio_path))
+        self.assertTrue(os.path.exists(info_path))
+        self.assertTrue(os.path.exists(audio_path))
+
     def test_process_videos(self):
         # Mock Storage
         mock_storage = MagicMock(spec=Storage)
         mock_storage.exists.return_value = True
-        mock_storage.read_bytes.return_value = b"data"
+        mock_storage.get_local_file.side_effect = _download_side_effect(
+            lambda path: b"data"
+        )
         mock_storage.upload_file.return_value = "http://mock-link/video.mp4"
 
         # Mock create_video to avoid actual ffmpeg call
@@ -98,7 +318,7 @@ class TestVideo(unittest.TestCase):
 
             mock_create.assert_called_once()
             mock_storage.ensure_directory.assert_called()
-            mock_storage.read_bytes.assert_called()
+            mock_storage.get_local_file.assert_called()
             mock_storage.upload_file.assert_called()
 
 
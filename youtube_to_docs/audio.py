@@ -0,0 +1,467 @@
+"""Audio helpers built on ffmpeg.
+
+Covers the three audio paths of the pipeline: preparing downloaded audio for
+speech-to-text (downmix, resample, optional silence trimming with an offset
+map back to the original timeline), encoding synthesized TTS PCM into the
+configured output format, and the size-capped local ``AudioCache`` of
+downloaded audio.
+"""
+
+import bisect
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+from youtube_to_docs.srt import Cues, to_ms
+from youtube_to_docs.utils import get_cache_dir
+
+# Speech models are trained on narrowband/wideband audio; anything above
+# 16 kHz mono only adds upload bytes and decode time.
+STT_SAMPLE_RATE = 16000
+
+# Codec name -> (file extension, ffmpeg encoder arguments)
+STT_CODECS = {
+    "flac": ("flac", ["-c:a", "flac", "-sample_fmt", "s16"]),
+    "opus": ("ogg", ["-c:a", "libopus", "-b:a", "24k", "-application", "voip"]),
+}
+
+# TTS output format -> (file extension, ffmpeg encoder arguments, MIME type).
+# "wav" is written directly, without ffmpeg.
+TTS_FORMATS = {
+    "aac": ("m4a", ["-c:a", "aac", "-b:a", "64k"], "audio/mp4"),
+    "mp3": ("mp3", ["-c:a", "libmp3lame", "-b:a", "64k"], "audio/mpeg"),
+    "opus": (
+        "opus",
+        ["-c:a", "libopus", "-b:a", "32k", "-application", "voip"],
+        "audio/ogg",
+    ),
+    "wav": ("wav", [], "audio/wav"),
+}
+DEFAULT_TTS_FORMAT = "aac"
+
+# Padding (seconds) kept on each side of a removed silence so word onsets and
+# trailing consonants are not clipped.
+SILENCE_PADDING_SEC = 0.25
+
+# Upper bound on the persistent audio cache (YTD_AUDIO_CACHE_MAX_BYTES)
+DEFAULT_AUDIO_CACHE_MAX_BYTES = 2 * 1024**3
+
+
+@dataclass
+class PreparedAudio:
+    """Result of :func:`prepare_stt_audio`.
+
+    ``segments`` maps the processed timeline back to the original one. Each
+    entry is ``(processed_start, original_start, length)`` in seconds. An empty
+    list means timestamps are already on the original timeline.
+    """
+
+    path: str
+    duration_seconds: Optional[float] = None
+    segments: List[Tuple[float, float, float]] = field(default_factory=list)
+
+    def to_original_time(self, seconds: float) -> float:
+        """Maps a timestamp on the processed audio to the original audio."""
+        if not self.segments:
+            return seconds
+        starts = [s[0] for s in self.segments]
+        idx = max(bisect.bisect_right(starts, seconds) - 1, 0)
+        processed_start, original_start, length = self.segments[idx]
+        return original_start + min(max(seconds - processed_start, 0.0), length)
+
+    def remap_srt(self, srt_content: str) -> str:
+        """Rewrites every SRT timestamp onto the original timeline."""
+        if not self.segments or not srt_content:
+            return srt_content
+
+        def _remap(ms: int) -> int:
+            return to_ms(self.to_original_time(ms / 1000))
+
+        return Cues.parse(srt_content).map_times(_remap).to_srt()
+
+
+def _get_ffmpeg_path() -> str:
+    try:
+        import static_ffmpeg
+
+        static_ffmpeg.add_paths()
+    except ImportError as e:
+        raise ImportError(
+            "Missing dependencies for audio/video processing. "
+            'Please run with: uvx "youtube-to-docs[all]"'
+        ) from e
+    return "ffmpeg"
+
+
+def ensure_tts_encoder(audio_format: str) -> None:
+    """Raises ImportError when ``audio_format`` needs ffmpeg and it is missing.
+
+    Only ``wav`` is written without ffmpeg, which ships with the ``video``
+    extra (static-ffmpeg).
+    """
+    if audio_format == "wav":
+        return
+    try:
+        _get_ffmpeg_path()
+    except ImportError as e:
+        raise ImportError(
+            f"--tts-format {audio_format} needs ffmpeg. Install it with "
+            "`pip install '.[video]'`, or use --tts-format wav."
+        ) from e
+
+
+def _pcm_encoder_command(
+    rate: int, channels: int, output_path: str, audio_format: str
+) -> List[str]:
+    _, encoder_args, _ = TTS_FORMATS[audio_format]
+    return [
+        _get_ffmpeg_path(),
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "s16le",
+        "-ar",
+        str(rate),
+        "-ac",
+        str(channels),
+        "-i",
+        "pipe:0",
+        *encoder_args,
+        output_path,
+    ]
+
+
+def encode_pcm_stream(
+    chunks: Iterable[bytes],
+    rate: int,
+    output_path: str,
+    audio_format: str,
+    channels: int = 1,
+) -> int:
+    """Encodes 16-bit PCM chunks with ffmpeg as they arrive.
+
+    The PCM is piped to ffmpeg's stdin, so the uncompressed audio is never
+    written to disk or held in memory as a whole. Returns the number of PCM
+    bytes encoded; nothing is written when there is no audio.
+    """
+    process: Optional[subprocess.Popen] = None
+    written = 0
+    # ffmpeg's diagnostics go to a temporary file: a stderr pipe that is not
+    # read while stdin is written can fill up and deadlock both processes.
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                if process is None:
+                    process = subprocess.Popen(
+                        _pcm_encoder_command(rate, channels, output_path, audio_format),
+                        stdin=subprocess.PIPE,
+                        stderr=stderr_file,
+                    )
+                assert process.stdin is not None
+                process.stdin.write(chunk)
+                written += len(chunk)
+        except BaseException:
+            if process is not None:
+                process.kill()
+                process.wait()
+            raise
+        if process is None:
+            return 0
+        process.communicate()
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            raise RuntimeError(
+                f"ffmpeg could not encode {audio_format} audio: "
+                f"{stderr_file.read().decode('utf-8', errors='replace').strip()}"
+            )
+    return written
+
+
+def _parse_duration(ffmpeg_stderr: str) -> Optional[float]:
+    """Parses the input ``Duration: HH:MM:SS.xx`` line from ffmpeg output."""
+    match = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", ffmpeg_stderr)
+    if not match:
+        return None
+    hrs, mins, secs = match.groups()
+    return int(hrs) * 3600 + int(mins) * 60 + float(secs)
+
+
+def _parse_silences(ffmpeg_stderr: str) -> List[Tuple[float, Optional[float]]]:
+    """Parses ``silencedetect`` output into (start, end) pairs.
+
+    A trailing silence that runs to the end of the file has no ``silence_end``
+    line, so its end is returned as None.
+    """
+    silences: List[Tuple[float, Optional[float]]] = []
+    start: Optional[float] = None
+    for line in ffmpeg_stderr.splitlines():
+        match = re.search(r"silence_start:\s*(-?[\d.]+)", line)
+        if match:
+            start = max(float(match.group(1)), 0.0)
+            continue
+        match = re.search(r"silence_end:\s*([\d.]+)", line)
+        if match and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+    if start is not None:
+        silences.append((start, None))
+    return silences
+
+
+def _keep_segments(
+    silences: List[Tuple[float, Optional[float]]],
+    total_duration: float,
+    padding: float = SILENCE_PADDING_SEC,
+) -> List[Tuple[float, float]]:
+    """Returns the (start, end) spans of the original audio that are kept."""
+    keep: List[Tuple[float, float]] = []
+    cursor = 0.0
+    for start, end in silences:
+        end = total_duration if end is None else end
+        cut_start = start + padding if start > 0 else 0.0
+        cut_end = end - padding if end < total_duration else total_duration
+        if cut_end <= cut_start:
+            continue
+        if cut_start > cursor:
+            keep.append((cursor, cut_start))
+        cursor = cut_end
+    if cursor < total_duration:
+        keep.append((cursor, total_duration))
+    return keep
+
+
+def detect_silences(
+    audio_path: str,
+    min_silence_seconds: float = 2.0,
+    noise_db: int = -40,
+) -> Tuple[Optional[float], List[Tuple[float, Optional[float]]]]:
+    """Runs ffmpeg ``silencedetect`` and returns (duration, silences)."""
+    ffmpeg = _get_ffmpeg_path()
+    command = [
+        ffmpeg,
+        "-hide_banner",
+        "-nostats",
+        "-i",
+        audio_path,
+        "-af",
+        f"silencedetect=noise={noise_db}dB:d={min_silence_seconds}",
+        "-f",
+        "null",
+        "-",
+    ]
+    result = subprocess.run(command, check=True, capture_output=True, text=True)
+    return _parse_duration(result.stderr), _parse_silences(result.stderr)
+
+
+def prepare_stt_audio(
+    audio_path: str,
+    output_dir: str,
+    codec: Optional[str] = None,
+    trim_silence: Optional[bool] = None,
+    min_silence_seconds: float = 2.0,
+) -> PreparedAudio:
+    """Writes a mono 16 kHz copy of ``audio_path`` for speech-to-text.
+
+    ``codec`` is ``flac`` (default, lossless) or ``opus`` and falls back to the
+    ``YTD_STT_AUDIO_CODEC`` environment variable. When ``trim_silence`` is set
+    (or ``YTD_STT_TRIM_SILENCE`` is truthy) silences longer than
+    ``min_silence_seconds`` are removed and the returned offset map can be used
+    to put SRT timestamps back on the original timeline.
+
+    The original file is returned unchanged on any failure, so STT still runs,
+    and when the copy would be no smaller than the original (unless silences
+    were trimmed).
+    """
+    if codec is None:
+        codec = os.environ.get("YTD_STT_AUDIO_CODEC", "flac").lower()
+    if trim_silence is None:
+        trim_silence = os.environ.get("YTD_STT_TRIM_SILENCE", "").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+
+    if codec not in STT_CODECS:
+        print(f"Warning: Unknown STT audio codec '{codec}', using flac.")
+        codec = "flac"
+    ext, codec_args = STT_CODECS[codec]
+
+    base = os.path.splitext(os.path.basename(audio_path))[0]
+    output_path = os.path.join(output_dir, f"{base}.stt.{ext}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        ffmpeg = _get_ffmpeg_path()
+
+        filter_args: List[str] = []
+        segments: List[Tuple[float, float, float]] = []
+        duration: Optional[float] = None
+
+        if trim_silence:
+            duration, silences = detect_silences(audio_path, min_silence_seconds)
+            if duration and silences:
+                keep = _keep_segments(silences, duration)
+                processed = 0.0
+                for start, end in keep:
+                    segments.append((processed, start, end - start))
+                    processed += end - start
+                expr = "+".join(
+                    f"between(t,{start:.3f},{end:.3f})" for start, end in keep
+                )
+                filter_args = ["-af", f"aselect='{expr}',asetpts=N/SR/TB"]
+                removed = duration - processed
+                print(
+                    f"Trimming {removed:.1f}s of silence "
+                    f"({len(silences)} spans) before STT."
+                )
+                duration = processed
+
+        command = [
+            ffmpeg,
+            "-y",
+            "-loglevel",
+            "error",
+            "-i",
+            audio_path,
+            *filter_args,
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            str(STT_SAMPLE_RATE),
+            *codec_args,
+            output_path,
+        ]
+        subprocess.run(command, check=True, capture_output=True)
+    except Exception as e:
+        print(f"Warning: STT audio preprocessing failed, using original audio: {e}")
+        return PreparedAudio(path=audio_path)
+
+    original_size = os.path.getsize(audio_path)
+    new_size = os.path.getsize(output_path)
+    if not segments and new_size >= original_size:
+        # A low-bitrate download can be smaller than its lossless 16 kHz copy;
+        # uploading the original is then cheaper and loses nothing
+        os.remove(output_path)
+        print("Original audio is smaller than the STT copy; uploading it as is.")
+        return PreparedAudio(path=audio_path, duration_seconds=duration)
+    if original_size:
+        print(
+            f"Prepared STT audio ({codec}, mono {STT_SAMPLE_RATE} Hz): "
+            f"{new_size / 1_048_576:.1f} MB "
+            f"({new_size / original_size:.0%} of original)"
+        )
+    return PreparedAudio(path=output_path, duration_seconds=duration, segments=segments)
+
+
+def audio_cache_max_bytes() -> int:
+    """Returns YTD_AUDIO_CACHE_MAX_BYTES (0 disables the audio cache)."""
+    value = os.environ.get(
+        "YTD_AUDIO_CACHE_MAX_BYTES", str(DEFAULT_AUDIO_CACHE_MAX_BYTES)
+    )
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        print(f"Warning: Invalid YTD_AUDIO_CACHE_MAX_BYTES '{value}', using default.")
+        return DEFAULT_AUDIO_CACHE_MAX_BYTES
+
+
+class AudioCache:
+    """Size-bounded local cache of downloaded audio, shared across runs.
+
+    Files are keyed by video ID and acquisition profile and live under
+    ``audio/`` in the cache directory (``YTD_CACHE_DIR``). Reading a file marks
+    it as recently used; once the cache grows past ``max_bytes`` the least
+    recently used files are evicted. ``max_bytes=0`` disables the cache.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: Optional[int] = None
+    ):
+        self.max_bytes = audio_cache_max_bytes() if max_bytes is None else max_bytes
+        self._directory = directory
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            self._directory = get_cache_dir("audio")
+        os.makedirs(self._directory, exist_ok=True)
+        return self._directory
+
+    def path(self, video_id: str, profile: str, ext: str = "m4a") -> str:
+        return os.path.join(self.directory, f"{video_id}.{profile}.{ext}")
+
+    def get(self, video_id: str, profile: str, ext: str = "m4a") -> Optional[str]:
+        """Returns the cached file for ``video_id``/``profile``, if any."""
+        if not self.enabled:
+            return None
+        path = self.path(video_id, profile, ext)
+        if not os.path.exists(path):
+            return None
+        try:
+            # The modification time doubles as the LRU timestamp
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def put(self, source_path: str, video_id: str, profile: str) -> str:
+        """Moves ``source_path`` into the cache and returns its new path.
+
+        The source is returned unchanged when the cache is disabled, the file
+        alone exceeds the cap, or the move fails.
+        """
+        if not self.enabled:
+            return source_path
+        try:
+            if os.path.getsize(source_path) > self.max_bytes:
+                return source_path
+            ext = os.path.splitext(source_path)[1].lstrip(".") or "m4a"
+            path = self.path(video_id, profile, ext)
+            if os.path.abspath(source_path) != os.path.abspath(path):
+                shutil.move(source_path, path)
+            os.utime(path)
+        except OSError as e:
+            print(f"Warning: Could not cache audio for {video_id}: {e}")
+            return source_path
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """Removes least recently used files until the cap is met.
+
+        Returns the number of files removed. ``keep`` is never removed.
+        """
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if keep and os.path.abspath(path) == os.path.abspath(keep):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -6,10 +6,9 @@ import subprocess
 import tempfile
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 import requests
-from rich import print as rprint
 
 from youtube_to_docs.providers import (
     BaseProvider,
@@ -31,8 +30,10 @@ except ImportError:
 
 
 from youtube_to_docs.prices import PRICES
+from youtube_to_docs.srt import CueBuilder, Cues, format_timestamp
 from youtube_to_docs.utils import (
     add_question_numbers,
+    file_sha256,
     get_gcp_client,
     normalize_model_name,
 )
@@ -231,68 +232,18 @@ class GeminiProvider(
     def generate_speech(
         self, text: str, voice: str, language_code: Optional[str] = None, **kwargs
     ) -> Tuple[bytes, int]:
-        try:
-            from google import genai
-            from google.genai import types
-
-            api_key = os.environ.get("GEMINI_API_KEY")
-            if not api_key:
-                print("Error: GEMINI_API_KEY environment variable not set.")
-                return b"", 0
-
-            client = genai.Client(api_key=api_key)
-
-            # Gemini TTS has limits. We chunk the text and concatenate the results.
-            # Using 5000 chars as a safe chunk size (similar to GCP).
-            text_bytes = text.encode("utf-8")
-            chunk_size = 4800
-
-            if len(text_bytes) <= 5000:
-                chunks = [text]
-            else:
-                from youtube_to_docs.tts import _chunk_text_by_bytes
-
-                chunks = _chunk_text_by_bytes(text, chunk_size)
+        from youtube_to_docs.tts import generate_speech
 
-            all_audio = b""
-            for i, chunk in enumerate(chunks):
-                if len(chunks) > 1:
-                    rprint(f"  Synthesizing Gemini chunk {i + 1}/{len(chunks)}...")
+        return generate_speech(text, self.model_name, voice, language_code)
 
-                response = client.models.generate_content(
-                    model=self.model_name,
-                    contents=chunk,
-                    config=types.GenerateContentConfig(
-                        response_modalities=["AUDIO"],
-                        speech_config=types.SpeechConfig(
-                            language_code=language_code,
-                            voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                    voice_name=voice,
-                                )
-                            ),
-                        ),
-                    ),
-                )
-
-                if (
-                    response.candidates
-                    and response.candidates[0].content
-                    and response.candidates[0].content.parts
-                    and response.candidates[0].content.parts[0].inline_data
-                    and response.candidates[0].content.parts[0].inline_data.data
-                ):
-                    all_audio += (
-                        response.candidates[0].content.parts[0].inline_data.data
-                    )
-                else:
-                    print(f"Error: No audio data in response for chunk {i + 1}.")
-
-            return all_audio, 24000
+    def generate_speech_stream(
+        self, text: str, voice: str, language_code: Optional[str] = None, **kwargs
+    ) -> Tuple[Iterator[bytes], int]:
+        from youtube_to_docs.tts import generate_speech_gemini_stream
 
-        except Exception as e:
-            print(f"Error generating Gemini speech: {e}")
-            return b"", 0
+        return generate_speech_gemini_stream(
+            text, self.model_name, voice, language_code
+        )
 
     def translate(self, text: str, target_lang: str, **kwargs) -> str:
         prompt = (
@@ -769,74 +720,16 @@ class GCPProvider(BaseProvider, STTProvider, TTSProvider, TranslationProvider):
     def generate_speech(
         self, text: str, voice: str, language_code: Optional[str] = None, **kwargs
     ) -> Tuple[bytes, int]:
-        try:
-            from google.cloud import texttospeech
-        except ImportError:
-            print(
-                "Error: google-cloud-texttospeech is required for GCP TTS models. "
-                "Install with `pip install '.[gcp]'`"
-            )
-            return b"", 0
-
-        try:
-            client = get_gcp_client(
-                texttospeech.TextToSpeechClient, "GCP Text-to-Speech"
-            )
-            if client is None:
-                return b"", 0
-
-            if language_code:
-                full_voice_name = f"{language_code}-Chirp3-HD-{voice}"
-            else:
-                full_voice_name = f"en-US-Chirp3-HD-{voice}"
+        from youtube_to_docs.tts import generate_speech_gcp
 
-            voice_params = texttospeech.VoiceSelectionParams(
-                language_code=language_code or "en-US",
-                name=full_voice_name,
-            )
-
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.LINEAR16,
-                sample_rate_hertz=24000,
-            )
-
-            text_bytes = text.encode("utf-8")
-            rprint(
-                f"[cyan]GCP TTS: input text length: {len(text)} chars, "
-                f"{len(text_bytes)} bytes[/cyan]"
-            )
-            if len(text_bytes) <= 5000:
-                input_text = texttospeech.SynthesisInput(text=text)
-                response = client.synthesize_speech(
-                    input=input_text,
-                    voice=voice_params,
-                    audio_config=audio_config,
-                )
-                return response.audio_content, 24000
-            else:
-                rprint(
-                    f"[yellow]Text is long ({len(text_bytes)} bytes). "
-                    "Chunking for GCP TTS...[/yellow]"
-                )
-                from youtube_to_docs.tts import _chunk_text_by_bytes
-
-                chunks = _chunk_text_by_bytes(text, 4800)
-                all_audio = b""
-                for i, chunk in enumerate(chunks):
-                    rprint(f"  Synthesizing chunk {i + 1}/{len(chunks)}...")
-                    input_text = texttospeech.SynthesisInput(text=chunk)
-                    response = client.synthesize_speech(
-                        input=input_text,
-                        voice=voice_params,
-                        audio_config=audio_config,
-                    )
-                    all_audio += response.audio_content
+        return generate_speech_gcp(text, voice, language_code)
 
-                return all_audio, 24000
+    def generate_speech_stream(
+        self, text: str, voice: str, language_code: Optional[str] = None, **kwargs
+    ) -> Tuple[Iterator[bytes], int]:
+        from youtube_to_docs.tts import generate_speech_gcp_stream
 
-        except Exception as e:
-            print(f"Error generating speech with GCP TTS: {e}")
-            return b"", 0
+        return generate_speech_gcp_stream(text, voice, language_code)
 
     def translate(self, text: str, target_lang: str, **kwargs) -> str:
         from youtube_to_docs.translate import _translate_gcp
@@ -844,8 +737,24 @@ class GCPProvider(BaseProvider, STTProvider, TTSProvider, TranslationProvider):
         translated, _, _ = _translate_gcp(text, target_lang)
         return translated
 
+    def translate_batch(
+        self, texts: List[str], target_lang: str, **kwargs
+    ) -> List[str]:
+        from youtube_to_docs.translate import _translate_gcp_batch
+
+        return _translate_gcp_batch(texts, target_lang)
+
+    def translate_documents(
+        self, texts: List[str], target_lang: str, **kwargs
+    ) -> List[str]:
+        from youtube_to_docs.translate import _translate_gcp_documents
+
+        return _translate_gcp_documents(texts, target_lang)
+
 
 class AWSProvider(BaseProvider, STTProvider, TTSProvider, TranslationProvider):
+    supports_background_stt = True
+
     def transcribe(
         self,
         audio_path: str,
@@ -858,65 +767,35 @@ class AWSProvider(BaseProvider, STTProvider, TTSProvider, TranslationProvider):
             self.model_name, audio_path, url, language, duration_seconds
         )
 
+    def submit_transcription(
+        self,
+        audio_path: str,
+        url: str,
+        language: str = "en",
+        duration_seconds: Optional[float] = None,
+        **kwargs,
+    ) -> bool:
+        if self.model_name != "aws-transcribe":
+            return False
+        return _submit_aws_transcription(audio_path, url, language)
+
     def generate_speech(
         self, text: str, voice: str, language_code: Optional[str] = None, **kwargs
     ) -> Tuple[bytes, int]:
-        try:
-            import boto3
-            from botocore.exceptions import BotoCoreError, ClientError
-        except ImportError:
-            print(
-                "Error: boto3 is required for AWS Polly. "
-                "Install with `pip install boto3`"
-            )
-            return b"", 0
+        from youtube_to_docs.tts import generate_speech_aws_polly
 
-        try:
-            polly = boto3.client("polly")
-            chunk_size = 2000
-            text_bytes = text.encode("utf-8")
-
-            rprint(
-                f"[cyan]AWS Polly: input text length: {len(text)} chars, "
-                f"{len(text_bytes)} bytes[/cyan]"
-            )
-
-            audio_stream = b""
-            from youtube_to_docs.tts import _chunk_text_by_bytes
-
-            if len(text_bytes) <= chunk_size:
-                chunks = [text]
-            else:
-                rprint(
-                    f"[yellow]Text is long ({len(text_bytes)} bytes). "
-                    "Chunking for AWS Polly...[/yellow]"
-                )
-                chunks = _chunk_text_by_bytes(text, chunk_size)
-
-            for i, chunk in enumerate(chunks):
-                if len(chunks) > 1:
-                    rprint(f"  Synthesizing chunk {i + 1}/{len(chunks)}...")
-
-                response = polly.synthesize_speech(
-                    Text=chunk,
-                    OutputFormat="pcm",
-                    VoiceId=voice,
-                    Engine=kwargs.get("engine", "long-form"),
-                )
-                if "AudioStream" in response:
-                    with response["AudioStream"] as stream:
-                        audio_stream += stream.read()
-                else:
-                    print("Error: No AudioStream in Polly response")
+        return generate_speech_aws_polly(
+            text, voice, engine=kwargs.get("engine", "long-form")
+        )
 
-            return audio_stream, 16000
+    def generate_speech_stream(
+        self, text: str, voice: str, language_code: Optional[str] = None, **kwargs
+    ) -> Tuple[Iterator[bytes], int]:
+        from youtube_to_docs.tts import generate_speech_aws_polly_stream
 
-        except (BotoCoreError, ClientError) as error:
-            print(f"Error generating speech with AWS Polly: {error}")
-            return b"", 0
-        except Exception as e:
-            print(f"Error generating speech with AWS Polly: {e}")
-            return b"", 0
+        return generate_speech_aws_polly_stream(
+            text, voice, engine=kwargs.get("engine", "long-form")
+        )
 
     def translate(self, text: str, target_lang: str, **kwargs) -> str:
         from youtube_to_docs.translate import _translate_aws
@@ -924,6 +803,20 @@ class AWSProvider(BaseProvider, STTProvider, TTSProvider, TranslationProvider):
         translated, _, _ = _translate_aws(text, target_lang)
         return translated
 
+    def translate_batch(
+        self, texts: List[str], target_lang: str, **kwargs
+    ) -> List[str]:
+        from youtube_to_docs.translate import _translate_aws_batch
+
+        return _translate_aws_batch(texts, target_lang)
+
+    def translate_documents(
+        self, texts: List[str], target_lang: str, **kwargs
+    ) -> List[str]:
+        from youtube_to_docs.translate import _translate_aws_documents
+
+        return _translate_aws_documents(texts, target_lang)
+
 
 def _query_llm(model_name: str, prompt: str) -> Tuple[str, int, int]:
     """
@@ -1016,45 +909,35 @@ def _parse_gcp_time(time_str: str) -> float:
     return float(time_str.replace("s", ""))
 
 
-def _format_srt_time(seconds: float) -> str:
-    """Formats seconds into SRT timestamp format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds * 1000) % 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
-
-
 def _process_gcp_batch_result(
     batch_result: Any,
     storage_client: Any,
     offset_seconds: float,
-    srt_counter_start: int,
-) -> Tuple[str, List[str], int]:
+) -> Optional[Tuple[str, Cues]]:
     """
     Processes a single file result from a BatchRecognizeResponse.
-    Returns (transcript_text, srt_entries_list, next_srt_counter).
+    Returns (transcript_text, cues), which are empty for a silent chunk, or
+    None if the chunk failed.
     """
 
-    transcript_text = ""
-    srt_entries = []
-    next_ctr = srt_counter_start
-
     if batch_result.error and batch_result.error.code != 0:
         error_msg = batch_result.error.message or "Unknown error"
         print(f"Error in chunk result: {error_msg}")
-        return "", [], next_ctr
+        return None
 
     # Check for inline result first
     if batch_result.inline_result and batch_result.inline_result.transcript:
         results_list = batch_result.inline_result.transcript.results
-        return _process_alternatives(results_list, offset_seconds, srt_counter_start)
+        return _process_alternatives(results_list, offset_seconds)
 
     # Fallback to GCS output
     output_uri = batch_result.uri
     if not output_uri:
+        if batch_result.inline_result:
+            # Inline result of a silent chunk: nothing was recognized
+            return "", Cues()
         print("Error: No output URI or inline result for chunk.")
-        return "", [], next_ctr
+        return None
 
     try:
         bucket_name_out = output_uri.split("/")[2]
@@ -1074,32 +957,30 @@ def _process_gcp_batch_result(
                 else:
                     print(f"Failed to download transcript: {e}")
 
-        if json_content:
-            transcript_json = json.loads(json_content)
-            results_list = transcript_json.get("results", [])
-            transcript_text, srt_entries, next_ctr = _process_alternatives(
-                results_list, offset_seconds, srt_counter_start
-            )
+        if json_content is None:
+            return None
+        transcript_json = json.loads(json_content)
+        results_list = transcript_json.get("results", [])
+        processed = _process_alternatives(results_list, offset_seconds)
 
-            # Cleanup output blob
-            try:
-                blob_out.delete()
-            except Exception:
-                pass  # Best-effort cleanup of temporary GCS blob
+        # Cleanup output blob
+        try:
+            blob_out.delete()
+        except Exception:
+            pass  # Best-effort cleanup of temporary GCS blob
+        return processed
 
     except Exception as e:
         print(f"Error processing GCS output: {e}")
-
-    return transcript_text, srt_entries, next_ctr
+        return None
 
 
 def _process_alternatives(
-    results_list: List[Any], current_offset_sec: float, current_srt_idx: int
-) -> Tuple[str, List[str], int]:
-    """Helper to process a list of transcript results into text and SRT entries."""
+    results_list: List[Any], current_offset_sec: float
+) -> Tuple[str, Cues]:
+    """Helper to process a list of transcript results into text and SRT cues."""
     full_text_parts = []
-    srt_entries = []
-    srt_counter = current_srt_idx
+    cues = Cues()
 
     for result in results_list:
         alternatives = (
@@ -1122,9 +1003,8 @@ def _process_alternatives(
             else (alt.words if hasattr(alt, "words") else [])
         )
 
-        current_segment_words = []
-        current_segment_len = 0
-
+        # Cues never span two results
+        builder = CueBuilder(cues=cues)
         for word_info in words:
             word = (
                 word_info.get("word", "")
@@ -1148,41 +1028,14 @@ def _process_alternatives(
                 )
             )
 
-            start_sec = _parse_gcp_time(str(start_raw)) + current_offset_sec
-            end_sec = _parse_gcp_time(str(end_raw)) + current_offset_sec
-
-            current_segment_words.append((word, start_sec, end_sec))
-            current_segment_len += len(word) + 1
-
-            if (
-                word.endswith(".")
-                or word.endswith("?")
-                or word.endswith("!")
-                or current_segment_len > 80
-            ):
-                if current_segment_words:
-                    seg_text = " ".join([w[0] for w in current_segment_words])
-                    seg_start = _format_srt_time(current_segment_words[0][1])
-                    seg_end = _format_srt_time(current_segment_words[-1][2])
-
-                    srt_entries.append(
-                        f"{srt_counter}\n{seg_start} --> {seg_end}\n{seg_text}\n"
-                    )
-                    srt_counter += 1
-                    current_segment_words = []
-                    current_segment_len = 0
-
-        # Flush remaining
-        if current_segment_words:
-            seg_text = " ".join([w[0] for w in current_segment_words])
-            seg_start = _format_srt_time(current_segment_words[0][1])
-            seg_end = _format_srt_time(current_segment_words[-1][2])
-            srt_entries.append(
-                f"{srt_counter}\n{seg_start} --> {seg_end}\n{seg_text}\n"
+            builder.add_word(
+                word,
+                _parse_gcp_time(str(start_raw)) + current_offset_sec,
+                _parse_gcp_time(str(end_raw)) + current_offset_sec,
             )
-            srt_counter += 1
+        builder.flush()
 
-    return " ".join(full_text_parts), srt_entries, srt_counter
+    return " ".join(full_text_parts), cues
 
 
 def _transcribe_gcp(
@@ -1270,24 +1123,109 @@ def _transcribe_gcp(
     )
 
     full_transcript_parts = []
-    full_srt_entries = []
     total_in_tok = 0
     total_out_tok = 0
 
+    from youtube_to_docs.stt import (
+        STTChunkCache,
+        STTJournal,
+        ensure_gcs_staging_lifecycle,
+        staging_audio_hash,
+        staging_object_fresh,
+        staging_ttl_days,
+    )
+
+    journal = STTJournal()
+    journal_key = STTJournal.key("gcp", model_name, url, language)
+    entry = journal.get(journal_key)
+
+    # Map gcs_uri -> (chunk_index, chunk_offset, blob_name)
+    chunk_map: Dict[str, Tuple[int, float, str]] = {}
+    operations: List[Dict[str, Any]] = []
+    # Chunk index -> (text, cues), from the cache or this run
+    chunk_results: Dict[int, Tuple[str, Cues]] = {}
+
+    num_chunks = 1
+    chunk_cache = STTChunkCache()
+    audio_hash = ""
     if should_chunk:
-        print(
-            f"Audio is long ({duration_seconds}s). "
-            "Chunking and processing in parallel..."
-        )
         assert duration_seconds is not None
+        num_chunks = int((duration_seconds + CHUNK_SIZE_SEC - 1) // CHUNK_SIZE_SEC)
+        try:
+            audio_hash = file_sha256(audio_path)
+        except OSError as e:
+            print(f"Warning: Could not hash audio for chunk caching: {e}")
+        if audio_hash:
+            for i in range(num_chunks):
+                cached = chunk_cache.get(
+                    audio_hash, model_name, language, i, i * CHUNK_SIZE_SEC
+                )
+                if cached is not None:
+                    chunk_results[i] = cached
+            if chunk_results:
+                print(
+                    f"Reusing {len(chunk_results)} of {num_chunks} chunk transcripts "
+                    "from a previous run."
+                )
+
+    # Content-addressed staging (opt-in via YTD_STT_STAGING_TTL_DAYS) lets
+    # reruns and other models reuse audio that is already in the bucket, once
+    # an expiry rule is confirmed on it
+    staging_hash = ""
+    if staging_ttl_days():
+        staging_hash = audio_hash or staging_audio_hash(audio_path)
+    keep_staged = bool(staging_hash) and ensure_gcs_staging_lifecycle(bucket, "temp/")
+
+    def _staged(blob_name: str) -> bool:
+        if not keep_staged:
+            return False
+        blob = bucket.get_blob(blob_name)
+        # Objects close to expiring are uploaded again, resetting their age
+        if blob is not None and staging_object_fresh(blob.time_created):
+            print(f"Reusing staged audio gs://{bucket_name}/{blob_name}")
+            return True
+        return False
+
+    if entry and entry.get("chunks"):
+        # A previous run already uploaded the audio and submitted operations
+        print(f"Re-attaching to GCP STT operation(s) from a previous run for {url}...")
+        for chunk in entry["chunks"]:
+            chunk_map[chunk["uri"]] = (chunk["index"], chunk["offset"], chunk["blob"])
+        operations = entry.get("operations", [])
+        use_inline = entry.get("inline", False)
+        keep_staged = entry.get("keep_staged", False)
+    else:
+        use_inline = bool(
+            not should_chunk
+            and duration_seconds is not None
+            and duration_seconds < 3600
+        )
+
+    if should_chunk:
+        in_flight = {idx for idx, _, _ in chunk_map.values()}
+        missing = [
+            i
+            for i in range(num_chunks)
+            if i not in chunk_results and i not in in_flight
+        ]
+        if missing:
+            print(
+                f"Audio is long ({duration_seconds}s). "
+                f"Chunking and processing {len(missing)} chunk(s) in parallel..."
+            )
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            num_chunks = int((duration_seconds + CHUNK_SIZE_SEC - 1) // CHUNK_SIZE_SEC)
             chunk_files = []
 
-            # 1. Create Chunks (locally)
-            for i in range(num_chunks):
+            # 1. Create Chunks (locally), skipping ones already transcribed
+            for i in missing:
                 start_offset = i * CHUNK_SIZE_SEC
+                if keep_staged:
+                    blob_name = f"temp/ytd_chunk_{staging_hash}_{i:03d}.flac"
+                    if _staged(blob_name):
+                        gcs_uri = f"gs://{bucket_name}/{blob_name}"
+                        chunk_map[gcs_uri] = (i, start_offset, blob_name)
+                        continue
                 # Use .flac for better quality/reliability with STT
                 chunk_path = os.path.join(temp_dir, f"chunk_{i:03d}.flac")
 
@@ -1304,7 +1242,7 @@ def _transcribe_gcp(
                     "-ac",
                     "1",
                     "-ar",
-                    "44100",
+                    "16000",
                     "-loglevel",
                     "error",
                     chunk_path,
@@ -1315,192 +1253,226 @@ def _transcribe_gcp(
                 except subprocess.CalledProcessError as e:
                     print(f"Warning: Failed to create chunk {i}: {e}")
 
-            print(
-                f"Created {len(chunk_files)} chunks. "
-                "Uploading and submitting batches..."
-            )
-
-            # 2. Upload Chunks and Prepare Batches
-            # Max files per request is typically limited (e.g. 5 or 15).
-            # We'll batch requests to be safe.
-            FILES_PER_BATCH = 5
-
-            # Map gcs_uri -> (chunk_index, chunk_offset, blob_object)
-            chunk_map = {}
+            if missing:
+                print(
+                    f"Created {len(chunk_files)} chunks. "
+                    "Uploading and submitting batches..."
+                )
 
+            # 2. Upload Chunks
             for i, local_path, offset in chunk_files:
-                blob_name = f"temp/ytd_chunk_{uuid.uuid4()}.flac"
+                if keep_staged:
+                    blob_name = f"temp/ytd_chunk_{staging_hash}_{i:03d}.flac"
+                else:
+                    blob_name = f"temp/ytd_chunk_{uuid.uuid4()}.flac"
                 blob = bucket.blob(blob_name)
                 blob.upload_from_filename(local_path)
                 gcs_uri = f"gs://{bucket_name}/{blob_name}"
-                chunk_map[gcs_uri] = (i, offset, blob)
-
-            # 3. Submit Batches
-            sorted_uris = sorted(chunk_map.keys(), key=lambda k: chunk_map[k][0])
-            all_results_map = {}  # uri -> (text, srt_entries)
-
-            # Process in batches
-            for b_idx in range(0, len(sorted_uris), FILES_PER_BATCH):
-                batch_uris = sorted_uris[b_idx : b_idx + FILES_PER_BATCH]
-                print(
-                    f"Submitting batch {b_idx // FILES_PER_BATCH + 1} "
-                    f"({len(batch_uris)} files)..."
-                )
-
-                batch_files_metadata = [
-                    speech_v2.BatchRecognizeFileMetadata(uri=u) for u in batch_uris
-                ]
-
-                # Use GCS output config for reliability
-                output_bucket_uri = f"gs://{bucket_name}/transcripts/"
-                recognition_output_config = speech_v2.RecognitionOutputConfig(
-                    gcs_output_config=speech_v2.GcsOutputConfig(uri=output_bucket_uri),
-                )
-
-                request = speech_v2.BatchRecognizeRequest(
-                    recognizer=(
-                        f"projects/{project_id}/locations/{location}/recognizers/_"
-                    ),
-                    config=decoding_config,
-                    files=batch_files_metadata,
-                    recognition_output_config=recognition_output_config,
-                )
-
-                operation = client.batch_recognize(request=request)
-
-                # Wait for this batch to complete
-                # (We could parallelize batches too, but simple batching is usually
-                # fast enough)
-                print("Waiting for batch completion...")
-                response = operation.result()
-
-                # Process results for this batch
-                for uri, result in response.results.items():
-                    if uri in chunk_map:
-                        idx, offset, _ = chunk_map[uri]
-                        all_results_map[uri] = result
-
-            # 4. Stitch Results
-            # Sort by chunk index to ensure order
-            sorted_results = sorted(
-                all_results_map.items(), key=lambda item: chunk_map[item[0]][0]
-            )
-
-            srt_counter = 1
-            for uri, result in sorted_results:
-                idx, offset, blob = chunk_map[uri]
-
-                t_text, t_srt_entries, next_ctr = _process_gcp_batch_result(
-                    result, storage_client, offset, srt_counter
-                )
-
-                # Check for usage metadata in batch result if available
-                # Speech V2 BatchRecognizeResponse metadata is at the top level usually
-                # but can be per-file in some versions/configs.
-                # For now we'll rely on the fact that if it's there, we should sum it.
-                if hasattr(result, "metadata") and result.metadata:
-                    total_in_tok += getattr(result.metadata, "prompt_token_count", 0)
-                    total_out_tok += getattr(
-                        result.metadata, "candidates_token_count", 0
-                    )
-
-                if t_text:
-                    full_transcript_parts.append(t_text)
-                if t_srt_entries:
-                    full_srt_entries.extend(t_srt_entries)
-
-                srt_counter = next_ctr
+                chunk_map[gcs_uri] = (i, offset, blob_name)
+    elif not chunk_map:
+        # Non-chunked (single file)
+        audio_ext = os.path.splitext(audio_path)[1] or ".m4a"
+        if keep_staged:
+            blob_name = f"temp/ytd_audio_{staging_hash}{audio_ext}"
+        else:
+            blob_name = f"temp/ytd_audio_{uuid.uuid4()}{audio_ext}"
 
-                # Cleanup Input Blob
-                try:
-                    blob.delete()
-                except Exception:
-                    pass  # Best-effort cleanup of temporary GCS blob
-
-        # Calculate duration-based cost (represented as pseudo-tokens for main.py)
-        # 1,000,000 pseudo-tokens = 1 minute of audio
-        # Split 50/50 between input and output
-        pseudo_in_tok = 0
-        pseudo_out_tok = 0
-        if duration_seconds:
-            total_pseudo = int(duration_seconds * (1_000_000 / 60))
-            pseudo_in_tok = total_pseudo // 2
-            pseudo_out_tok = total_pseudo - pseudo_in_tok
+        if not _staged(blob_name):
+            try:
+                bucket.blob(blob_name).upload_from_filename(audio_path)
+            except Exception as e:
+                return f"Error uploading to GCS: {e}", "", 0, 0
 
-        return (
-            " ".join(full_transcript_parts),
-            "\n".join(full_srt_entries),
-            pseudo_in_tok,
-            pseudo_out_tok,
+        gcs_uri = f"gs://{bucket_name}/{blob_name}"
+        chunk_map[gcs_uri] = (0, 0.0, blob_name)
+
+    if chunk_map:
+        journal.put(
+            journal_key,
+            {
+                "provider": "gcp",
+                "model": model_name,
+                "url": url,
+                "language": language,
+                "bucket": bucket_name,
+                "inline": use_inline,
+                "keep_staged": keep_staged,
+                "chunks": [
+                    {"uri": u, "index": i, "offset": o, "blob": b}
+                    for u, (i, o, b) in chunk_map.items()
+                ],
+                "operations": operations,
+            },
         )
 
+    if use_inline:
+        recognition_output_config = speech_v2.RecognitionOutputConfig(
+            inline_response_config=speech_v2.InlineOutputConfig(),
+        )
     else:
-        # Non-chunked (single file)
-        use_inline = False
-        if duration_seconds is not None and duration_seconds < 3600:
-            use_inline = True
-
-        blob_name = f"temp/ytd_audio_{uuid.uuid4()}.m4a"
-        blob = bucket.blob(blob_name)
+        # Use GCS output config for reliability
+        output_bucket_uri = f"gs://{bucket_name}/transcripts/"
+        recognition_output_config = speech_v2.RecognitionOutputConfig(
+            gcs_output_config=speech_v2.GcsOutputConfig(uri=output_bucket_uri),
+        )
 
+    def _submit(batch_uris: List[str]) -> Any:
+        request = speech_v2.BatchRecognizeRequest(
+            recognizer=f"projects/{project_id}/locations/{location}/recognizers/_",
+            config=decoding_config,
+            files=[speech_v2.BatchRecognizeFileMetadata(uri=u) for u in batch_uris],
+            recognition_output_config=recognition_output_config,
+        )
+        operation = client.batch_recognize(request=request)
+        operations.append({"name": str(operation.operation.name), "uris": batch_uris})
+        journal.update(journal_key, operations=operations)
+        return operation
+
+    # 3. Submit every batch not already submitted by a previous run
+    # Max files per request is typically limited (e.g. 5 or 15).
+    FILES_PER_BATCH = 5
+    sorted_uris = sorted(chunk_map.keys(), key=lambda k: chunk_map[k][0])
+    submitted = {u for op in operations for u in op["uris"]}
+    remaining = [u for u in sorted_uris if u not in submitted]
+    live_operations: Dict[str, Any] = {}
+    for b_idx in range(0, len(remaining), FILES_PER_BATCH):
+        batch_uris = remaining[b_idx : b_idx + FILES_PER_BATCH]
+        if len(chunk_map) > 1:
+            print(
+                f"Submitting batch {b_idx // FILES_PER_BATCH + 1} "
+                f"({len(batch_uris)} files)..."
+            )
+        else:
+            print(f"Starting transcription for {batch_uris[0]}...", flush=True)
+        operation = _submit(batch_uris)
+        live_operations[operations[-1]["name"]] = operation
+
+    # 4. Wait for every operation (new or re-attached)
+    all_results_map = {}  # uri -> BatchRecognizeFileResult
+    if operations:
+        print("Waiting for batch completion...")
+    for op in list(operations):
         try:
-            blob.upload_from_filename(audio_path)
+            if op["name"] in live_operations:
+                response = live_operations[op["name"]].result()
+            else:
+                response = _wait_gcp_operation(client, op["name"])
         except Exception as e:
-            return f"Error uploading to GCS: {e}", "", 0, 0
-
-        gcs_uri = f"gs://{bucket_name}/{blob_name}"
+            if op["name"] in live_operations:
+                print(f"Error waiting for STT operation {op['name']}: {e}")
+                continue
+            # The old operation is gone; the staged audio is still there
+            print(f"Could not re-attach to {op['name']} ({e}); resubmitting...")
+            try:
+                response = _submit(op["uris"]).result()
+            except Exception as e2:
+                print(f"Error waiting for STT operation: {e2}")
+                continue
+
+        for uri, result in response.results.items():
+            if uri in chunk_map:
+                all_results_map[uri] = result
+
+    # 5. Process results, caching each chunk so a rerun only redoes gaps
+    for uri, result in all_results_map.items():
+        idx, offset, _ = chunk_map[uri]
+
+        processed = _process_gcp_batch_result(result, storage_client, offset)
+
+        # Check for usage metadata in batch result if available
+        # Speech V2 BatchRecognizeResponse metadata is at the top level usually
+        # but can be per-file in some versions/configs.
+        # For now we'll rely on the fact that if it's there, we should sum it.
+        if hasattr(result, "metadata") and result.metadata:
+            total_in_tok += getattr(result.metadata, "prompt_token_count", 0)
+            total_out_tok += getattr(result.metadata, "candidates_token_count", 0)
+
+        if processed is None:
+            continue
+        # Silent chunks are cached too, so a rerun neither resends them nor
+        # reports them as gaps
+        t_text, t_cues = processed
+        chunk_results[idx] = (t_text, t_cues)
+        if audio_hash:
+            chunk_cache.put(
+                audio_hash, model_name, language, idx, offset, t_text, t_cues
+            )
 
-        file_metadata = speech_v2.BatchRecognizeFileMetadata(uri=gcs_uri)
+    # Cleanup input blobs only now that the results are collected
+    # (content-addressed ones are left for reuse and the lifecycle rule)
+    if not keep_staged:
+        for _, _, blob_name in chunk_map.values():
+            try:
+                bucket.blob(blob_name).delete()
+            except Exception:
+                pass  # Best-effort cleanup of temporary GCS blob
+    journal.remove(journal_key)
 
-        if use_inline:
-            recognition_output_config = speech_v2.RecognitionOutputConfig(
-                inline_response_config=speech_v2.InlineOutputConfig(),
-            )
-        else:
-            output_bucket_uri = f"gs://{bucket_name}/transcripts/"
-            recognition_output_config = speech_v2.RecognitionOutputConfig(
-                gcs_output_config=speech_v2.GcsOutputConfig(uri=output_bucket_uri),
-            )
+    if not should_chunk and not all_results_map:
+        return f"Error: No result found for {sorted_uris[0]}", "", 0, 0
 
-        request = speech_v2.BatchRecognizeRequest(
-            recognizer=f"projects/{project_id}/locations/{location}/recognizers/_",
-            config=decoding_config,
-            files=[file_metadata],
-            recognition_output_config=recognition_output_config,
+    # 6. Stitch Results in chunk order (cues are numbered on serialization)
+    full_cues = Cues()
+    gaps = []
+    for idx in range(num_chunks):
+        if idx not in chunk_results:
+            gaps.append(idx)
+            continue
+        t_text, t_cues = chunk_results[idx]
+        if t_text:
+            full_transcript_parts.append(t_text)
+        full_cues.extend(t_cues)
+
+    if should_chunk and gaps:
+        spans = ", ".join(
+            f"{format_timestamp(i * CHUNK_SIZE_SEC * 1000)}-"
+            f"{format_timestamp((i + 1) * CHUNK_SIZE_SEC * 1000)}"
+            for i in gaps
+        )
+        print(
+            f"Warning: {len(gaps)} of {num_chunks} chunks have no transcript "
+            f"({spans}). Rerun to retranscribe only the missing chunks."
         )
 
-        print(f"Starting transcription for {gcs_uri}...", flush=True)
-        operation = client.batch_recognize(request=request)
-        response = operation.result()
+    # Calculate duration-based cost (represented as pseudo-tokens for main.py)
+    # 1,000,000 pseudo-tokens = 1 minute of audio
+    # Split 50/50 between input and output
+    pseudo_in_tok = 0
+    pseudo_out_tok = 0
+    if duration_seconds:
+        total_pseudo = int(duration_seconds * (1_000_000 / 60))
+        pseudo_in_tok = total_pseudo // 2
+        pseudo_out_tok = total_pseudo - pseudo_in_tok
+
+    return (
+        " ".join(full_transcript_parts),
+        full_cues.to_srt(),
+        pseudo_in_tok,
+        pseudo_out_tok,
+    )
 
-        t_text = ""
-        t_srt = ""
 
-        if gcs_uri in response.results:
-            result = response.results[gcs_uri]
-            t_text, t_srt_entries, _ = _process_gcp_batch_result(
-                result, storage_client, 0.0, 1
-            )
-            t_srt = "\n".join(t_srt_entries)
-        else:
-            t_text = f"Error: No result found for {gcs_uri}"
+def _wait_gcp_operation(client: Any, operation_name: str) -> Any:
+    """Polls a batch_recognize operation by name and returns its response."""
+    from google.cloud.speech_v2.types import cloud_speech
 
-        try:
-            blob.delete()
-        except Exception:
-            pass  # Best-effort cleanup of temporary GCS blob
+    from youtube_to_docs.stt import (
+        POLL_BACKOFF,
+        POLL_INITIAL_DELAY_SEC,
+        POLL_MAX_DELAY_SEC,
+    )
 
-        # Calculate duration-based cost (represented as pseudo-tokens for main.py)
-        # 1,000,000 pseudo-tokens = 1 minute of audio
-        # Split 50/50 between input and output
-        pseudo_in_tok = 0
-        pseudo_out_tok = 0
-        if duration_seconds:
-            total_pseudo = int(duration_seconds * (1_000_000 / 60))
-            pseudo_in_tok = total_pseudo // 2
-            pseudo_out_tok = total_pseudo - pseudo_in_tok
+    delay = POLL_INITIAL_DELAY_SEC
+    while True:
+        operation = client.get_operation(request={"name": operation_name})
+        if operation.done:
+            break
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY_SEC)
 
-        return t_text, t_srt, pseudo_in_tok, pseudo_out_tok
+    if operation.HasField("error") and operation.error.code:
+        raise RuntimeError(operation.error.message)
+    return cloud_speech.BatchRecognizeResponse.deserialize(operation.response.value)
 
 
 def _transcribe_aws(
@@ -1534,132 +1506,36 @@ def _transcribe_aws(
             0,
         )
 
-    region = os.environ.get("AWS_REGION", "us-east-1")
-    s3_client = boto3.client("s3", region_name=region)
-    transcribe_client = boto3.client("transcribe", region_name=region)
-
-    job_name = f"ytd_transcribe_{uuid.uuid4()}"
-    s3_key = f"temp_audio/{job_name}.m4a"
-
-    print(f"Uploading audio to s3://{bucket_name}/{s3_key}...")
-    try:
-        s3_client.upload_file(audio_path, bucket_name, s3_key)
-    except ClientError as e:
-        return f"Error uploading to S3: {e}", "", 0, 0
+    from youtube_to_docs.stt import get_aws_transcribe_manager
 
-    s3_uri = f"s3://{bucket_name}/{s3_key}"
-
-    if language == "en":
-        language_code = "en-US"
-    else:
-        # AWS uses different codes sometimes, but en-US, es-ES etc are common
-        # Simple mapping for now
-        language_code = (
-            language if "-" in language else f"{language}-{language.upper()}"
-        )
-
-    print(f"Starting AWS Transcribe job: {job_name}...")
-    try:
-        transcribe_client.start_transcription_job(
-            TranscriptionJobName=job_name,
-            Media={"MediaFileUri": s3_uri},
-            MediaFormat="m4a",
-            LanguageCode=language_code,
-            OutputBucketName=bucket_name,
-            OutputKey=f"transcripts/{job_name}.json",
-            Settings={
-                "ShowAlternatives": False,
-            },
-        )
-    except ClientError as e:
-        return f"Error starting Transcribe job: {e}", "", 0, 0
-
-    # Polling
-    print("Waiting for AWS Transcribe job to complete...")
-    while True:
-        try:
-            status_resp = transcribe_client.get_transcription_job(
-                TranscriptionJobName=job_name
-            )
-            status = status_resp["TranscriptionJob"]["TranscriptionJobStatus"]
-            if status in ["COMPLETED", "FAILED"]:
-                break
-        except ClientError as e:
-            print(f"Error polling job status: {e}")
-        time.sleep(10)
-
-    if status == "FAILED":
-        reason = status_resp["TranscriptionJob"].get("FailureReason", "Unknown failure")
-        return f"AWS Transcribe job failed: {reason}", "", 0, 0
-
-    # Download result
-    transcript_key = f"transcripts/{job_name}.json"
-    print(f"Downloading transcript from s3://{bucket_name}/{transcript_key}...")
-    try:
-        obj = s3_client.get_object(Bucket=bucket_name, Key=transcript_key)
-        transcript_json = json.loads(obj["Body"].read().decode("utf-8"))
-    except Exception as e:
-        return f"Error downloading transcript from S3: {e}", "", 0, 0
-
-    # Cleanup
-    try:
-        s3_client.delete_object(Bucket=bucket_name, Key=s3_key)
-        s3_client.delete_object(Bucket=bucket_name, Key=transcript_key)
-    except Exception as e:
-        print(f"Warning: Cleanup failed: {e}")
-
-    # Parse JSON for text and SRT
-    results = transcript_json.get("results", {})
-    transcript_text = ""
-    transcripts = results.get("transcripts", [])
-    if transcripts:
-        transcript_text = transcripts[0].get("transcript", "")
-
-    # For SRT, we need word-level timestamps
-    items = results.get("items", [])
-    srt_entries = []
-    srt_counter = 1
-
-    current_segment_words = []
-    current_segment_len = 0
-
-    for item in items:
-        if item.get("type") == "punctuation":
-            if current_segment_words:
-                # Add punctuation to the last word
-                word, start, end = current_segment_words.pop()
-                current_segment_words.append(
-                    (word + item["alternatives"][0]["content"], start, end)
-                )
-            continue
+    region = os.environ.get("AWS_REGION", "us-east-1")
+    manager = get_aws_transcribe_manager(bucket_name, region)
 
-        word = item["alternatives"][0]["content"]
-        start_sec = float(item["start_time"])
-        end_sec = float(item["end_time"])
+    # A job may already have been submitted up front by submit_transcription
+    key = (url, language)
+    if not manager.has_job(key):
+        error = manager.submit(key, audio_path, language)
+        if error:
+            return error, "", 0, 0
 
-        current_segment_words.append((word, start_sec, end_sec))
-        current_segment_len += len(word) + 1
+    return manager.wait(key)
 
-        if current_segment_len > 80:
-            seg_text = " ".join([w[0] for w in current_segment_words])
-            seg_start = _format_srt_time(current_segment_words[0][1])
-            seg_end = _format_srt_time(current_segment_words[-1][2])
-            srt_entries.append(
-                f"{srt_counter}\n{seg_start} --> {seg_end}\n{seg_text}\n"
-            )
-            srt_counter += 1
-            current_segment_words = []
-            current_segment_len = 0
 
-    if current_segment_words:
-        seg_text = " ".join([w[0] for w in current_segment_words])
-        seg_start = _format_srt_time(current_segment_words[0][1])
-        seg_end = _format_srt_time(current_segment_words[-1][2])
-        srt_entries.append(f"{srt_counter}\n{seg_start} --> {seg_end}\n{seg_text}\n")
+def _submit_aws_transcription(audio_path: str, url: str, language: str = "en") -> bool:
+    """Starts an AWS Transcribe job without waiting for it to finish."""
+    bucket_name = os.environ.get("YTD_S3_BUCKET_NAME")
+    if boto3 is None or not bucket_name:
+        return False
 
-    srt_content = "\n".join(srt_entries)
+    from youtube_to_docs.stt import get_aws_transcribe_manager
 
-    return transcript_text, srt_content, 0, 0
+    region = os.environ.get("AWS_REGION", "us-east-1")
+    manager = get_aws_transcribe_manager(bucket_name, region)
+    error = manager.submit((url, language), audio_path, language)
+    if error:
+        print(error)
+        return False
+    return True
 
 
 def generate_summary(
@@ -10,6 +10,13 @@ import polars as pl
 from rich import print as rprint
 from rich_argparse import RichHelpFormatter
 
+from youtube_to_docs.audio import (
+    DEFAULT_TTS_FORMAT,
+    TTS_FORMATS,
+    AudioCache,
+    PreparedAudio,
+    prepare_stt_audio,
+)
 from youtube_to_docs.infographic import build_infographic_prompt, generate_infographic
 from youtube_to_docs.llms import (
     extract_speakers,
@@ -27,6 +34,7 @@ from youtube_to_docs.providers import (
     STTProvider,
     get_provider,
 )
+from youtube_to_docs.srt import Cues
 from youtube_to_docs.storage import (
     GoogleDriveStorage,
     HuggingFaceStorage,
@@ -35,6 +43,7 @@ from youtube_to_docs.storage import (
     MemoryStorage,
     NullStorage,
 )
+from youtube_to_docs.stt import resume_stt_operations
 from youtube_to_docs.transcript import (
     extract_audio,
     extract_playlist_id,
@@ -47,14 +56,18 @@ from youtube_to_docs.transcript import (
 )
 from youtube_to_docs.translate import (
     parse_suggest_captions_arg,
-    parse_translate_arg,
+    parse_translate_languages,
+    translate_srt,
     translate_text,
 )
+from youtube_to_docs.translation_memory import get_translation_memory
 from youtube_to_docs.tts import process_tts
 from youtube_to_docs.utils import (
     format_clickable_path,
     normalize_model_name,
     reorder_columns,
+    thread_imap,
+    thread_map,
 )
 from youtube_to_docs.video import process_videos
 
@@ -74,6 +87,195 @@ class VerboseRow(dict):
             rprint(f"Updated column: {k}")
 
 
+def audio_profile() -> str:
+    """Audio download profile (YTD_AUDIO_PROFILE, default archive).
+
+    The download is also stored as the "Audio File" artifact, so the lower
+    quality ``stt`` profile is opt-in.
+    """
+    return os.environ.get("YTD_AUDIO_PROFILE", "archive").lower()
+
+
+# Audio cache key for audio copied from output storage, whose download
+# profile is unknown
+STORED_AUDIO_PROFILE = "stored"
+
+
+# Videos fetched and submitted at once by the background STT pre-pass
+# (YTD_STT_SUBMIT_MAX_WORKERS)
+DEFAULT_STT_SUBMIT_MAX_WORKERS = 4
+
+
+def stt_submit_max_workers() -> int:
+    """Returns YTD_STT_SUBMIT_MAX_WORKERS, at least 1."""
+    value = os.environ.get(
+        "YTD_STT_SUBMIT_MAX_WORKERS", str(DEFAULT_STT_SUBMIT_MAX_WORKERS)
+    )
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Invalid YTD_STT_SUBMIT_MAX_WORKERS '{value}', using default.")
+        return DEFAULT_STT_SUBMIT_MAX_WORKERS
+
+
+# Translated languages processed in parallel per video (YTD_LANGUAGE_MAX_WORKERS)
+DEFAULT_LANGUAGE_MAX_WORKERS = 4
+
+
+def language_max_workers() -> int:
+    """Returns YTD_LANGUAGE_MAX_WORKERS, at least 1."""
+    value = os.environ.get(
+        "YTD_LANGUAGE_MAX_WORKERS", str(DEFAULT_LANGUAGE_MAX_WORKERS)
+    )
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Invalid YTD_LANGUAGE_MAX_WORKERS '{value}', using default.")
+        return DEFAULT_LANGUAGE_MAX_WORKERS
+
+
+def _fetch_audio(
+    video_id: str,
+    local_audio_dir: str,
+    audio_cache: AudioCache,
+    storage=None,
+    stored_path: str = "",
+) -> str | None:
+    """Returns a local copy of a video's audio, preferring the audio cache.
+
+    Falls back to ``stored_path`` in output storage, then to a yt-dlp download.
+    Files fetched into ``local_audio_dir`` are moved into the cache so later
+    runs (and other transcript models) do not download them again.
+    """
+    profile = audio_profile()
+    for cache_key in (profile, STORED_AUDIO_PROFILE):
+        cached_path = audio_cache.get(video_id, cache_key)
+        if cached_path:
+            rprint(f"Using cached audio: {cached_path}")
+            return cached_path
+
+    if stored_path and storage is not None and storage.exists(stored_path):
+        local_path = storage.get_local_file(stored_path, download_dir=local_audio_dir)
+        # Cached by where it came from, not by the current download profile
+        cache_key = STORED_AUDIO_PROFILE
+    else:
+        rprint(f"Extracting audio ({video_id})...")
+        local_path = extract_audio(video_id, local_audio_dir, profile=profile)
+        cache_key = profile
+    if not local_path:
+        return None
+
+    # Files that already live in local output storage stay where they are
+    temp_dir = os.path.abspath(local_audio_dir)
+    if os.path.dirname(os.path.abspath(local_path)) != temp_dir:
+        return local_path
+    return audio_cache.put(local_path, video_id, cache_key)
+
+
+def _cleanup_video_temp_files(local_audio_dir: str, video_id: str) -> None:
+    """Deletes the temp files (downloads, STT copies) of a finished video."""
+    if not os.path.isdir(local_audio_dir):
+        return
+    for entry in os.scandir(local_audio_dir):
+        if entry.is_file() and entry.name.startswith(f"{video_id}."):
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                print(f"Warning: Could not remove temp file {entry.path}: {e}")
+
+
+def _submit_background_stt(
+    video_ids: list[str],
+    transcript_arg: str,
+    languages: list[str],
+    translate_model: str | None,
+    existing_df: pl.DataFrame | None,
+    storage,
+    transcripts_dir: str,
+    local_audio_dir: str,
+    audio_cache: AudioCache | None = None,
+) -> dict[str, tuple[str, PreparedAudio]]:
+    """Submits STT jobs for every pending video before the main loop.
+
+    Only providers whose jobs run in the background (e.g. AWS Transcribe) take
+    part, so all jobs run in parallel and the per-video loop just collects each
+    result. Videos are fetched and submitted in waves of
+    ``YTD_STT_SUBMIT_MAX_WORKERS``, and each video's temp files are deleted
+    once its jobs are submitted, so only a few videos' audio is on disk at a
+    time. Returns {video_id: (local_audio_path, prepared_audio)}; the path is
+    "" when the audio was released and must be fetched again if needed.
+    """
+    try:
+        provider = get_provider(transcript_arg)
+    except ValueError:
+        return {}
+    if not (isinstance(provider, STTProvider) and provider.supports_background_stt):
+        return {}
+
+    # Non-English STT only runs when there is no translation model
+    stt_languages = [lang for lang in languages if lang == "en" or not translate_model]
+    if audio_cache is None:
+        audio_cache = AudioCache()
+
+    def _submit(video_id: str) -> tuple[str, tuple[str, PreparedAudio] | None]:
+        url = f"https://www.youtube.com/watch?v={video_id}"
+        row: dict = {}
+        if existing_df is not None and "URL" in existing_df.columns:
+            matches = existing_df.filter(pl.col("URL") == url)
+            if not matches.is_empty():
+                row = matches.to_dicts()[0]
+
+        pending = []
+        for language in stt_languages:
+            col_suffix = f" ({language})" if language != "en" else ""
+            ai_path = row.get(f"Transcript File {transcript_arg} generated{col_suffix}")
+            if not ai_path and row.get("Title"):
+                safe_title = re.sub(r'[\\/*?:"><|]', "_", row["Title"])
+                safe_title = safe_title.replace("\n", " ").replace("\r", "")
+                ai_path = os.path.join(
+                    transcripts_dir,
+                    f"{transcript_arg} generated{col_suffix} - "
+                    f"{video_id} - {safe_title}.txt",
+                )
+            if not (ai_path and storage.exists(str(ai_path))):
+                pending.append(language)
+        if not pending:
+            return video_id, None
+
+        local_audio_path = _fetch_audio(
+            video_id,
+            local_audio_dir,
+            audio_cache,
+            storage=storage,
+            stored_path=str(row.get("Audio File") or ""),
+        )
+        if not local_audio_path:
+            return video_id, None
+
+        prepared_audio = prepare_stt_audio(local_audio_path, local_audio_dir)
+        submitted = [
+            provider.submit_transcription(
+                prepared_audio.path,
+                url,
+                language=language,
+                duration_seconds=prepared_audio.duration_seconds,
+            )
+            for language in pending
+        ]
+        if all(submitted):
+            # The jobs no longer need the local files; cached audio survives
+            _cleanup_video_temp_files(local_audio_dir, video_id)
+            if not os.path.exists(local_audio_path):
+                local_audio_path = ""
+        return video_id, (local_audio_path, prepared_audio)
+
+    prefetched: dict[str, tuple[str, PreparedAudio]] = {}
+    for video_id, result in thread_imap(_submit, video_ids, stt_submit_max_workers()):
+        if result is not None:
+            prefetched[video_id] = result
+    return prefetched
+
+
 def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
     # Define styles for the help output
     RichHelpFormatter.styles["argparse.args"] = "cyan italic"
@@ -174,6 +376,16 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
             "(e.g. `aws-polly-Ruth`)"
         ),
     )
+    parser.add_argument(
+        "--tts-format",
+        default=DEFAULT_TTS_FORMAT,
+        choices=sorted(TTS_FORMATS),
+        help=(
+            "Audio format for --tts output. Compressed formats are encoded with "
+            "ffmpeg while the speech is synthesized. Defaults to `aac` (.m4a); "
+            "use `wav` for uncompressed audio."
+        ),
+    )
     parser.add_argument(
         "-i",
         "--infographic",
@@ -213,6 +425,9 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
             "Format: `{model}-{language}` e.g. `gemini-3.5-flash-lite-spanish` \n"
             "or `gemini-3.5-flash-lite-es` or `bedrock-nova-2-lite-v1-fr`\n"
             "or `aws-translate-spanish` or `gcp-translate-french`\n"
+            "Add more languages separated by commas, e.g. "
+            "`gemini-3.5-flash-lite-es,fr,korean`: the English stages run once "
+            "and the languages are then processed in parallel.\n"
             "Both language names (e.g. 'spanish', 'french', 'korean') and "
             "ISO codes (e.g. 'es', 'fr', 'ko') are accepted.\n"
             "Use `aws-translate` to use AWS Translate, or `gcp-translate` to use "
@@ -352,9 +567,9 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
     post_process_arg = args.post_process
     model_names = model_names_arg.split(",") if model_names_arg else []
     translate_model = None
-    translate_lang = None
+    translate_langs: list[str] = []
     if translate_arg:
-        translate_model, translate_lang = parse_translate_arg(translate_arg)
+        translate_model, translate_langs = parse_translate_languages(translate_arg)
     suggest_captions_model = None
     suggest_captions_source = None
     if suggest_captions_arg:
@@ -362,9 +577,7 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
             suggest_captions_arg
         )
 
-    languages = ["en"]
-    if translate_lang:
-        languages.append(translate_lang)
+    languages = ["en"] + [lang for lang in translate_langs if lang != "en"]
 
     youtube_service = get_youtube_service()
 
@@ -442,6 +655,8 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
     local_temp_dir = "temp_processing_artifacts"
     local_audio_dir = os.path.join(local_temp_dir, "audio-files")
     os.makedirs(local_audio_dir, exist_ok=True)
+    # Downloaded audio persists across runs in a size-bounded LRU cache
+    audio_cache = AudioCache()
 
     storage.ensure_directory(transcripts_dir)
     storage.ensure_directory(summaries_dir)
@@ -482,8 +697,28 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
 
     if model_names:
         vprint(f"Summarizing using models: {model_names}")
-    if translate_model and translate_lang:
-        vprint(f"Translation: {translate_model} -> {translate_lang}")
+    if translate_model and translate_langs:
+        vprint(f"Translation: {translate_model} -> {', '.join(translate_langs)}")
+
+    # Start background STT jobs (e.g. AWS Transcribe) for all videos up front,
+    # re-attaching first to any operations an interrupted run left behind
+    prefetched_audio: dict[str, tuple[str, PreparedAudio]] = {}
+    if transcript_arg != "youtube":
+        resume_stt_operations(
+            transcript_arg,
+            [f"https://www.youtube.com/watch?v={video_id}" for video_id in video_ids],
+        )
+        prefetched_audio = _submit_background_stt(
+            video_ids,
+            transcript_arg,
+            languages,
+            translate_model,
+            existing_df,
+            storage,
+            transcripts_dir,
+            local_audio_dir,
+            audio_cache,
+        )
 
     rows = []
 
@@ -610,6 +845,10 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
 
         audio_file_path = row.get("Audio File", "")
         local_audio_path = ""
+        # STT-ready (mono 16 kHz) copy of the audio, prepared on first use
+        prepared_audio: PreparedAudio | None = None
+        if video_id in prefetched_audio:
+            local_audio_path, prepared_audio = prefetched_audio[video_id]
 
         # If we need audio for generation (STT not "youtube"), ensures we have logic
         if transcript_arg != "youtube":
@@ -618,12 +857,11 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                 # It exists in storage.
                 pass
             else:
-                # Need to extract
-                rprint(f"Extracting audio for {transcript_arg}...")
-                local_audio_path = extract_audio(
-                    video_id,
-                    local_audio_dir,
-                )
+                # Need to extract (unless the background STT pre-pass did)
+                if not local_audio_path:
+                    local_audio_path = (
+                        _fetch_audio(video_id, local_audio_dir, audio_cache) or ""
+                    )
                 if local_audio_path:
                     # Upload to storage
                     target_audio_path = os.path.join(audio_dir, f"{video_id}.m4a")
@@ -638,7 +876,9 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                     audio_file_path = uploaded_path_or_link
 
         # --- Language Dependent Logic ---
-        for language in languages:
+        def _process_language(language: str) -> None:
+            nonlocal prepared_audio
+
             rprint(f"--- Processing Language: {language} ---")
 
             col_suffix = f" ({language})" if language != "en" else ""
@@ -833,7 +1073,7 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                                 f"Translating SRT to {language} "
                                 f"using {translate_model}..."
                             )
-                            translated_srt, _, _ = translate_text(
+                            translated_srt, _, _ = translate_srt(
                                 translate_model, en_srt, language
                             )
                             srt_filename = (
@@ -961,7 +1201,7 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                                     f"Translating AI SRT to {language} "
                                     f"using {translate_model}..."
                                 )
-                                translated_ai_srt, _, _ = translate_text(
+                                translated_ai_srt, _, _ = translate_srt(
                                     translate_model, en_ai_srt, language
                                 )
                                 srt_filename = (
@@ -998,8 +1238,12 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                         if not audio_input_path and audio_file_path:
                             # Try to get it locally via storage abstraction
                             vprint(f"Retrieving audio file locally: {audio_file_path}")
-                            audio_input_path = storage.get_local_file(
-                                audio_file_path, download_dir=local_audio_dir
+                            audio_input_path = _fetch_audio(
+                                video_id,
+                                local_audio_dir,
+                                audio_cache,
+                                storage=storage,
+                                stored_path=audio_file_path,
                             )
 
                         if not audio_input_path:
@@ -1016,40 +1260,34 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                             # Use the unified provider
                             provider = get_provider(transcript_arg)
                             if isinstance(provider, STTProvider):
+                                if prepared_audio is None:
+                                    prepared_audio = prepare_stt_audio(
+                                        audio_input_path, local_audio_dir
+                                    )
+                                stt_audio_path = prepared_audio.path
+                                stt_duration = (
+                                    prepared_audio.duration_seconds
+                                    or video_duration_seconds
+                                )
                                 ai_transcript, ai_srt_content, stt_in, stt_out = (
                                     provider.transcribe(
-                                        audio_input_path,
+                                        stt_audio_path,
                                         url,
                                         language=language,
-                                        duration_seconds=video_duration_seconds,
+                                        duration_seconds=stt_duration,
                                         srt=True,
                                     )
                                 )
+                                # Put timestamps back on the original timeline
+                                # if silences were trimmed before STT
+                                ai_srt_content = prepared_audio.remap_srt(
+                                    ai_srt_content
+                                )
                                 # If the provider didn't return text in one go, try to
                                 # extract it from SRT
                                 if not ai_transcript and ai_srt_content:
                                     vprint("Extracting plain text from SRT locally...")
-                                    # Strip SRT tags, timestamps, and sequence numbers
-                                    # Pattern for timestamps:
-                                    # 00:00:00,000 --> 00:00:00,000
-                                    # Pattern for sequence numbers:
-                                    # \d+ followed by newline
-                                    # Pattern for HTML-like tags: <[^>]+>
-                                    text_blocks = []
-                                    lines = ai_srt_content.strip().splitlines()
-                                    for line in lines:
-                                        line = line.strip()
-                                        if not line:
-                                            continue
-                                        if re.match(r"^\d+$", line):
-                                            continue
-                                        if "-->" in line:
-                                            continue
-                                        # Remove tags
-                                        line = re.sub(r"<[^>]+>", "", line)
-                                        if line:
-                                            text_blocks.append(line)
-                                    ai_transcript = " ".join(text_blocks)
+                                    ai_transcript = Cues.parse(ai_srt_content).to_text()
 
                                 # If still empty, fallback to provider call without SRT
                                 if not ai_transcript:
@@ -1058,15 +1296,15 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                                         "from provider..."
                                     )
                                     ai_transcript, _, _, _ = provider.transcribe(
-                                        audio_input_path,
+                                        stt_audio_path,
                                         url,
                                         language=language,
-                                        duration_seconds=video_duration_seconds,
+                                        duration_seconds=stt_duration,
                                         srt=False,
                                     )
                             else:
                                 print(f"Error: {transcript_arg} does not support STT.")
-                                continue
+                                return
 
                             # Save AI transcript
                             prefix = f"{transcript_arg} generated{lang_str} - "
@@ -1128,7 +1366,7 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                     f"No transcript (YouTube or AI) available for {video_id} "
                     f"({language}). Skipping further processing for this language."
                 )
-                continue
+                return
 
             # --- Post-processing ---
             if post_process_arg:
@@ -1965,11 +2203,6 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                         f"Infographic Prompt Path {m_name} {infographic_arg}"
                     )
 
-                    safe_title = re.sub(r"[\\/*?:\"<>|]", "_", video_title).replace(
-                        "\n", " "
-                    )
-                    safe_title = safe_title.replace("\r", "")
-
                     # Save the exact prompt sent to the image model. Done before
                     # generation so the prompt is recorded even if image
                     # generation later fails.
@@ -2126,6 +2359,11 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
                                 row[at_cost_col] = at_cost
                                 vprint(f"Alt text cost: ${at_cost:.2f}")
 
+        # English runs first: translated branches build on its transcript and
+        # outputs. The remaining languages then run concurrently.
+        _process_language(languages[0])
+        thread_map(_process_language, languages[1:], language_max_workers())
+
         # --- Suggested Corrected Captions ---
         if suggest_captions_model:
             source_srt_content = ""
@@ -2306,6 +2544,9 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
         except Exception as e:
             print(f"Warning: Could not save progress: {e}")
 
+        # Keep disk use bounded on long runs; cached audio is left alone
+        _cleanup_video_temp_files(local_audio_dir, video_id)
+
         time.sleep(1)
         print()
 
@@ -2342,7 +2583,12 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
             # TTS will scan all columns, so it should pick up the new
             # language columns too
             final_df = process_tts(
-                final_df, tts_arg, storage, base_dir, languages=languages
+                final_df,
+                tts_arg,
+                storage,
+                base_dir,
+                languages=languages,
+                audio_format=args.tts_format,
             )
             should_save = True
 
@@ -2363,6 +2609,11 @@ def main(args_list: list[str] | None = None) -> "MemoryStorage | None":
     else:
         vprint("No new data to gather or all videos already processed.")
 
+    if translate_model:
+        memory = get_translation_memory()
+        if memory.hits or memory.misses:
+            rprint(memory.summary())
+
     # Cleanup local temp dir
     if os.path.exists(local_temp_dir):
         import shutil
@@ -16,6 +16,7 @@ def process_video(
     transcript_source: str = "youtube",
     model: str | None = None,
     tts_model: str | None = None,
+    tts_format: str | None = None,
     infographic_model: str | None = None,
     alt_text_model: str | None = None,
     no_youtube_summary: bool = False,
@@ -60,6 +61,8 @@ def process_video(
         tts_model: The TTS model and voice to use
             (e.g., 'gemini-3.1-flash-tts-preview-Kore', 'gcp-chirp3-Kore',
             'aws-polly-Ruth').
+        tts_format: Audio format for the TTS output: 'aac' (default, .m4a),
+            'opus', 'mp3' or 'wav'.
         infographic_model: The image model to use for generating an infographic
             (e.g., 'gemini-3.1-flash-lite-image' or 'gemini-3-pro-image').
         alt_text_model: The LLM model to use for generating alt text for the
@@ -110,6 +113,9 @@ def process_video(
     if tts_model:
         args.extend(["--tts", tts_model])
 
+    if tts_format:
+        args.extend(["--tts-format", tts_format])
+
     if infographic_model:
         args.extend(["--infographic", infographic_model])
 
@@ -0,0 +1,201 @@
+"""Post-processing of synthesized speech before it is saved.
+
+TTS services return 16-bit mono PCM at different sample rates (Polly at
+16 kHz, Gemini and Chirp at 24 kHz) and loudness levels, often with long
+pauses where chunks were joined. When NumPy is installed (the ``audio``
+extra), every chunk is resampled to one rate, long silences are capped, the
+loudness is normalized and consecutive chunks are crossfaded. All of this
+runs on the raw chunks as they stream in, before the WAV or encoded file is
+written. Without NumPy the chunks are only crossfaded.
+"""
+
+import os
+import sys
+from array import array
+from typing import Any, Iterable, Iterator, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np: Any = None
+
+# Output sample rate of the post-processing stage (YTD_TTS_SAMPLE_RATE)
+DEFAULT_TTS_SAMPLE_RATE = 24000
+# Overlap blended where two synthesized chunks meet
+CROSSFADE_MS = 20
+# Frames quieter than this RMS (about -40 dBFS) count as silence
+SILENCE_THRESHOLD = 0.01
+# Pauses inside the speech are capped at MAX_SILENCE_MS; silence at the start
+# and end of a chunk is trimmed to EDGE_SILENCE_MS
+MAX_SILENCE_MS = 600
+EDGE_SILENCE_MS = 100
+# Loudness target (RMS of the voiced frames, about -20 dBFS) and peak ceiling
+TARGET_RMS = 0.1
+PEAK_LIMIT = 0.89
+
+
+def tts_sample_rate() -> int:
+    """Returns YTD_TTS_SAMPLE_RATE (0 disables the NumPy post-processing)."""
+    value = os.environ.get("YTD_TTS_SAMPLE_RATE", str(DEFAULT_TTS_SAMPLE_RATE))
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        print(f"Warning: Invalid YTD_TTS_SAMPLE_RATE '{value}', using default.")
+        return DEFAULT_TTS_SAMPLE_RATE
+
+
+def crossfade_pcm(
+    chunks: Iterable[bytes], rate: int, fade_ms: int = CROSSFADE_MS
+) -> Iterator[bytes]:
+    """Joins 16-bit mono PCM chunks, blending each seam with a linear crossfade.
+
+    The last ``fade_ms`` of every chunk is held back until the next chunk
+    arrives, so audio is still yielded as it comes in.
+    """
+    fade_bytes = rate * fade_ms // 1000 * 2
+    tail = b""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        overlap = min(len(tail), len(chunk)) // 2 * 2
+        if overlap:
+            yield tail[: len(tail) - overlap]
+            fading_out = array("h", tail[len(tail) - overlap :])
+            fading_in = array("h", chunk[:overlap])
+            if sys.byteorder == "big":
+                fading_out.byteswap()
+                fading_in.byteswap()
+            steps = len(fading_in) + 1
+            blended = array(
+                "h",
+                (
+                    int(a + (b - a) * (i + 1) / steps)
+                    for i, (a, b) in enumerate(zip(fading_out, fading_in))
+                ),
+            )
+            if sys.byteorder == "big":
+                blended.byteswap()
+            yield blended.tobytes()
+            chunk = chunk[overlap:]
+        elif tail:
+            yield tail
+        keep = max(len(chunk) - fade_bytes, 0)
+        if keep:
+            yield chunk[:keep]
+        tail = chunk[keep:]
+    if tail:
+        yield tail
+
+
+def to_samples(pcm: bytes) -> "np.ndarray":
+    """Converts 16-bit little-endian PCM to float32 samples in [-1, 1)."""
+    usable = len(pcm) // 2 * 2
+    return np.frombuffer(pcm[:usable], dtype="<i2").astype(np.float32) / 32768
+
+
+def to_pcm(samples: "np.ndarray") -> bytes:
+    """Converts float samples back to 16-bit little-endian PCM."""
+    return np.clip(np.round(samples * 32768), -32768, 32767).astype("<i2").tobytes()
+
+
+def resample(samples: "np.ndarray", rate: int, target_rate: int) -> "np.ndarray":
+    """Resamples with linear interpolation (adequate for speech)."""
+    if rate == target_rate or not len(samples):
+        return samples
+    length = int(round(len(samples) * target_rate / rate))
+    positions = np.arange(length, dtype=np.float64) * (rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def _frame_levels(samples: "np.ndarray", frame: int) -> "np.ndarray":
+    frames = samples[: len(samples) // frame * frame].reshape(-1, frame)
+    return np.sqrt(np.mean(frames**2, axis=1))
+
+
+def cap_silences(
+    samples: "np.ndarray",
+    rate: int,
+    max_silence_ms: int = MAX_SILENCE_MS,
+    edge_ms: int = EDGE_SILENCE_MS,
+) -> "np.ndarray":
+    """Shortens silent runs, measured in 10 ms frames.
+
+    Pauses longer than ``max_silence_ms`` keep their first and last halves;
+    silence at the start or end keeps only the ``edge_ms`` next to speech.
+    """
+    frame = max(rate // 100, 1)
+    silent = _frame_levels(samples, frame) < SILENCE_THRESHOLD
+    count = len(silent)
+    if not silent.any():
+        return samples
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], silent, [0])).astype(np.int8)))
+    keep = np.ones(count, dtype=bool)
+    cap, edge = max_silence_ms // 10, edge_ms // 10
+    for start, end in zip(edges[0::2], edges[1::2]):
+        if start == 0:
+            keep[: max(end - edge, 0)] = False
+        elif end == count:
+            keep[start + edge :] = False
+        elif end - start > cap:
+            keep[start + cap // 2 : end - (cap - cap // 2)] = False
+    if keep.all():
+        return samples
+    sample_keep = np.repeat(keep, frame)
+    remainder = samples[count * frame :]
+    if not keep[-1]:
+        remainder = remainder[:0]
+    return np.concatenate((samples[: count * frame][sample_keep], remainder))
+
+
+def normalize_loudness(samples: "np.ndarray", rate: int) -> "np.ndarray":
+    """Scales the voiced frames to TARGET_RMS without peaks above PEAK_LIMIT."""
+    levels = _frame_levels(samples, max(rate // 100, 1))
+    voiced = levels[levels >= SILENCE_THRESHOLD]
+    peak = float(np.max(np.abs(samples))) if len(samples) else 0.0
+    if not len(voiced) or not peak:
+        return samples
+    rms = float(np.sqrt(np.mean(voiced**2)))
+    gain = min(TARGET_RMS / rms, PEAK_LIMIT / peak)
+    return samples * np.float32(gain)
+
+
+def _process_chunks(
+    chunks: Iterable[bytes], rate: int, target_rate: int
+) -> Iterator[bytes]:
+    fade = target_rate * CROSSFADE_MS // 1000
+    tail = np.zeros(0, dtype=np.float32)
+    for chunk in chunks:
+        samples = to_samples(chunk)
+        if not len(samples):
+            continue
+        samples = resample(samples, rate, target_rate)
+        samples = cap_silences(samples, target_rate)
+        samples = normalize_loudness(samples, target_rate)
+        overlap = min(len(tail), len(samples))
+        if overlap:
+            yield to_pcm(tail[: len(tail) - overlap])
+            ramp = np.linspace(0, 1, overlap + 2, dtype=np.float32)[1:-1]
+            samples = samples.copy()
+            samples[:overlap] = (
+                tail[len(tail) - overlap :] * (1 - ramp) + samples[:overlap] * ramp
+            )
+        keep = max(len(samples) - fade, 0)
+        if keep:
+            yield to_pcm(samples[:keep])
+        tail = samples[keep:]
+    if len(tail):
+        yield to_pcm(tail)
+
+
+def postprocess_speech(
+    chunks: Iterable[bytes], rate: int
+) -> Tuple[Iterator[bytes], int]:
+    """Post-processes synthesized PCM chunks as they stream in.
+
+    Returns (iterator of processed PCM, sample rate). Each item of ``chunks``
+    should be one synthesized chunk, since seams are crossfaded.
+    """
+    target_rate = tts_sample_rate()
+    if np is None or not target_rate:
+        return crossfade_pcm(chunks, rate), rate
+    return _process_chunks(chunks, rate, target_rate), target_rate
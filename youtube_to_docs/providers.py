@@ -1,5 +1,7 @@
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class BaseProvider(ABC):
@@ -33,6 +35,25 @@ class STTProvider(ABC):
         """Returns (transcript_text, srt_content, input_tokens, output_tokens)."""
         pass
 
+    # True if submit_transcription can start jobs that run in the background
+    supports_background_stt: bool = False
+
+    def submit_transcription(
+        self,
+        audio_path: str,
+        url: str,
+        language: str = "en",
+        duration_seconds: Optional[float] = None,
+        **kwargs,
+    ) -> bool:
+        """Starts transcription without waiting for the result.
+
+        Returns True if a job was submitted; a later transcribe() call with the
+        same url and language collects it. Providers that only transcribe
+        synchronously keep this default.
+        """
+        return False
+
 
 class TTSProvider(ABC):
     """Interface for Text-to-Speech services."""
@@ -44,6 +65,17 @@ class TTSProvider(ABC):
         """Returns (raw_audio_bytes, sample_rate_hertz)."""
         pass
 
+    def generate_speech_stream(
+        self, text: str, voice: str, language_code: Optional[str] = None, **kwargs
+    ) -> Tuple[Iterator[bytes], int]:
+        """Returns (iterator of raw audio chunks in order, sample_rate_hertz).
+
+        Services that synthesize long texts in chunks override this so the
+        audio can be written out chunk by chunk instead of held in memory.
+        """
+        audio, rate = self.generate_speech(text, voice, language_code, **kwargs)
+        return iter([audio] if audio else []), rate
+
 
 class TranslationProvider(ABC):
     """Interface for Translation services."""
@@ -53,6 +85,27 @@ class TranslationProvider(ABC):
         """Returns translated text."""
         pass
 
+    def translate_batch(
+        self, texts: List[str], target_lang: str, **kwargs
+    ) -> List[str]:
+        """Returns one translation per input text, in the same order.
+
+        Services with list inputs override this to translate many short texts
+        (e.g. SRT cues) in a few requests.
+        """
+        return [self.translate(text, target_lang, **kwargs) for text in texts]
+
+    def translate_documents(
+        self, texts: List[str], target_lang: str, **kwargs
+    ) -> List[str]:
+        """Returns one translation per multi-line text, in the same order.
+
+        Unlike ``translate_batch``, line breaks and formatting are kept.
+        Services override this to translate a video's summaries, Q&A and tags
+        together instead of one request at a time.
+        """
+        return [self.translate(text, target_lang, **kwargs) for text in texts]
+
 
 class MultimodalProvider(ABC):
     """Interface for Multimodal (Vision) services."""
@@ -67,6 +120,36 @@ class MultimodalProvider(ABC):
 
 _registry: Dict[str, Any] = {}
 
+# Concurrent requests allowed per LLM model (YTD_LLM_MAX_CONCURRENCY)
+DEFAULT_LLM_MAX_CONCURRENCY = 4
+
+_rate_limiters: Dict[str, threading.BoundedSemaphore] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def llm_max_concurrency() -> int:
+    """Returns YTD_LLM_MAX_CONCURRENCY (1 sends LLM requests one at a time)."""
+    value = os.environ.get("YTD_LLM_MAX_CONCURRENCY", str(DEFAULT_LLM_MAX_CONCURRENCY))
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Invalid YTD_LLM_MAX_CONCURRENCY '{value}', using default.")
+        return DEFAULT_LLM_MAX_CONCURRENCY
+
+
+def get_rate_limiter(model_name: str) -> threading.BoundedSemaphore:
+    """Returns the process-wide semaphore capping concurrent calls to a model.
+
+    Every thread that calls the same model shares it, so parallel work never
+    exceeds ``YTD_LLM_MAX_CONCURRENCY`` in-flight requests per model.
+    """
+    with _rate_limiters_lock:
+        if model_name not in _rate_limiters:
+            _rate_limiters[model_name] = threading.BoundedSemaphore(
+                llm_max_concurrency()
+            )
+        return _rate_limiters[model_name]
+
 
 def register_provider(name: str, provider_class: Any):
     _registry[name] = provider_class
@@ -0,0 +1,249 @@
+"""Compact SRT cue model shared by every transcript path.
+
+Cues are stored as parallel arrays (integer millisecond start/end times and a
+list of texts) instead of per-cue strings, so shifting, merging and
+renumbering never re-parse or re-format timestamps, and a multi-MB SRT file is
+parsed in a single regex pass.
+"""
+
+import re
+from array import array
+from typing import Callable, Iterable, List, Optional, Tuple
+
+# A timestamp; the hours are optional because LLM-written SRT often uses
+# MM:SS,mmm
+_TIME = r"(?:(\d+):)?(\d{1,2}):(\d{2})[,.](\d{1,3})"
+_TIMING = rf"[ \t]*{_TIME}[ \t]*-->[ \t]*{_TIME}"
+# The same timing line without capture groups, for lookaheads
+_TIMING_LINE = r"[ \t]*(?:\d+:)?\d{1,2}:\d{2}[,.]\d{1,3}[ \t]*-->"
+# One cue: timing line (the sequence number before it is ignored) followed by
+# its non-blank text lines, up to the next blank line, the next cue's number
+# and timing line (when the blank separator is missing) or the end of the
+# input. Anchoring at line starts keeps the scan from retrying inside cue text.
+_CUE_RE = re.compile(
+    rf"^{_TIMING}[^\n]*"
+    rf"((?:\n(?![ \t]*\d+[ \t]*\n{_TIMING_LINE})(?!{_TIMING_LINE})"
+    r"[ \t]*\S[^\n]*)*)",
+    re.MULTILINE,
+)
+# Markdown code fences around model output ("```srt" ... "```")
+_FENCE_RE = re.compile(r"^[ \t]*```[^\n]*$", re.MULTILINE)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Segmentation defaults used to turn word timings into cues.
+MAX_CUE_CHARS = 80
+SENTENCE_END = (".", "?", "!")
+
+
+def to_ms(seconds: float) -> int:
+    """Converts seconds to integer milliseconds."""
+    return int(round(seconds * 1000))
+
+
+def format_timestamp(ms: int) -> str:
+    """Formats milliseconds as an SRT timestamp (HH:MM:SS,mmm)."""
+    ms = max(int(ms), 0)
+    secs, millis = divmod(ms, 1000)
+    mins, secs = divmod(secs, 60)
+    hrs, mins = divmod(mins, 60)
+    return f"{hrs:02d}:{mins:02d}:{secs:02d},{millis:03d}"
+
+
+class Cues:
+    """A list of SRT cues stored as parallel arrays.
+
+    ``start_ms`` and ``end_ms`` are ``array("q")`` millisecond timestamps and
+    ``text`` holds the cue texts (which may span several lines). Sequence
+    numbers are not stored; they are assigned when serializing.
+    """
+
+    __slots__ = ("start_ms", "end_ms", "text")
+
+    def __init__(
+        self,
+        start_ms: Optional[Iterable[int]] = None,
+        end_ms: Optional[Iterable[int]] = None,
+        text: Optional[Iterable[str]] = None,
+    ):
+        self.start_ms = array("q", start_ms or ())
+        self.end_ms = array("q", end_ms or ())
+        self.text: List[str] = list(text or ())
+        if not len(self.start_ms) == len(self.end_ms) == len(self.text):
+            raise ValueError("Cue arrays must have the same length.")
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __iter__(self):
+        return zip(self.start_ms, self.end_ms, self.text)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cues):
+            return NotImplemented
+        return (
+            self.start_ms == other.start_ms
+            and self.end_ms == other.end_ms
+            and self.text == other.text
+        )
+
+    def __repr__(self) -> str:
+        return f"Cues({len(self)} cues)"
+
+    def append(self, start_ms: int, end_ms: int, text: str) -> None:
+        self.start_ms.append(int(start_ms))
+        self.end_ms.append(int(end_ms))
+        self.text.append(text)
+
+    def extend(self, other: "Cues") -> None:
+        """Appends the cues of ``other`` in place."""
+        self.start_ms.extend(other.start_ms)
+        self.end_ms.extend(other.end_ms)
+        self.text.extend(other.text)
+
+    @classmethod
+    def merge(cls, parts: Iterable["Cues"]) -> "Cues":
+        """Concatenates several cue lists (e.g. per-chunk STT results)."""
+        merged = cls()
+        for part in parts:
+            merged.extend(part)
+        return merged
+
+    @classmethod
+    def parse(cls, srt_content: str) -> "Cues":
+        """Parses SRT text. Malformed blocks without a timing line are skipped.
+
+        Output written by language models is accepted too: timestamps without
+        hours, cues missing the blank line between them, and Markdown code
+        fences around the whole file.
+        """
+        cues = cls()
+        if not srt_content:
+            return cues
+        srt_content = srt_content.replace("\r\n", "\n")
+        if "```" in srt_content:
+            srt_content = _FENCE_RE.sub("", srt_content)
+        starts: List[int] = []
+        ends: List[int] = []
+        texts = cues.text
+        for h1, m1, s1, f1, h2, m2, s2, f2, text in _CUE_RE.findall(srt_content):
+            # Fractions shorter than 3 digits ("1.5") are tenths/hundredths
+            if len(f1) < 3:
+                f1 = f1.ljust(3, "0")
+            if len(f2) < 3:
+                f2 = f2.ljust(3, "0")
+            starts.append(
+                int(h1 or 0) * 3_600_000 + int(m1) * 60_000 + int(s1) * 1000 + int(f1)
+            )
+            ends.append(
+                int(h2 or 0) * 3_600_000 + int(m2) * 60_000 + int(s2) * 1000 + int(f2)
+            )
+            texts.append(text.strip())
+        cues.start_ms.extend(starts)
+        cues.end_ms.extend(ends)
+        return cues
+
+    def to_srt(self, start_index: int = 1) -> str:
+        """Serializes the cues, numbering them from ``start_index``."""
+        fmt = format_timestamp
+        return "\n".join(
+            f"{i}\n{fmt(start)} --> {fmt(end)}\n{text}\n"
+            for i, (start, end, text) in enumerate(self, start_index)
+        )
+
+    def to_entries(self, start_index: int = 1) -> List[str]:
+        """Serializes each cue on its own (one SRT block per list item)."""
+        fmt = format_timestamp
+        return [
+            f"{i}\n{fmt(start)} --> {fmt(end)}\n{text}\n"
+            for i, (start, end, text) in enumerate(self, start_index)
+        ]
+
+    def to_text(self) -> str:
+        """Returns the cue texts as one line of plain text, without tags."""
+        parts = []
+        for text in self.text:
+            if "<" in text:
+                text = _TAG_RE.sub("", text)
+            for line in text.splitlines():
+                line = line.strip()
+                if line:
+                    parts.append(line)
+        return " ".join(parts)
+
+    def shift(self, offset_ms: int) -> "Cues":
+        """Returns a copy with every timestamp moved by ``offset_ms``."""
+        return Cues(
+            (max(t + offset_ms, 0) for t in self.start_ms),
+            (max(t + offset_ms, 0) for t in self.end_ms),
+            self.text,
+        )
+
+    def map_times(self, func: Callable[[int], int]) -> "Cues":
+        """Returns a copy with ``func`` applied to every timestamp."""
+        return Cues(
+            (func(t) for t in self.start_ms),
+            (func(t) for t in self.end_ms),
+            self.text,
+        )
+
+
+class CueBuilder:
+    """Groups timed words into cues.
+
+    A cue is closed once its text grows past ``max_chars`` or, when
+    ``break_on_sentence_end`` is set, after a word ending a sentence.
+    """
+
+    def __init__(
+        self,
+        max_chars: int = MAX_CUE_CHARS,
+        break_on_sentence_end: bool = True,
+        cues: Optional[Cues] = None,
+    ):
+        self.max_chars = max_chars
+        self.break_on_sentence_end = break_on_sentence_end
+        self.cues = cues if cues is not None else Cues()
+        self._words: List[str] = []
+        self._start_ms = 0
+        self._end_ms = 0
+        self._length = 0
+
+    def add_word(self, word: str, start_sec: float, end_sec: float) -> None:
+        if not self._words:
+            self._start_ms = to_ms(start_sec)
+        self._words.append(word)
+        self._end_ms = to_ms(end_sec)
+        self._length += len(word) + 1
+        if self._length > self.max_chars or (
+            self.break_on_sentence_end and word.endswith(SENTENCE_END)
+        ):
+            self.flush()
+
+    def attach_punctuation(self, mark: str) -> None:
+        """Appends punctuation to the last word (or the last closed cue)."""
+        if self._words:
+            self._words[-1] += mark
+        elif self.cues.text:
+            self.cues.text[-1] += mark
+
+    def flush(self) -> None:
+        if self._words:
+            self.cues.append(self._start_ms, self._end_ms, " ".join(self._words))
+            self._words = []
+            self._length = 0
+
+    def build(self) -> Cues:
+        self.flush()
+        return self.cues
+
+
+def cues_from_words(
+    words: Iterable[Tuple[str, float, float]],
+    max_chars: int = MAX_CUE_CHARS,
+    break_on_sentence_end: bool = True,
+) -> Cues:
+    """Builds cues from (word, start_sec, end_sec) tuples."""
+    builder = CueBuilder(max_chars, break_on_sentence_end)
+    for word, start_sec, end_sec in words:
+        builder.add_word(word, start_sec, end_sec)
+    return builder.build()
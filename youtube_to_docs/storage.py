@@ -1,11 +1,14 @@
 import atexit
 import base64
+import functools
+import inspect
 import io
 import json
 import os
 import re
 import shutil
 import tempfile
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Optional
@@ -22,6 +25,40 @@ from googleapiclient.http import (
 )
 from rich import print as rprint
 
+_client_locks_lock = threading.Lock()
+
+
+def _client_lock(storage: "Storage") -> threading.RLock:
+    lock = storage.__dict__.get("_client_lock")
+    if lock is None:
+        with _client_locks_lock:
+            lock = storage.__dict__.setdefault("_client_lock", threading.RLock())
+    return lock
+
+
+def serialized(cls):
+    """Class decorator that makes a storage backend safe to share between threads.
+
+    Every public method of ``cls`` runs under one per-instance lock. This is
+    for backends whose API client (googleapiclient's httplib2 transport) or
+    caches (path -> id lookups, folder creation, staged commits) are not
+    thread-safe. Callers can still run the rest of their work (synthesis,
+    encoding) in parallel; only the storage calls are serialized.
+    """
+
+    def locked(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with _client_lock(self):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(method):
+            setattr(cls, name, locked(method))
+    return cls
+
 
 class Storage(ABC):
     """Abstract base class for file storage operations."""
@@ -96,6 +133,14 @@ class Storage(ABC):
         """
         pass
 
+    def list_files(self, directory: str) -> Optional[dict[str, str]]:
+        """
+        Lists the files directly inside a directory in one call.
+        Returns {filename: full path or link}, or None when the storage cannot
+        list directories (callers then fall back to exists() per file).
+        """
+        return None
+
 
 class LocalStorage(Storage):
     """Implementation of Storage for the local filesystem."""
@@ -155,7 +200,19 @@ class LocalStorage(Storage):
             return os.path.abspath(path)
         return None
 
+    def list_files(self, directory: str) -> Optional[dict[str, str]]:
+        try:
+            with os.scandir(directory) as entries:
+                return {
+                    entry.name: os.path.abspath(entry.path)
+                    for entry in entries
+                    if entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
 
+
+@serialized
 class GoogleDriveStorage(Storage):
     """Implementation of Storage for Google Drive."""
 
@@ -398,7 +455,8 @@ class GoogleDriveStorage(Storage):
                 status, done = downloader.next_chunk()
             return fh.getvalue().decode("utf-8")
 
-    def read_bytes(self, path: str) -> bytes:
+    def _download(self, path: str, fh: io.IOBase) -> None:
+        """Downloads the file in chunks into the binary file object ``fh``."""
         if path.startswith("http"):
             file_id = self._extract_id_from_url(path)
         else:
@@ -408,12 +466,14 @@ class GoogleDriveStorage(Storage):
             raise FileNotFoundError(f"File not found: {path}")
 
         request = self.service.files().get_media(fileId=file_id)
-        fh = io.BytesIO()
-
         downloader = MediaIoBaseDownload(fh, request)
         done = False
         while done is False:
             status, done = downloader.next_chunk()
+
+    def read_bytes(self, path: str) -> bytes:
+        fh = io.BytesIO()
+        self._download(path, fh)
         return fh.getvalue()
 
     def _set_landscape(self, document_id: str) -> None:
@@ -724,6 +784,34 @@ class GoogleDriveStorage(Storage):
             return metadata["webViewLink"]
         return path
 
+    def list_files(self, directory: str) -> Optional[dict[str, str]]:
+        """Lists a folder with paged files.list calls and primes the file cache."""
+        try:
+            parent_id = self._get_parent_id(os.path.join(directory, "dummy"))
+            files: dict[str, str] = {}
+            page_token = None
+            while True:
+                results = (
+                    self.service.files()
+                    .list(
+                        q=f"'{parent_id}' in parents and trashed=false",
+                        fields="nextPageToken, files(id, name, webViewLink, mimeType)",
+                        pageSize=1000,
+                        pageToken=page_token,
+                    )
+                    .execute()
+                )
+                for file in results.get("files", []):
+                    path = os.path.join(directory, file["name"])
+                    self.file_cache.setdefault(path, file)
+                    files.setdefault(file["name"], file.get("webViewLink") or path)
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    return files
+        except HttpError as e:
+            print(f"Warning: Could not list Drive folder {directory}: {e}")
+            return None
+
     def get_name(self, path: str) -> str:
         """Returns the filename or name of the resource."""
         if path.startswith("http"):
@@ -756,13 +844,14 @@ class GoogleDriveStorage(Storage):
 
             download_dir = tempfile.gettempdir()
 
-        filename = Path(path).name
+        # Links end in "view?usp=..." rather than the file name
+        filename = self.get_name(path) if path.startswith("http") else Path(path).name
         local_path = os.path.join(download_dir, filename)
 
         try:
-            data = self.read_bytes(path)
+            # Stream to disk so large media never sits in memory
             with open(local_path, "wb") as f:
-                f.write(data)
+                self._download(path, f)
             return local_path
         except Exception as e:
             if isinstance(e, (HttpError, OSError)):
@@ -772,6 +861,7 @@ class GoogleDriveStorage(Storage):
             return None
 
 
+@serialized
 class M365Storage(Storage):
     """Implementation of Storage for Microsoft 365 (OneDrive/SharePoint)."""
 
@@ -979,7 +1069,7 @@ class M365Storage(Storage):
         else:
             return content_bytes.decode("utf-8")
 
-    def read_bytes(self, path: str) -> bytes:
+    def _download_url(self, path: str) -> str:
         item = self._get_item(path)
         if not item:
             raise FileNotFoundError(f"File not found: {path}")
@@ -990,8 +1080,10 @@ class M365Storage(Storage):
             download_url = (
                 f"https://graph.microsoft.com/v1.0/me/drive/items/{item_id}/content"
             )
+        return download_url
 
-        resp = requests.get(download_url)
+    def read_bytes(self, path: str) -> bytes:
+        resp = requests.get(self._download_url(path))
         resp.raise_for_status()
         return resp.content
 
@@ -1172,6 +1264,33 @@ class M365Storage(Storage):
         item = self._get_item(path)
         return item.get("webUrl", path) if item else path
 
+    def list_files(self, directory: str) -> Optional[dict[str, str]]:
+        """Lists a folder's children (following paging links) and caches them."""
+        remote_path = self._get_full_remote_path(directory)
+        url: Optional[str] = (
+            "https://graph.microsoft.com/v1.0/me/drive/root:/"
+            f"{quote(remote_path)}:/children?$top=999"
+        )
+        headers = {"Authorization": f"Bearer {self.token}"}
+        files: dict[str, str] = {}
+        while url:
+            resp = requests.get(url, headers=headers)
+            if resp.status_code == 404:
+                return files
+            if resp.status_code != 200:
+                print(f"Warning: Could not list {remote_path}: {resp.text}")
+                return None
+            data = resp.json()
+            for item in data.get("value", []):
+                if "folder" in item:
+                    continue
+                self.item_cache[f"{remote_path}/{item['name']}"] = item
+                files[item["name"]] = item.get("webUrl") or os.path.join(
+                    directory, item["name"]
+                )
+            url = data.get("@odata.nextLink")
+        return files
+
     def get_name(self, path: str) -> str:
         item = self._get_item(path)
         if item and "name" in item:
@@ -1198,9 +1317,12 @@ class M365Storage(Storage):
                 with open(local_path, "w", encoding="utf-8") as f:
                     f.write(content)
             else:
-                content_bytes = self.read_bytes(path)
-                with open(local_path, "wb") as f:
-                    f.write(content_bytes)
+                # Stream to disk so large media never sits in memory
+                with requests.get(self._download_url(path), stream=True) as resp:
+                    resp.raise_for_status()
+                    with open(local_path, "wb") as f:
+                        for chunk in resp.iter_content(chunk_size=1024 * 1024):
+                            f.write(chunk)
             return local_path
         except Exception as e:
             print(f"Error downloading {path}: {e}")
@@ -1250,6 +1372,9 @@ class NullStorage(Storage):
     ) -> Optional[str]:
         return None
 
+    def list_files(self, directory: str) -> Optional[dict[str, str]]:
+        return {}
+
 
 class MemoryStorage(Storage):
     """In-memory storage — artifacts are held in Python dicts, not on disk.
@@ -1326,6 +1451,14 @@ class MemoryStorage(Storage):
     def get_full_path(self, path: str) -> str:
         return self._norm(path)
 
+    def list_files(self, directory: str) -> Optional[dict[str, str]]:
+        prefix = self._norm(directory).rstrip("/") + "/"
+        return {
+            path[len(prefix) :]: path
+            for path in [*self._text, *self._bytes]
+            if path.startswith(prefix) and "/" not in path[len(prefix) :]
+        }
+
     def get_name(self, path: str) -> str:
         return os.path.basename(path)
 
@@ -1405,6 +1538,7 @@ class MemoryStorage(Storage):
         raise FileNotFoundError(f"MemoryStorage: not found: {path}")
 
 
+@serialized
 class HuggingFaceStorage(Storage):
     """Implementation of Storage for a Hugging Face Hub dataset repository.
 
@@ -1611,6 +1745,28 @@ class HuggingFaceStorage(Storage):
     def get_full_path(self, path: str) -> str:
         return path if path.startswith("http") else self._url(path)
 
+    def list_files(self, directory: str) -> Optional[dict[str, str]]:
+        prefix = self._norm(directory)
+        prefix = f"{prefix}/" if prefix else ""
+        try:
+            repo_files = self.api.list_repo_files(
+                repo_id=self.repo_id, repo_type="dataset", token=self.token
+            )
+        except Exception as e:
+            print(f"Warning: Could not list {directory} on Hugging Face: {e}")
+            return None
+        staged_dir = self._staged_path(prefix)
+        staged = os.listdir(staged_dir) if os.path.isdir(staged_dir) else []
+        names = [
+            path[len(prefix) :]
+            for path in repo_files
+            if path.startswith(prefix) and "/" not in path[len(prefix) :]
+        ]
+        names.extend(
+            name for name in staged if os.path.isfile(os.path.join(staged_dir, name))
+        )
+        return {name: self._url(prefix + name) for name in names}
+
     def get_name(self, path: str) -> str:
         if path.startswith("http"):
             return os.path.basename(self._path_from_url(path))
@@ -1619,18 +1775,16 @@ class HuggingFaceStorage(Storage):
     def get_local_file(
         self, path: str, download_dir: Optional[str] = None
     ) -> Optional[str]:
+        """Returns the file's path in the Hub download cache (or staging area).
+
+        ``download_dir`` is ignored: the cached file is already local, so
+        large media are not copied again. Callers must not modify or delete
+        the returned file.
+        """
         if not self.exists(path):
             return None
         try:
-            cached_path = self._download(path)
+            return self._download(path)
         except Exception as e:
             print(f"Error downloading {path} from Hugging Face: {e}")
             return None
-
-        if not download_dir:
-            return cached_path
-
-        os.makedirs(download_dir, exist_ok=True)
-        local_path = os.path.join(download_dir, os.path.basename(cached_path))
-        shutil.copy2(cached_path, local_path)
-        return local_path
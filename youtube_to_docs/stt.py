@@ -0,0 +1,646 @@
+"""Background speech-to-text job management and the STT operation journal."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import boto3
+except ImportError:
+    boto3: Any = None
+
+from youtube_to_docs.srt import CueBuilder, Cues
+from youtube_to_docs.utils import file_sha256, get_cache_dir
+
+# Adaptive polling: start fast, back off while nothing finishes.
+POLL_INITIAL_DELAY_SEC = 2.0
+POLL_MAX_DELAY_SEC = 30.0
+POLL_BACKOFF = 1.5
+
+# File extension -> AWS Transcribe MediaFormat
+AWS_MEDIA_FORMATS = {
+    "m4a": "m4a",
+    "mp4": "mp4",
+    "mp3": "mp3",
+    "flac": "flac",
+    "ogg": "ogg",
+    "opus": "ogg",
+    "wav": "wav",
+    "webm": "webm",
+}
+
+
+# Staged audio lives this long before the bucket lifecycle rule removes it.
+# The default 0 uses per-job uuid keys that are deleted as soon as the job
+# finishes, and leaves the bucket's lifecycle configuration alone.
+DEFAULT_STAGING_TTL_DAYS = 0
+STAGING_LIFECYCLE_RULE_ID = "youtube-to-docs-stt-staging"
+
+# (provider, bucket, prefix) -> whether an expiry rule is in place
+_lifecycle_checked: Dict[Tuple[str, str, str], bool] = {}
+
+
+def staging_ttl_days() -> int:
+    """Returns YTD_STT_STAGING_TTL_DAYS (0 disables staging deduplication)."""
+    value = os.environ.get("YTD_STT_STAGING_TTL_DAYS", str(DEFAULT_STAGING_TTL_DAYS))
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        print(f"Warning: Invalid YTD_STT_STAGING_TTL_DAYS '{value}', using default.")
+        return DEFAULT_STAGING_TTL_DAYS
+
+
+def staging_object_fresh(created: Optional[datetime]) -> bool:
+    """Returns whether a staged object created at ``created`` can be reused.
+
+    Objects within a margin (half the TTL, at most a day) of expiring are
+    uploaded again, so the lifecycle rule cannot delete them mid-job.
+    """
+    ttl = staging_ttl_days()
+    if not ttl or created is None:
+        return False
+    lifetime = timedelta(days=ttl)
+    margin = min(lifetime / 2, timedelta(days=1))
+    return datetime.now(timezone.utc) - created < lifetime - margin
+
+
+def staging_audio_hash(audio_path: str) -> str:
+    """Returns the hash used to key staged audio, or "" when dedup is off."""
+    if not staging_ttl_days():
+        return ""
+    try:
+        return file_sha256(audio_path)
+    except OSError:
+        return ""
+
+
+def ensure_gcs_staging_lifecycle(bucket: Any, prefix: str) -> bool:
+    """Adds (once per process) a delete-after-TTL rule for staged GCS audio.
+
+    Returns whether the rule is in place. Without it, staged audio must be
+    deleted after use.
+    """
+    ttl = staging_ttl_days()
+    marker = ("gcs", bucket.name, prefix)
+    if not ttl:
+        return False
+    if marker in _lifecycle_checked:
+        return _lifecycle_checked[marker]
+    _lifecycle_checked[marker] = False
+    try:
+        bucket.reload()
+        for rule in bucket.lifecycle_rules:
+            condition = rule.get("condition", {})
+            if rule.get("action", {}).get("type") == "Delete" and prefix in (
+                condition.get("matchesPrefix") or []
+            ):
+                _lifecycle_checked[marker] = True
+                return True
+        bucket.add_lifecycle_delete_rule(age=ttl, matches_prefix=[prefix])
+        bucket.patch()
+        print(f"Added {ttl}-day lifecycle rule for gs://{bucket.name}/{prefix}")
+    except Exception as e:
+        print(
+            f"Warning: Could not set a lifecycle rule on gs://{bucket.name} ({e}). "
+            "Staged audio will be deleted after each job instead."
+        )
+        return False
+    _lifecycle_checked[marker] = True
+    return True
+
+
+def ensure_s3_staging_lifecycle(s3_client: Any, bucket_name: str, prefix: str) -> bool:
+    """Adds (once per process) a delete-after-TTL rule for staged S3 audio.
+
+    Existing lifecycle rules on the bucket are kept. Returns whether the rule
+    is in place. Without it, staged audio must be deleted after use.
+    """
+    ttl = staging_ttl_days()
+    marker = ("s3", bucket_name, prefix)
+    if not ttl:
+        return False
+    if marker in _lifecycle_checked:
+        return _lifecycle_checked[marker]
+    _lifecycle_checked[marker] = False
+    try:
+        try:
+            rules = s3_client.get_bucket_lifecycle_configuration(Bucket=bucket_name)[
+                "Rules"
+            ]
+        except Exception as e:
+            if "NoSuchLifecycleConfiguration" not in str(e):
+                raise
+            rules = []
+        if any(rule.get("ID") == STAGING_LIFECYCLE_RULE_ID for rule in rules):
+            _lifecycle_checked[marker] = True
+            return True
+        rules.append(
+            {
+                "ID": STAGING_LIFECYCLE_RULE_ID,
+                "Filter": {"Prefix": prefix},
+                "Status": "Enabled",
+                "Expiration": {"Days": ttl},
+            }
+        )
+        s3_client.put_bucket_lifecycle_configuration(
+            Bucket=bucket_name, LifecycleConfiguration={"Rules": rules}
+        )
+        print(f"Added {ttl}-day lifecycle rule for s3://{bucket_name}/{prefix}")
+    except Exception as e:
+        print(
+            f"Warning: Could not set a lifecycle rule on s3://{bucket_name} ({e}). "
+            "Staged audio will be deleted after each job instead."
+        )
+        return False
+    _lifecycle_checked[marker] = True
+    return True
+
+
+class STTJournal:
+    """Local JSON record of submitted long-running STT operations.
+
+    Every GCP ``batch_recognize`` operation and AWS Transcribe job is written
+    here (with the video URL, model, language, chunk offsets and the staged
+    objects) before waiting on it. A later run that finds an entry re-attaches
+    to the operation instead of uploading and paying for the audio again.
+    Entries are removed once the results are collected and the staged objects
+    are cleaned up.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(get_cache_dir(), "stt-journal.json")
+
+    @staticmethod
+    def key(provider: str, model_name: str, url: str, language: str) -> str:
+        return f"{provider}|{model_name}|{url}|{language}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f).get("entries", {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read STT journal {self.path}: {e}")
+            return {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "entries": entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not write STT journal {self.path}: {e}")
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return self._load()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[key] = {**entry, "updated_at": time.time()}
+            self._save(entries)
+
+    def update(self, key: str, **fields: Any) -> None:
+        with self._lock:
+            entries = self._load()
+            if key in entries:
+                entries[key].update(fields, updated_at=time.time())
+                self._save(entries)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+
+
+class STTChunkCache:
+    """Local cache of per-chunk STT results for long, chunked audio.
+
+    Each chunk's transcript text and SRT cues are stored under a key built
+    from the audio's SHA-256, the model, the language, the chunk index and its
+    offset. A rerun after a partial failure only retranscribes missing chunks.
+    Chunks that came back empty (silence) are stored with an ``empty`` marker,
+    so they are neither resent nor reported as missing.
+    """
+
+    # Bumped whenever the stored entry format changes
+    VERSION = 2
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or get_cache_dir("stt-chunks")
+
+    def _path(
+        self, audio_hash: str, model_name: str, language: str, index: int, offset: float
+    ) -> str:
+        key = (
+            f"v{self.VERSION}|{audio_hash}|{model_name}|{language}|{index}|{offset:.3f}"
+        )
+        return os.path.join(
+            self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+    def get(
+        self, audio_hash: str, model_name: str, language: str, index: int, offset: float
+    ) -> Optional[Tuple[str, Cues]]:
+        path = self._path(audio_hash, model_name, language, index, offset)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("empty"):
+                return "", Cues()
+            return data["text"], Cues(data["start_ms"], data["end_ms"], data["cues"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Ignoring unreadable chunk cache entry {path}: {e}")
+            return None
+
+    def put(
+        self,
+        audio_hash: str,
+        model_name: str,
+        language: str,
+        index: int,
+        offset: float,
+        text: str,
+        cues: Cues,
+    ) -> None:
+        path = self._path(audio_hash, model_name, language, index, offset)
+        data: Dict[str, Any]
+        if not text and not len(cues):
+            data = {"empty": True}
+        else:
+            data = {
+                "text": text,
+                "start_ms": cues.start_ms.tolist(),
+                "end_ms": cues.end_ms.tolist(),
+                "cues": cues.text,
+            }
+        try:
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            print(f"Warning: Could not cache chunk {index} result: {e}")
+
+
+def aws_language_code(language: str) -> str:
+    """Maps a 2-letter language code to an AWS Transcribe locale."""
+    if language == "en":
+        return "en-US"
+    # AWS uses different codes sometimes, but en-US, es-ES etc are common
+    return language if "-" in language else f"{language}-{language.upper()}"
+
+
+def parse_aws_transcript(transcript_json: Dict[str, Any]) -> Tuple[str, str]:
+    """Converts an AWS Transcribe result document into (text, srt_content)."""
+    results = transcript_json.get("results", {})
+    transcript_text = ""
+    transcripts = results.get("transcripts", [])
+    if transcripts:
+        transcript_text = transcripts[0].get("transcript", "")
+
+    # For SRT, we need word-level timestamps
+    builder = CueBuilder(break_on_sentence_end=False)
+    for item in results.get("items", []):
+        content = item["alternatives"][0]["content"]
+        if item.get("type") == "punctuation":
+            builder.attach_punctuation(content)
+            continue
+        builder.add_word(content, float(item["start_time"]), float(item["end_time"]))
+
+    return transcript_text, builder.build().to_srt()
+
+
+@dataclass
+class TranscribeJob:
+    """A submitted AWS Transcribe job and, once finished, its result."""
+
+    job_name: str
+    media_key: str
+    output_key: str
+    status: str = "IN_PROGRESS"
+    result: Optional[Tuple[str, str, int, int]] = None
+    journal_key: Optional[str] = None
+    # Content-addressed media is shared and expires via the bucket lifecycle
+    keep_media: bool = False
+
+
+class AWSTranscribeManager:
+    """Submits AWS Transcribe jobs and polls all pending jobs together.
+
+    One S3 client and one Transcribe client are shared by every job. Jobs are
+    keyed by ``(url, language)`` so a job submitted ahead of time (see
+    :meth:`submit`) is picked up by the later :meth:`wait` for the same video.
+    """
+
+    def __init__(self, bucket_name: str, region: str):
+        self.bucket_name = bucket_name
+        self.region = region
+        self.s3_client = boto3.client("s3", region_name=region)
+        self.transcribe_client = boto3.client("transcribe", region_name=region)
+        self.jobs: Dict[Tuple[str, str], TranscribeJob] = {}
+        self.journal = STTJournal()
+        self._lock = threading.RLock()
+        # Names of finished jobs whose results a poll() is downloading
+        self._collecting: Set[str] = set()
+
+    def has_job(self, key: Tuple[str, str]) -> bool:
+        with self._lock:
+            return key in self.jobs
+
+    def submit(
+        self, key: Tuple[str, str], audio_path: str, language: str = "en"
+    ) -> Optional[str]:
+        """Uploads the audio and starts a job. Returns an error string or None."""
+        from botocore.exceptions import ClientError
+
+        with self._lock:
+            if key in self.jobs:
+                return None
+
+        url, _ = key
+        journal_key = STTJournal.key("aws", "aws-transcribe", url, language)
+        entry = self.journal.get(journal_key)
+        if entry and self.resume(key, entry, journal_key):
+            return None
+
+        job_name = f"ytd_transcribe_{uuid.uuid4()}"
+        audio_ext = os.path.splitext(audio_path)[1].lstrip(".").lower() or "m4a"
+        output_key = f"transcripts/{job_name}.json"
+
+        # Content-addressed staging lets reruns and other jobs reuse the upload,
+        # but only once an expiry rule is confirmed on the bucket
+        audio_hash = staging_audio_hash(audio_path)
+        if audio_hash and not ensure_s3_staging_lifecycle(
+            self.s3_client, self.bucket_name, "temp_audio/"
+        ):
+            audio_hash = ""
+        if audio_hash:
+            media_key = f"temp_audio/ytd_{audio_hash}.{audio_ext}"
+        else:
+            media_key = f"temp_audio/{job_name}.{audio_ext}"
+
+        if audio_hash and self._staged_object_fresh(media_key):
+            print(f"Reusing staged audio s3://{self.bucket_name}/{media_key}")
+        else:
+            print(f"Uploading audio to s3://{self.bucket_name}/{media_key}...")
+            try:
+                self.s3_client.upload_file(audio_path, self.bucket_name, media_key)
+            except ClientError as e:
+                return f"Error uploading to S3: {e}"
+
+        print(f"Starting AWS Transcribe job: {job_name}...")
+        try:
+            self.transcribe_client.start_transcription_job(
+                TranscriptionJobName=job_name,
+                Media={"MediaFileUri": f"s3://{self.bucket_name}/{media_key}"},
+                MediaFormat=AWS_MEDIA_FORMATS.get(audio_ext, "m4a"),
+                LanguageCode=aws_language_code(language),
+                OutputBucketName=self.bucket_name,
+                OutputKey=output_key,
+                Settings={
+                    "ShowAlternatives": False,
+                },
+            )
+        except ClientError as e:
+            return f"Error starting Transcribe job: {e}"
+
+        self.journal.put(
+            journal_key,
+            {
+                "provider": "aws",
+                "model": "aws-transcribe",
+                "url": url,
+                "language": language,
+                "bucket": self.bucket_name,
+                "region": self.region,
+                "job_name": job_name,
+                "media_key": media_key,
+                "output_key": output_key,
+                "keep_media": bool(audio_hash),
+            },
+        )
+        with self._lock:
+            self.jobs[key] = TranscribeJob(
+                job_name,
+                media_key,
+                output_key,
+                journal_key=journal_key,
+                keep_media=bool(audio_hash),
+            )
+        return None
+
+    def _staged_object_fresh(self, key: str) -> bool:
+        """Returns whether a staged object exists and is not about to expire."""
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        except Exception:
+            return False
+        # Uploading again resets the object's age for the lifecycle rule
+        return staging_object_fresh(head.get("LastModified"))
+
+    def resume(
+        self, key: Tuple[str, str], entry: Dict[str, Any], journal_key: str
+    ) -> bool:
+        """Re-attaches to a journaled job from a previous run.
+
+        Returns False (and forgets the entry) if the job no longer exists.
+        """
+        from botocore.exceptions import ClientError
+
+        with self._lock:
+            if key in self.jobs:
+                return True
+        job_name = entry["job_name"]
+        try:
+            self.transcribe_client.get_transcription_job(TranscriptionJobName=job_name)
+        except ClientError as e:
+            print(f"Could not re-attach to AWS Transcribe job {job_name}: {e}")
+            self.journal.remove(journal_key)
+            return False
+
+        print(f"Re-attaching to AWS Transcribe job from a previous run: {job_name}")
+        with self._lock:
+            self.jobs[key] = TranscribeJob(
+                job_name,
+                entry["media_key"],
+                entry["output_key"],
+                journal_key=journal_key,
+                keep_media=entry.get("keep_media", False),
+            )
+        return True
+
+    def _collect(
+        self, job: TranscribeJob, status: str, job_info: Dict[str, Any]
+    ) -> Tuple[str, str, int, int]:
+        """Downloads and parses a finished job, then removes its S3 objects."""
+        if status == "FAILED":
+            reason = job_info.get("FailureReason", "Unknown failure")
+            try:
+                if not job.keep_media:
+                    self.s3_client.delete_object(
+                        Bucket=self.bucket_name, Key=job.media_key
+                    )
+            except Exception as e:
+                print(f"Warning: Cleanup failed: {e}")
+            if job.journal_key:
+                self.journal.remove(job.journal_key)
+            return (f"AWS Transcribe job failed: {reason}", "", 0, 0)
+
+        print(
+            f"Downloading transcript from s3://{self.bucket_name}/{job.output_key}..."
+        )
+        try:
+            obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=job.output_key)
+            transcript_json = json.loads(obj["Body"].read().decode("utf-8"))
+        except Exception as e:
+            return (f"Error downloading transcript from S3: {e}", "", 0, 0)
+
+        try:
+            if not job.keep_media:
+                self.s3_client.delete_object(Bucket=self.bucket_name, Key=job.media_key)
+            self.s3_client.delete_object(Bucket=self.bucket_name, Key=job.output_key)
+        except Exception as e:
+            print(f"Warning: Cleanup failed: {e}")
+
+        # Results are collected, so there is nothing left to re-attach to
+        if job.journal_key:
+            self.journal.remove(job.journal_key)
+
+        transcript_text, srt_content = parse_aws_transcript(transcript_json)
+        return (transcript_text, srt_content, 0, 0)
+
+    def poll(self) -> int:
+        """Checks every pending job once. Returns how many finished.
+
+        The lock only guards the job table: status requests, transcript
+        downloads and S3 cleanup run outside it, so other threads can submit
+        or wait meanwhile. A finished job is claimed under the lock first, so
+        concurrent polls never collect it twice.
+        """
+        from botocore.exceptions import ClientError
+
+        with self._lock:
+            pending = [
+                job
+                for job in self.jobs.values()
+                if job.result is None and job.job_name not in self._collecting
+            ]
+        finished = 0
+        for job in pending:
+            try:
+                resp = self.transcribe_client.get_transcription_job(
+                    TranscriptionJobName=job.job_name
+                )
+            except ClientError as e:
+                print(f"Error polling job status: {e}")
+                continue
+            job_info = resp["TranscriptionJob"]
+            status = job_info["TranscriptionJobStatus"]
+            with self._lock:
+                job.status = status
+                if status not in ["COMPLETED", "FAILED"]:
+                    continue
+                if job.result is not None or job.job_name in self._collecting:
+                    continue  # Another thread is collecting it
+                self._collecting.add(job.job_name)
+            try:
+                result = self._collect(job, status, job_info)
+            finally:
+                with self._lock:
+                    self._collecting.discard(job.job_name)
+            with self._lock:
+                job.result = result
+            finished += 1
+        return finished
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for job in self.jobs.values() if job.result is None)
+
+    def wait(self, key: Tuple[str, str]) -> Tuple[str, str, int, int]:
+        """Blocks until the job for ``key`` finishes and returns its result.
+
+        Every pending job is polled on each round, so results for other
+        videos are collected as they finish instead of one after another.
+        """
+        with self._lock:
+            job = self.jobs.get(key)
+        if job is None:
+            return "Error: No AWS Transcribe job submitted for this audio.", "", 0, 0
+
+        if job.result is None:
+            print(
+                f"Waiting for AWS Transcribe job to complete "
+                f"({self.pending_count()} pending)..."
+            )
+        delay = POLL_INITIAL_DELAY_SEC
+        while job.result is None:
+            if self.poll():
+                delay = POLL_INITIAL_DELAY_SEC
+            if job.result is not None:
+                break
+            time.sleep(delay)
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY_SEC)
+
+        with self._lock:
+            self.jobs.pop(key, None)
+        return job.result
+
+
+_managers: Dict[Tuple[str, str], AWSTranscribeManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_aws_transcribe_manager(bucket_name: str, region: str) -> AWSTranscribeManager:
+    """Returns the shared manager (and its boto3 clients) for a bucket/region."""
+    with _managers_lock:
+        manager = _managers.get((bucket_name, region))
+        if manager is None:
+            manager = AWSTranscribeManager(bucket_name, region)
+            _managers[(bucket_name, region)] = manager
+        return manager
+
+
+def resume_stt_operations(model_name: str, urls: List[str]) -> int:
+    """Re-attaches to journaled STT operations for the videos in this run.
+
+    AWS Transcribe jobs are adopted by the shared manager straight away so they
+    are polled alongside new jobs. GCP operations are picked up when the video
+    is transcribed (see ``_transcribe_gcp``). Returns the number of entries.
+    """
+    wanted = set(urls)
+    entries = {
+        key: entry
+        for key, entry in STTJournal().entries().items()
+        if entry.get("model") == model_name and entry.get("url") in wanted
+    }
+    if not entries:
+        return 0
+
+    print(
+        f"Found {len(entries)} STT operation(s) from a previous run; "
+        "re-attaching instead of resubmitting."
+    )
+    for key, entry in entries.items():
+        if entry.get("provider") == "aws" and boto3 is not None:
+            manager = get_aws_transcribe_manager(entry["bucket"], entry["region"])
+            manager.resume((entry["url"], entry["language"]), entry, key)
+    return len(entries)
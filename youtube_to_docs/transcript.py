@@ -16,13 +16,44 @@ from youtube_transcript_api import (
     YouTubeTranscriptApi,
 )
 
+from youtube_to_docs.srt import Cues, format_timestamp, to_ms
+
+# yt-dlp audio acquisition profiles.
+# "archive" keeps the best available stream and normalizes it to 192 kbps.
+# "stt" takes the smallest stream that is still fine for speech recognition and
+# only remuxes it (AAC in m4a is copied as-is); a transcode at 64 kbps happens
+# only when no m4a/AAC stream exists (e.g. Opus-only videos).
+AUDIO_PROFILES: Dict[str, Dict[str, str]] = {
+    "archive": {
+        "format": "bestaudio[ext={ext}]/bestaudio",
+        "preferredquality": "192",
+    },
+    "stt": {
+        "format": (
+            "worstaudio[ext={ext}][abr>=?48]/bestaudio[ext={ext}]"
+            "/worstaudio[abr>=?48]/bestaudio"
+        ),
+        "preferredquality": "64",
+    },
+}
+
+# Parallel fragment downloads for DASH/HLS audio streams.
+DEFAULT_CONCURRENT_FRAGMENTS = 4
+
 
 def extract_audio(
     video_id: str,
     output_dir: str,
     ext: str = "m4a",
+    profile: str = "archive",
 ) -> Optional[str]:
-    """Extracts audio from a YouTube video using yt-dlp."""
+    """Extracts audio from a YouTube video using yt-dlp.
+
+    ``profile`` selects an entry of ``AUDIO_PROFILES``: ``archive`` (default)
+    keeps full quality, ``stt`` downloads the lowest adequate bitrate without
+    re-encoding. Fragments are fetched concurrently
+    (``YTD_YTDLP_CONCURRENT_FRAGMENTS``, default 4).
+    """
     try:
         import static_ffmpeg
         import yt_dlp
@@ -35,19 +66,36 @@ def extract_audio(
             'Please run with: uvx "youtube-to-docs[all]"'
         ) from e
 
+    if profile not in AUDIO_PROFILES:
+        print(f"Warning: Unknown audio profile '{profile}', using 'archive'.")
+        profile = "archive"
+    settings = AUDIO_PROFILES[profile]
+
+    try:
+        concurrent_fragments = int(
+            os.environ.get(
+                "YTD_YTDLP_CONCURRENT_FRAGMENTS", DEFAULT_CONCURRENT_FRAGMENTS
+            )
+        )
+    except ValueError:
+        concurrent_fragments = DEFAULT_CONCURRENT_FRAGMENTS
+
     url = f"https://www.youtube.com/watch?v={video_id}"
     os.makedirs(output_dir, exist_ok=True)
 
     ydl_opts: Dict[str, Any] = {
-        "format": f"bestaudio[ext={ext}]/bestaudio",
+        "format": settings["format"].format(ext=ext),
         "outtmpl": os.path.join(output_dir, "%(id)s.%(ext)s"),
         "quiet": True,
         "no_warnings": True,
+        "concurrent_fragment_downloads": max(concurrent_fragments, 1),
         "postprocessors": [
             {
+                # Copies the stream when it is already in the target codec
+                # (AAC -> m4a); otherwise transcodes at preferredquality
                 "key": "FFmpegExtractAudio",
                 "preferredcodec": ext,
-                "preferredquality": "192",
+                "preferredquality": settings["preferredquality"],
             }
         ],
     }
@@ -359,31 +407,19 @@ def fetch_transcript(
 
 def format_as_srt(transcript_data: List[Any]) -> str:
     """Formats raw transcript data (list of dicts/objects) as an SRT string."""
-    srt_output = []
+    cues = Cues()
 
     def get_val(item, key):
         return item[key] if isinstance(item, dict) else getattr(item, key)
 
-    for i, entry in enumerate(transcript_data, 1):
+    for entry in transcript_data:
         start = get_val(entry, "start")
         duration = get_val(entry, "duration")
-        end = start + duration
-        text = get_val(entry, "text")
-
-        start_time = format_srt_timestamp(start)
-        end_time = format_srt_timestamp(end)
-
-        srt_output.append(f"{i}")
-        srt_output.append(f"{start_time} --> {end_time}")
-        srt_output.append(f"{text}\n")
+        cues.append(to_ms(start), to_ms(start + duration), get_val(entry, "text"))
 
-    return "\n".join(srt_output)
+    return cues.to_srt()
 
 
 def format_srt_timestamp(seconds: float) -> str:
     """Formats seconds into SRT timestamp format (HH:MM:SS,mmm)."""
-    hrs = int(seconds // 3600)
-    mins = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    msecs = int((seconds * 1000) % 1000)
-    return f"{hrs:02d}:{mins:02d}:{secs:02d},{msecs:03d}"
+    return format_timestamp(to_ms(seconds))
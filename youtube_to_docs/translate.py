@@ -22,11 +22,17 @@ Usage (CLI)::
         -tr gcp-translate-fr
 """
 
+import json
 import os
-from typing import Any, Optional, Tuple
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from youtube_to_docs.constants import KNOWN_SRT_SOURCE_PREFIXES
-from youtube_to_docs.utils import get_gcp_client
+from youtube_to_docs.providers import llm_max_concurrency
+from youtube_to_docs.srt import Cues
+from youtube_to_docs.translation_memory import get_translation_memory
+from youtube_to_docs.utils import chunk_text_by_bytes, get_gcp_client, thread_map
 
 try:
     import boto3
@@ -88,6 +94,40 @@ def parse_translate_arg(translate_arg: str) -> Tuple[str, str]:
     return model, lang
 
 
+def parse_translate_languages(translate_arg: str) -> Tuple[str, List[str]]:
+    """Parse a --translate argument that may list several languages.
+
+    The first comma-separated item is a full `{model}-{language}`; later
+    items are either bare languages or `{model}-{language}` with the same
+    model. Duplicate languages are dropped.
+
+    Examples:
+      "gemini-3.5-flash-lite-es"            -> ("gemini-3.5-flash-lite", ["es"])
+      "aws-translate-es,fr,korean"          -> ("aws-translate", ["es", "fr", "ko"])
+      "gcp-translate-es,gcp-translate-fr"   -> ("gcp-translate", ["es", "fr"])
+
+    Returns (model_name, language_codes).
+    """
+    items = [item.strip() for item in translate_arg.split(",") if item.strip()]
+    if not items:
+        raise ValueError("Invalid --translate format: no model or language given.")
+    model, lang = parse_translate_arg(items[0])
+    languages = [lang]
+    for item in items[1:]:
+        if "-" in item:
+            item_model, lang = parse_translate_arg(item)
+            if item_model != model:
+                raise ValueError(
+                    f"Invalid --translate format: '{translate_arg}'. "
+                    "All languages must use the same translation model."
+                )
+        else:
+            lang = LANGUAGE_NAME_TO_CODE.get(item.lower(), item.lower())
+        if lang not in languages:
+            languages.append(lang)
+    return model, languages
+
+
 def parse_suggest_captions_arg(arg: str) -> Tuple[str, Optional[str]]:
     """Parse a --suggest-corrected-captions argument in the format
     `{model}` or `{model}-{source}`.
@@ -116,68 +156,56 @@ def parse_suggest_captions_arg(arg: str) -> Tuple[str, Optional[str]]:
 
 
 _AWS_TRANSLATE_BYTE_LIMIT = 10_000
+# Stands in for line breaks inside one text of an AWS Translate batch, where
+# "\n" separates the texts; the translated marker may gain spaces or case
+_AWS_LINE_BREAK = "<br>"
+_AWS_LINE_BREAK_RE = re.compile(r"[ \t]*<\s*br\s*/?\s*>[ \t]*", re.IGNORECASE)
 
+# Concurrent requests per translation (YTD_TRANSLATE_MAX_WORKERS)
+DEFAULT_TRANSLATE_MAX_WORKERS = 4
 
-def _chunk_text(text: str, max_bytes: int = _AWS_TRANSLATE_BYTE_LIMIT) -> list[str]:
-    """Split text into chunks that each fit within max_bytes (UTF-8 encoded).
+# Translation clients, built once per process and shared across threads
+_clients: Dict[Tuple[str, str], Any] = {}
+_clients_lock = threading.Lock()
 
-    Splits on blank lines first, then on single newlines, to keep logical
-    blocks (e.g. SRT entries, paragraphs) together wherever possible.
-    If a single line is too long, it splits it into smaller pieces.
-    """
-    chunks: list[str] = []
-    current_lines: list[str] = []
-    current_bytes = 0
 
-    for line in text.splitlines(keepends=True):
-        line_bytes = len(line.encode("utf-8"))
-
-        # If this single line is longer than the absolute limit,
-        # we must split it.
-        if line_bytes > max_bytes:
-            # First, flush anything currently in current_lines
-            if current_lines:
-                chunks.append("".join(current_lines))
-                current_lines = []
-                current_bytes = 0
-
-            # Split the giant line into max_bytes chunks
-            # We must be careful with UTF-8 character boundaries.
-            remaining_bytes = line.encode("utf-8")
-            while len(remaining_bytes) > max_bytes:
-                # Find a split point that doesn't break a UTF-8 character
-                split_point = max_bytes
-                # UTF-8 continuation bytes start with 10xxxxxx (0x80 to 0xBF)
-                while split_point > 0 and (remaining_bytes[split_point] & 0xC0) == 0x80:
-                    split_point -= 1
-
-                chunks.append(remaining_bytes[:split_point].decode("utf-8"))
-                remaining_bytes = remaining_bytes[split_point:]
-
-            if remaining_bytes:
-                current_lines.append(remaining_bytes.decode("utf-8"))
-                current_bytes = len(remaining_bytes)
-            continue
-
-        if current_bytes + line_bytes > max_bytes and current_lines:
-            chunks.append("".join(current_lines))
-            current_lines = []
-            current_bytes = 0
+def translate_max_workers() -> int:
+    """Returns YTD_TRANSLATE_MAX_WORKERS (1 translates chunks serially)."""
+    value = os.environ.get(
+        "YTD_TRANSLATE_MAX_WORKERS", str(DEFAULT_TRANSLATE_MAX_WORKERS)
+    )
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Invalid YTD_TRANSLATE_MAX_WORKERS '{value}', using default.")
+        return DEFAULT_TRANSLATE_MAX_WORKERS
 
-        current_lines.append(line)
-        current_bytes += line_bytes
 
-    if current_lines:
-        chunks.append("".join(current_lines))
+def _get_aws_translate_client() -> Any:
+    region = os.environ.get("AWS_REGION", "us-east-1")
+    with _clients_lock:
+        key = ("aws", region)
+        if key not in _clients:
+            _clients[key] = boto3.client("translate", region_name=region)
+        return _clients[key]
+
 
-    return chunks
+def _get_gcp_translate_client() -> Any:
+    with _clients_lock:
+        key = ("gcp", "")
+        if key not in _clients:
+            client = get_gcp_client(google_translate.Client, "GCP Translate")
+            if client is None:
+                return None
+            _clients[key] = client
+        return _clients[key]
 
 
 def _translate_aws(text: str, target_language: str) -> Tuple[str, int, int]:
     """Translate text using AWS Translate.
 
     Automatically splits input into chunks to respect the 10,000-byte per-request
-    limit, then joins the translated chunks.
+    limit, translates them concurrently and joins them in order.
 
     Uses boto3 default credential chain (env vars, ~/.aws/credentials, IAM role, etc.).
     Returns (translated_text, 0, 0) — AWS Translate does not report token counts.
@@ -190,19 +218,18 @@ def _translate_aws(text: str, target_language: str) -> Tuple[str, int, int]:
             0,
         )
 
-    region = os.environ.get("AWS_REGION", "us-east-1")
-    client = boto3.client("translate", region_name=region)
+    client = _get_aws_translate_client()
 
-    chunks = _chunk_text(text)
-    translated_chunks: list[str] = []
-    for chunk in chunks:
+    def _translate_chunk(chunk: str) -> str:
         response = client.translate_text(
             Text=chunk,
             SourceLanguageCode="en",
             TargetLanguageCode=target_language,
         )
-        translated_chunks.append(response["TranslatedText"])
+        return response["TranslatedText"]
 
+    chunks = chunk_text_by_bytes(text, _AWS_TRANSLATE_BYTE_LIMIT, by_line=True)
+    translated_chunks = thread_map(_translate_chunk, chunks, translate_max_workers())
     return "".join(translated_chunks), 0, 0
 
 
@@ -213,7 +240,7 @@ def _translate_gcp(text: str, target_language: str) -> Tuple[str, int, int]:
     """Translate text using Google Cloud Translation API (v2/Basic).
 
     Automatically splits input into chunks to respect the 30,000-character
-    per-request limit, then joins the translated chunks.
+    per-request limit, translates them concurrently and joins them in order.
 
     Uses Application Default Credentials (ADC): set GOOGLE_APPLICATION_CREDENTIALS
     to a service account key file, or authenticate via `gcloud auth application-default
@@ -228,7 +255,7 @@ def _translate_gcp(text: str, target_language: str) -> Tuple[str, int, int]:
             0,
         )
 
-    client = get_gcp_client(google_translate.Client, "GCP Translate")
+    client = _get_gcp_translate_client()
     if client is None:
         return (
             "Error: Google Cloud Translation client could not be initialized. "
@@ -238,20 +265,505 @@ def _translate_gcp(text: str, target_language: str) -> Tuple[str, int, int]:
             0,
         )
 
-    chunks = _chunk_text(text, max_bytes=_GCP_TRANSLATE_CHAR_LIMIT)
-    translated_chunks: list[str] = []
-    for chunk in chunks:
+    def _translate_chunk(chunk: str) -> str:
         result = client.translate(
             chunk,
             target_language=target_language,
             source_language="en",
             format_="text",
         )
-        translated_chunks.append(result["translatedText"])
+        return result["translatedText"]
 
+    chunks = chunk_text_by_bytes(text, _GCP_TRANSLATE_CHAR_LIMIT, by_line=True)
+    translated_chunks = thread_map(_translate_chunk, chunks, translate_max_workers())
     return "".join(translated_chunks), 0, 0
 
 
+# SRT cue batches: characters per LLM request, segments per GCP request
+_SRT_BATCH_MAX_CHARS = 4_000
+_GCP_TRANSLATE_MAX_SEGMENTS = 128
+
+# LLM text translation: bytes per request, so the translated chunk stays well
+# within output-token limits
+_LLM_TRANSLATE_CHUNK_BYTES = 12_000
+# A translated chunk smaller than this fraction of its source (in UTF-8 bytes)
+# is treated as truncated and retried once
+_MIN_TRANSLATION_RATIO = 0.3
+
+
+def _batch_texts(
+    texts: List[str],
+    max_chars: int,
+    max_items: Optional[int] = None,
+    separator_chars: int = 0,
+) -> List[List[str]]:
+    """Groups texts into consecutive batches bounded by size and count.
+
+    ``separator_chars`` is counted between texts, for batches that are sent
+    joined into one string.
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_chars = 0
+    for text in texts:
+        size = len(text) + (separator_chars if current else 0)
+        if current and (
+            current_chars + size > max_chars
+            or (max_items is not None and len(current) >= max_items)
+        ):
+            batches.append(current)
+            current = []
+            current_chars = 0
+            size = len(text)
+        current.append(text)
+        current_chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _translate_aws_batch(texts: List[str], target_language: str) -> List[str]:
+    """Translates many short texts with AWS Translate.
+
+    AWS Translate has no list input, so each batch is sent as one line per
+    text. Line breaks inside a text (multi-line SRT cues) are sent as
+    ``<br>`` and restored afterwards. A batch whose line count does not
+    survive translation is retried one text at a time.
+    """
+    if boto3 is None:
+        raise ImportError(
+            "boto3 is required for AWS Translate. Install with `pip install boto3`"
+        )
+
+    client = _get_aws_translate_client()
+
+    def _translate(text: str) -> str:
+        response = client.translate_text(
+            Text=text,
+            SourceLanguageCode="en",
+            TargetLanguageCode=target_language,
+        )
+        return response["TranslatedText"]
+
+    def _translate_lines(batch: List[str]) -> List[str]:
+        result = _translate("\n".join(batch)).split("\n")
+        if len(result) != len(batch):
+            result = [
+                _translate(line.replace(_AWS_LINE_BREAK, "\n")) if line else ""
+                for line in batch
+            ]
+        return [_AWS_LINE_BREAK_RE.sub("\n", line).strip() for line in result]
+
+    lines = [
+        _AWS_LINE_BREAK.join(line.strip() for line in text.strip().splitlines())
+        for text in texts
+    ]
+    # Leave headroom for multi-byte characters in the byte-limited request
+    batches = _batch_texts(lines, _AWS_TRANSLATE_BYTE_LIMIT // 4, separator_chars=1)
+    results = thread_map(_translate_lines, batches, translate_max_workers())
+    return [line for result in results for line in result]
+
+
+def _translate_gcp_batch(texts: List[str], target_language: str) -> List[str]:
+    """Translates many short texts with the Cloud Translation list input."""
+    if google_translate is None:
+        raise ImportError(
+            "google-cloud-translate is required for GCP Translate. "
+            "Install with `pip install google-cloud-translate`"
+        )
+
+    client = _get_gcp_translate_client()
+    if client is None:
+        raise RuntimeError(
+            "Google Cloud Translation client could not be initialized. "
+            "Please check your credentials "
+            "(run 'gcloud auth application-default login')."
+        )
+
+    def _translate_segments(batch: List[str]) -> List[str]:
+        results = client.translate(
+            batch,
+            target_language=target_language,
+            source_language="en",
+            format_="text",
+        )
+        return [result["translatedText"] for result in results]
+
+    batches = _batch_texts(
+        texts, _GCP_TRANSLATE_CHAR_LIMIT, _GCP_TRANSLATE_MAX_SEGMENTS
+    )
+    results = thread_map(_translate_segments, batches, translate_max_workers())
+    return [text for result in results for text in result]
+
+
+def _translate_aws_documents(texts: List[str], target_language: str) -> List[str]:
+    """Translates several multi-line texts with AWS Translate.
+
+    AWS Translate has no list input, so the texts are sent as concurrent
+    requests (each chunked as usual by ``_translate_aws``).
+    """
+    return thread_map(
+        lambda text: _translate_aws(text, target_language)[0],
+        texts,
+        translate_max_workers(),
+    )
+
+
+def _translate_gcp_documents(texts: List[str], target_language: str) -> List[str]:
+    """Translates several multi-line texts with the Cloud Translation list input.
+
+    Texts that fit in one request share list requests; longer ones are chunked
+    on their own by ``_translate_gcp``.
+    """
+    results: List[Optional[str]] = [None] * len(texts)
+    short = [
+        i for i, text in enumerate(texts) if len(text) <= _GCP_TRANSLATE_CHAR_LIMIT
+    ]
+    if short:
+        try:
+            translated = _translate_gcp_batch(
+                [texts[i] for i in short], target_language
+            )
+        except Exception as e:
+            translated = [f"Error: {e}"] * len(short)
+        for i, text in zip(short, translated):
+            results[i] = text
+    for i, text in enumerate(texts):
+        if results[i] is None:
+            results[i] = _translate_gcp(text, target_language)[0]
+    return [text or "" for text in results]
+
+
+def _generate_limited(provider: Any, prompt: str) -> Tuple[str, int, int]:
+    """Calls the LLM while holding the model's concurrency slot."""
+    from youtube_to_docs.providers import get_rate_limiter
+
+    with get_rate_limiter(provider.model_name):
+        return provider.generate_content(prompt)
+
+
+def _llm_translate_prompt(text: str, target_language: str) -> str:
+    return (
+        f"Please translate the following text to {target_language}. "
+        "Return only the translated text without any preamble or explanation."
+        "\n\n"
+        f"{text}"
+    )
+
+
+def _covers(source: str, translated: str) -> bool:
+    """Whether a translated chunk looks complete relative to its source."""
+    if not translated or translated.startswith("Error:"):
+        return False
+    source_bytes = len(source.strip().encode("utf-8"))
+    translated_bytes = len(translated.strip().encode("utf-8"))
+    return translated_bytes >= source_bytes * _MIN_TRANSLATION_RATIO
+
+
+def _translate_llm_text(
+    provider: Any, text: str, target_language: str
+) -> Tuple[str, int, int]:
+    """Translates text with an LLM, in concurrent chunks when it is long.
+
+    The text is split on line boundaries by ``chunk_text_by_bytes``. Chunks run in
+    parallel under the model's rate limiter. Each chunk is checked for
+    truncation and retried once. The result is an error if any chunk still
+    fails, so a partial translation is never returned as complete.
+    """
+    chunks = chunk_text_by_bytes(text, _LLM_TRANSLATE_CHUNK_BYTES, by_line=True)
+    if len(chunks) <= 1:
+        return _generate_limited(provider, _llm_translate_prompt(text, target_language))
+
+    def _translate_chunk(chunk: str) -> Tuple[Optional[str], int, int]:
+        total_in = 0
+        total_out = 0
+        for _ in range(2):
+            translated, in_tok, out_tok = _generate_limited(
+                provider, _llm_translate_prompt(chunk, target_language)
+            )
+            total_in += in_tok
+            total_out += out_tok
+            if _covers(chunk, translated):
+                # Keep the blank lines and line breaks around the chunk
+                leading = chunk[: len(chunk) - len(chunk.lstrip())]
+                trailing = chunk[len(chunk.rstrip()) :]
+                return leading + translated.strip() + trailing, total_in, total_out
+        return None, total_in, total_out
+
+    results = thread_map(_translate_chunk, chunks, llm_max_concurrency())
+    total_in = sum(r[1] for r in results)
+    total_out = sum(r[2] for r in results)
+    missing = [str(i) for i, r in enumerate(results, 1) if r[0] is None]
+    if missing:
+        return (
+            f"Error: Translation incomplete, chunks {', '.join(missing)} of "
+            f"{len(chunks)} failed.",
+            total_in,
+            total_out,
+        )
+    return "".join(r[0] or "" for r in results), total_in, total_out
+
+
+def _parse_json_array(response: str, expected_len: int) -> Optional[List[str]]:
+    """Extracts a JSON array of strings from an LLM response."""
+    start = response.find("[")
+    end = response.rfind("]")
+    if start == -1 or end <= start:
+        return None
+    try:
+        items = json.loads(response[start : end + 1])
+    except ValueError:
+        return None
+    if not isinstance(items, list) or len(items) != expected_len:
+        return None
+    return [str(item) for item in items]
+
+
+def _translate_llm_batch(
+    provider: Any, texts: List[str], target_language: str
+) -> Tuple[List[str], int, int]:
+    """Translates texts with an LLM as a JSON array in, JSON array out.
+
+    A batch whose response is not an array of the same length is split in
+    half and retried, down to single texts.
+    """
+    prompt = (
+        f"Translate each string in the following JSON array to {target_language}. "
+        "Return only a JSON array of the translated strings, with exactly "
+        f"{len(texts)} items in the same order, without any preamble or "
+        "explanation.\n\n"
+        f"{json.dumps(texts, ensure_ascii=False)}"
+    )
+    response, in_tok, out_tok = _generate_limited(provider, prompt)
+    items = _parse_json_array(response or "", len(texts))
+    if items is not None:
+        return items, in_tok, out_tok
+
+    if len(texts) == 1:
+        translated, t_in, t_out = _generate_limited(
+            provider, _llm_translate_prompt(texts[0], target_language)
+        )
+        return [translated.strip()], in_tok + t_in, out_tok + t_out
+
+    mid = len(texts) // 2
+    first, f_in, f_out = _translate_llm_batch(provider, texts[:mid], target_language)
+    second, s_in, s_out = _translate_llm_batch(provider, texts[mid:], target_language)
+    return first + second, in_tok + f_in + s_in, out_tok + f_out + s_out
+
+
+def translate_texts(
+    model_name: str,
+    texts: List[str],
+    target_language: str,
+) -> Tuple[List[str], int, int]:
+    """Translate a list of short texts, keeping their order.
+
+    Texts found in the translation memory are not sent again, and repeated
+    texts are translated once. Translation services use their list/batch
+    inputs; LLMs get size-bounded JSON arrays. Raises on failure.
+
+    Returns (translated_texts, input_tokens, output_tokens).
+    """
+    memory = get_translation_memory()
+    known = memory.get_many(model_name, target_language, texts)
+    pending = [text for text in dict.fromkeys(texts) if text not in known]
+    in_tok = 0
+    out_tok = 0
+    if pending:
+        translated, in_tok, out_tok = _translate_texts_uncached(
+            model_name, pending, target_language
+        )
+        new = dict(zip(pending, translated))
+        memory.put_many(model_name, target_language, new)
+        known.update(new)
+    return [known[text] for text in texts], in_tok, out_tok
+
+
+def _translate_texts_uncached(
+    model_name: str,
+    texts: List[str],
+    target_language: str,
+) -> Tuple[List[str], int, int]:
+    from youtube_to_docs.providers import LLMProvider, TranslationProvider, get_provider
+
+    provider = get_provider(model_name)
+    if isinstance(provider, TranslationProvider):
+        translated = provider.translate_batch(texts, target_language)
+        if len(translated) != len(texts):
+            raise ValueError(
+                f"{model_name} returned {len(translated)} translations "
+                f"for {len(texts)} texts"
+            )
+        return translated, 0, 0
+    if isinstance(provider, LLMProvider):
+        results = thread_map(
+            lambda batch: _translate_llm_batch(provider, batch, target_language),
+            _batch_texts(texts, _SRT_BATCH_MAX_CHARS),
+            llm_max_concurrency(),
+        )
+        translated = [item for items, _, _ in results for item in items]
+        return translated, sum(r[1] for r in results), sum(r[2] for r in results)
+    raise NotImplementedError(f"Translation not implemented for {model_name}")
+
+
+def translate_srt(
+    model_name: str,
+    srt_content: str,
+    target_language: str,
+) -> Tuple[str, int, int]:
+    """Translate SRT subtitles, sending only the cue texts.
+
+    Sequence numbers and timings never reach the translation model; the SRT
+    is rebuilt locally with the original timings, so it is always valid.
+    Input without any parseable cue is translated as plain text.
+
+    Returns (translated_srt, input_tokens, output_tokens).
+    """
+    cues = Cues.parse(srt_content)
+    if not cues:
+        return translate_text(model_name, srt_content, target_language)
+
+    try:
+        translated, in_tok, out_tok = translate_texts(
+            model_name, cues.text, target_language
+        )
+    except Exception as e:
+        return f"Error: {e}", 0, 0
+
+    return Cues(cues.start_ms, cues.end_ms, translated).to_srt(), in_tok, out_tok
+
+
+def _parse_json_object(response: str, keys: List[str]) -> Dict[str, str]:
+    """Extracts the string values for ``keys`` from a JSON object response."""
+    start = response.find("{")
+    end = response.rfind("}")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        items = json.loads(response[start : end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(items, dict):
+        return {}
+    return {key: items[key] for key in keys if isinstance(items.get(key), str)}
+
+
+def _translate_llm_documents(
+    provider: Any, texts: List[str], target_language: str
+) -> Tuple[List[str], int, int]:
+    """Translates several multi-line texts with an LLM as one JSON object.
+
+    Texts are packed into objects of up to ``_LLM_TRANSLATE_CHUNK_BYTES``.
+    A text missing from the response, or coming back truncated, is
+    translated again on its own; so is any text too long to share a request.
+    """
+    keys = [str(i) for i in range(len(texts))]
+    packable = [
+        key
+        for key, text in zip(keys, texts)
+        if len(text.encode("utf-8")) <= _LLM_TRANSLATE_CHUNK_BYTES
+    ]
+    sizes = {key: len(texts[int(key)].encode("utf-8")) for key in packable}
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_bytes = 0
+    for key in packable:
+        if current and current_bytes + sizes[key] > _LLM_TRANSLATE_CHUNK_BYTES:
+            batches.append(current)
+            current = []
+            current_bytes = 0
+        current.append(key)
+        current_bytes += sizes[key]
+    if current:
+        batches.append(current)
+    # A text alone in its batch gets the plain prompt below instead
+    batches = [batch for batch in batches if len(batch) > 1]
+
+    def _translate_batch(batch: List[str]) -> Tuple[Dict[str, str], int, int]:
+        prompt = (
+            f"Translate each value of the following JSON object to "
+            f"{target_language}. Keep Markdown formatting and line breaks. "
+            "Return only a JSON object with the same keys and the translated "
+            "values, without any preamble or explanation.\n\n"
+            + json.dumps({key: texts[int(key)] for key in batch}, ensure_ascii=False)
+        )
+        response, in_tok, out_tok = _generate_limited(provider, prompt)
+        found = _parse_json_object(response or "", batch)
+        complete = {
+            key: value.strip()
+            for key, value in found.items()
+            if _covers(texts[int(key)], value)
+        }
+        return complete, in_tok, out_tok
+
+    translated: Dict[str, str] = {}
+    total_in = 0
+    total_out = 0
+    for found, in_tok, out_tok in thread_map(
+        _translate_batch, batches, llm_max_concurrency()
+    ):
+        translated.update(found)
+        total_in += in_tok
+        total_out += out_tok
+
+    remaining = [key for key in keys if key not in translated]
+
+    def _translate_single(key: str) -> Tuple[str, int, int]:
+        try:
+            return _translate_llm_text(provider, texts[int(key)], target_language)
+        except Exception as e:
+            return f"Error: {e}", 0, 0
+
+    for key, (text, in_tok, out_tok) in zip(
+        remaining, thread_map(_translate_single, remaining, llm_max_concurrency())
+    ):
+        translated[key] = text
+        total_in += in_tok
+        total_out += out_tok
+    return [translated[key] for key in keys], total_in, total_out
+
+
+def translate_documents(
+    model_name: str,
+    texts: List[str],
+    target_language: str,
+) -> Tuple[List[str], int, int]:
+    """Translate several multi-line texts (summaries, Q&A, tags) together.
+
+    LLMs receive the texts as one JSON object per request and translation
+    services use ``TranslationProvider.translate_documents``. Texts found in
+    the translation memory are not sent again. Failures are returned per
+    text as ``"Error: ..."`` strings, like ``translate_text``.
+
+    Returns (translated_texts, input_tokens, output_tokens).
+    """
+    from youtube_to_docs.providers import LLMProvider, TranslationProvider, get_provider
+
+    memory = get_translation_memory()
+    known = memory.get_many(model_name, target_language, texts)
+    pending = [text for text in dict.fromkeys(texts) if text not in known]
+    in_tok = 0
+    out_tok = 0
+    if pending:
+        try:
+            provider = get_provider(model_name)
+            if isinstance(provider, TranslationProvider):
+                translated = provider.translate_documents(pending, target_language)
+            elif isinstance(provider, LLMProvider):
+                translated, in_tok, out_tok = _translate_llm_documents(
+                    provider, pending, target_language
+                )
+            else:
+                message = f"Error: Translation not implemented for {model_name}"
+                translated = [message] * len(pending)
+        except Exception as e:
+            translated = [f"Error: {e}"] * len(pending)
+        new = dict(zip(pending, translated))
+        memory.put_many(model_name, target_language, new)
+        known.update(new)
+    return [known[text] for text in texts], in_tok, out_tok
+
+
 def translate_text(
     model_name: str,
     text: str,
@@ -261,28 +773,29 @@ def translate_text(
 
     If model_name is 'aws-translate', uses the AWS Translate service directly.
     If model_name is 'gcp-translate', uses Google Cloud Translation API directly.
-    Otherwise, uses the specified LLM via its provider.
+    Otherwise, uses the specified LLM via its provider. Texts already in the
+    translation memory are returned without calling the model.
 
     Returns (translated_text, input_tokens, output_tokens).
     """
     from youtube_to_docs.providers import LLMProvider, TranslationProvider, get_provider
 
+    memory = get_translation_memory()
+    cached = memory.get(model_name, target_language, text)
+    if cached is not None:
+        return cached, 0, 0
     try:
         provider = get_provider(model_name)
         if isinstance(provider, TranslationProvider):
-            translated = provider.translate(text, target_language)
-            return translated, 0, 0
+            result = provider.translate(text, target_language), 0, 0
         elif isinstance(provider, LLMProvider):
-            prompt = (
-                f"Please translate the following text to {target_language}. "
-                "Return only the translated text without any preamble or explanation."
-                "\n\n"
-                f"{text}"
-            )
-            return provider.generate_content(prompt)
-        return f"Error: Translation not implemented for {model_name}", 0, 0
+            result = _translate_llm_text(provider, text, target_language)
+        else:
+            return f"Error: Translation not implemented for {model_name}", 0, 0
     except Exception as e:
         return f"Error: {e}", 0, 0
+    memory.put(model_name, target_language, text, result[0])
+    return result
 
 
 def process_translate(
@@ -299,18 +812,23 @@ def process_translate(
     safe_title: str,
     storage,
     verbose: bool = False,
+    batched: bool = True,
 ) -> dict:
     """Translate English LLM outputs in row to translate_lang.
 
     Adds translated columns with suffix ` ({translate_lang})` and saves
-    translated files alongside the originals.
+    translated files alongside the originals. All pending fields of the row
+    are translated together by ``translate_documents``; pass
+    ``batched=False`` to make one ``translate_text`` call per field instead.
     """
     from youtube_to_docs.utils import format_clickable_path
 
     lang_suffix = f" ({translate_lang})"
     lang_str = f" ({translate_lang})"
 
-    def _translate_and_store(
+    jobs: List[Tuple[str, str, Optional[str], str, Optional[str]]] = []
+
+    def _queue_translation(
         en_col: str,
         translated_col: str,
         save_dir: Optional[str],
@@ -322,11 +840,17 @@ def process_translate(
             return
         if row.get(translated_col):
             return  # Already translated
+        if any(job[1] == translated_col for job in jobs):
+            return  # Already queued (e.g. "from youtube" with -t youtube)
+        jobs.append((en_col, translated_col, save_dir, filename, file_col))
 
-        if verbose:
-            print(f"Translating '{en_col}' to {translate_lang} using {translate_model}")
-
-        translated, _, _ = translate_text(translate_model, en_text, translate_lang)
+    def _store(
+        translated_col: str,
+        translated: str,
+        save_dir: Optional[str],
+        filename: str,
+        file_col: Optional[str],
+    ) -> None:
         row[translated_col] = translated
 
         if save_dir and translated and file_col:
@@ -347,7 +871,7 @@ def process_translate(
 
     for model_name in model_names:
         # Summary
-        _translate_and_store(
+        _queue_translation(
             en_col=f"Summary Text {model_name} from {transcript_arg}",
             translated_col=(
                 f"Summary Text {model_name} from {transcript_arg}{lang_suffix}"
@@ -361,7 +885,7 @@ def process_translate(
         )
 
         # One Sentence Summary
-        _translate_and_store(
+        _queue_translation(
             en_col=f"One Sentence Summary {model_name} from {transcript_arg}",
             translated_col=(
                 f"One Sentence Summary {model_name} from {transcript_arg}{lang_suffix}"
@@ -378,7 +902,7 @@ def process_translate(
         )
 
         # Q&A
-        _translate_and_store(
+        _queue_translation(
             en_col=f"QA Text {model_name} from {transcript_arg}",
             translated_col=f"QA Text {model_name} from {transcript_arg}{lang_suffix}",
             save_dir=qa_dir,
@@ -390,7 +914,7 @@ def process_translate(
         )
 
         # Tags
-        _translate_and_store(
+        _queue_translation(
             en_col=f"Tags {transcript_arg} {model_name} model",
             translated_col=f"Tags {transcript_arg} {model_name} model{lang_suffix}",
             save_dir=tags_dir,
@@ -403,7 +927,7 @@ def process_translate(
 
         # Secondary (from youtube) summaries
         if f"Summary Text {model_name} from youtube" in row:
-            _translate_and_store(
+            _queue_translation(
                 en_col=f"Summary Text {model_name} from youtube",
                 translated_col=f"Summary Text {model_name} from youtube{lang_suffix}",
                 save_dir=summaries_dir,
@@ -415,7 +939,7 @@ def process_translate(
             )
 
         if f"One Sentence Summary {model_name} from youtube" in row:
-            _translate_and_store(
+            _queue_translation(
                 en_col=f"One Sentence Summary {model_name} from youtube",
                 translated_col=(
                     f"One Sentence Summary {model_name} from youtube{lang_suffix}"
@@ -431,7 +955,7 @@ def process_translate(
             )
 
         if f"QA Text {model_name} from youtube" in row:
-            _translate_and_store(
+            _queue_translation(
                 en_col=f"QA Text {model_name} from youtube",
                 translated_col=f"QA Text {model_name} from youtube{lang_suffix}",
                 save_dir=qa_dir,
@@ -442,4 +966,31 @@ def process_translate(
                 file_col=f"QA File {model_name} from youtube{lang_suffix}",
             )
 
+    if batched and jobs:
+        if verbose:
+            print(
+                f"Translating {len(jobs)} fields to {translate_lang} "
+                f"using {translate_model}"
+            )
+        translations, _, _ = translate_documents(
+            translate_model, [row[job[0]] for job in jobs], translate_lang
+        )
+    else:
+        translations = []
+        for en_col, *_ in jobs:
+            if verbose:
+                print(
+                    f"Translating '{en_col}' to {translate_lang} "
+                    f"using {translate_model}"
+                )
+            translated, _, _ = translate_text(
+                translate_model, row[en_col], translate_lang
+            )
+            translations.append(translated)
+
+    for (_, translated_col, save_dir, filename, file_col), translated in zip(
+        jobs, translations
+    ):
+        _store(translated_col, translated, save_dir, filename, file_col)
+
     return row
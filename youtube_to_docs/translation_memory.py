@@ -0,0 +1,209 @@
+"""Persistent translation memory shared across runs.
+
+Every translated segment is stored in a small SQLite database under the
+local cache directory, keyed by the translation model, the target language
+and a hash of the normalized source text. Before AWS, GCP or an LLM is asked
+to translate anything, the memory is consulted, so repeated strings (tags,
+"[Music]" cues, unchanged summaries on a rerun) are translated only once.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from youtube_to_docs.utils import get_cache_dir
+
+# Upper bound on stored translations (YTD_TRANSLATION_MEMORY_MAX_BYTES)
+DEFAULT_TRANSLATION_MEMORY_MAX_BYTES = 100 * 1024**2
+
+
+def translation_memory_max_bytes() -> int:
+    """Returns YTD_TRANSLATION_MEMORY_MAX_BYTES (0 disables the memory)."""
+    value = os.environ.get(
+        "YTD_TRANSLATION_MEMORY_MAX_BYTES", str(DEFAULT_TRANSLATION_MEMORY_MAX_BYTES)
+    )
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        print(
+            f"Warning: Invalid YTD_TRANSLATION_MEMORY_MAX_BYTES '{value}', "
+            "using default."
+        )
+        return DEFAULT_TRANSLATION_MEMORY_MAX_BYTES
+
+
+def normalize_segment(text: str) -> str:
+    """Strips trailing whitespace so trivially different segments share a key.
+
+    Line breaks and indentation are kept: they carry Markdown structure, and
+    the translation of a list or code block must not be reused for prose.
+    """
+    return "\n".join(line.rstrip() for line in text.rstrip().split("\n"))
+
+
+class TranslationMemory:
+    """SQLite-backed translation memory with LRU eviction.
+
+    Entries are evicted least recently used first once the stored source and
+    translated text exceed ``max_bytes``. ``hits`` and ``misses`` count
+    lookups since the memory was opened. Safe to share between threads.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.max_bytes = (
+            translation_memory_max_bytes() if max_bytes is None else max_bytes
+        )
+        self.path = path or os.path.join(get_cache_dir(), "translation-memory.sqlite")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS segments ("
+                "key TEXT PRIMARY KEY, translation TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS segments_last_used ON segments (last_used)"
+            )
+            row = self._conn.execute("SELECT SUM(size) FROM segments").fetchone()
+            self._total_bytes = row[0] or 0
+        return self._conn
+
+    @staticmethod
+    def key(model_name: str, target_language: str, text: str) -> str:
+        digest = hashlib.sha256(normalize_segment(text).encode("utf-8")).hexdigest()
+        return f"{model_name}|{target_language}|{digest}"
+
+    def get_many(
+        self, model_name: str, target_language: str, texts: Iterable[str]
+    ) -> Dict[str, str]:
+        """Returns {text: translation} for the texts already in memory."""
+        texts = list(dict.fromkeys(texts))
+        if not self.enabled or not texts:
+            return {}
+        keys = {self.key(model_name, target_language, text): text for text in texts}
+        found: Dict[str, str] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                key_list = list(keys)
+                # Stay under SQLite's bound-parameter limit
+                for i in range(0, len(key_list), 500):
+                    batch = key_list[i : i + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    rows = conn.execute(
+                        "SELECT key, translation FROM segments "
+                        f"WHERE key IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                    for key, translation in rows:
+                        found[keys[key]] = translation
+                    if rows:
+                        conn.execute(
+                            "UPDATE segments SET last_used = ? "
+                            f"WHERE key IN ({placeholders})",
+                            [time.time(), *batch],
+                        )
+                conn.commit()
+                self.hits += len(found)
+                self.misses += len(texts) - len(found)
+        except sqlite3.Error as e:
+            print(f"Warning: Translation memory lookup failed: {e}")
+            return {}
+        return found
+
+    def get(self, model_name: str, target_language: str, text: str) -> Optional[str]:
+        return self.get_many(model_name, target_language, [text]).get(text)
+
+    def put_many(
+        self, model_name: str, target_language: str, translations: Dict[str, str]
+    ) -> None:
+        """Stores {text: translation} pairs and evicts old entries if needed."""
+        if not self.enabled or not translations:
+            return
+        now = time.time()
+        rows = []
+        for text, translation in translations.items():
+            if not translation or translation.startswith("Error:"):
+                continue
+            size = len(text.encode("utf-8")) + len(translation.encode("utf-8"))
+            rows.append(
+                (self.key(model_name, target_language, text), translation, size, now)
+            )
+        if not rows:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                for key, translation, size, last_used in rows:
+                    old = conn.execute(
+                        "SELECT size FROM segments WHERE key = ?", (key,)
+                    ).fetchone()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO segments VALUES (?, ?, ?, ?)",
+                        (key, translation, size, last_used),
+                    )
+                    self._total_bytes += size - (old[0] if old else 0)
+                self._evict(conn)
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not update translation memory: {e}")
+
+    def put(
+        self, model_name: str, target_language: str, text: str, translation: str
+    ) -> None:
+        self.put_many(model_name, target_language, {text: translation})
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM segments ORDER BY last_used LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM segments WHERE key = ?", (key,))
+                self._total_bytes -= size
+
+    def summary(self) -> str:
+        lookups = self.hits + self.misses
+        rate = f" ({self.hits / lookups:.0%} hit rate)" if lookups else ""
+        return f"Translation memory: {self.hits} hits, {self.misses} misses{rate}"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_memory: Optional[TranslationMemory] = None
+_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> TranslationMemory:
+    """Returns the process-wide translation memory for the current cache dir."""
+    global _memory
+    path = os.path.join(get_cache_dir(), "translation-memory.sqlite")
+    with _memory_lock:
+        if _memory is None or _memory.path != path:
+            if _memory is not None:
+                _memory.close()
+            _memory = TranslationMemory(path)
+        return _memory
@@ -1,15 +1,85 @@
 import argparse
-import io
 import os
 import re
+import tempfile
+import threading
 import wave
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import polars as pl
 from rich import print as rprint
 
+from youtube_to_docs.audio import (
+    DEFAULT_TTS_FORMAT,
+    TTS_FORMATS,
+    encode_pcm_stream,
+    ensure_tts_encoder,
+)
+from youtube_to_docs.pcm import crossfade_pcm, postprocess_speech
 from youtube_to_docs.storage import Storage
-from youtube_to_docs.utils import format_clickable_path, get_gcp_client
+from youtube_to_docs.utils import (
+    chunk_text_by_bytes,
+    format_clickable_path,
+    get_gcp_client,
+    thread_imap,
+    thread_map,
+)
+
+# Chunks synthesized in parallel per request (YTD_TTS_MAX_WORKERS)
+DEFAULT_TTS_MAX_WORKERS = 4
+# Summaries processed in parallel by process_tts (YTD_TTS_ROW_MAX_WORKERS)
+DEFAULT_TTS_ROW_MAX_WORKERS = 4
+# Gemini TTS: bytes of text per request
+GEMINI_TTS_CHUNK_BYTES = 2000
+
+# One TTS client per service, reused across calls and threads
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def tts_max_workers() -> int:
+    """Returns YTD_TTS_MAX_WORKERS, at least 1."""
+    value = os.environ.get("YTD_TTS_MAX_WORKERS", str(DEFAULT_TTS_MAX_WORKERS))
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Invalid YTD_TTS_MAX_WORKERS '{value}', using default.")
+        return DEFAULT_TTS_MAX_WORKERS
+
+
+def tts_row_max_workers() -> int:
+    """Returns YTD_TTS_ROW_MAX_WORKERS, at least 1."""
+    value = os.environ.get("YTD_TTS_ROW_MAX_WORKERS", str(DEFAULT_TTS_ROW_MAX_WORKERS))
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Invalid YTD_TTS_ROW_MAX_WORKERS '{value}', using default.")
+        return DEFAULT_TTS_ROW_MAX_WORKERS
+
+
+def _get_client(name: str, factory: Callable[[], Any]) -> Any:
+    """Returns the cached client for ``name``, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None:
+            client = factory()
+            if client is not None:
+                _clients[name] = client
+        return client
+
+
+def _synthesize_chunks(
+    synthesize: Callable[[str], bytes], chunks: List[str]
+) -> Iterator[bytes]:
+    """Synthesizes chunks concurrently, yielding their audio in order."""
+
+    def _synthesize(item: Tuple[int, str]) -> bytes:
+        i, chunk = item
+        if len(chunks) > 1:
+            rprint(f"  Synthesizing chunk {i + 1}/{len(chunks)}...")
+        return synthesize(chunk)
+
+    return thread_imap(_synthesize, list(enumerate(chunks)), tts_max_workers())
 
 
 def wave_file(filename, pcm, channels=1, rate=24000, sample_width=2):
@@ -21,66 +91,69 @@ def wave_file(filename, pcm, channels=1, rate=24000, sample_width=2):
         wf.writeframes(pcm)
 
 
-def _chunk_text_by_bytes(text: str, max_bytes: int = 5000) -> List[str]:
-    """Helper to chunk text into pieces below the byte limit."""
-    if not text:
-        return []
+def write_wav_chunks(
+    filename, chunks: Iterable[bytes], channels=1, rate=24000, sample_width=2
+) -> int:
+    """Streams PCM chunks into a WAV file as they arrive.
 
-    text_bytes = text.encode("utf-8")
-    if len(text_bytes) <= max_bytes:
-        return [text]
-
-    chunks = []
-    # Split by sentences if possible
-    sentences = re.split(r"(?<=[.!?]) +", text)
-    current_chunk = ""
-
-    for s in sentences:
-        # If adding this sentence exceeds limit
-        if len((current_chunk + " " + s).encode("utf-8")) > max_bytes:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = s
-            else:
-                # Sentence itself is too long, split by words
-                words = s.split(" ")
-                for w in words:
-                    if len((current_chunk + " " + w).encode("utf-8")) > max_bytes:
-                        if current_chunk:
-                            chunks.append(current_chunk.strip())
-                            current_chunk = w
-                        else:
-                            # Word too long (rare), split by bytes safely
-                            w_bytes = w.encode("utf-8")
-                            while len(w_bytes) > max_bytes:
-                                split_point = max_bytes
-                                while split_point > 0:
-                                    try:
-                                        part = w_bytes[:split_point].decode("utf-8")
-                                        break
-                                    except UnicodeDecodeError:
-                                        split_point -= 1
-                                chunks.append(part)
-                                w_bytes = w_bytes[len(part.encode("utf-8")) :]
-                            current_chunk = w_bytes.decode("utf-8")
-                    else:
-                        current_chunk = (current_chunk + " " + w).strip()
+    Only one chunk is held at a time; ``wave`` patches the header sizes when
+    the file is closed. Returns the number of PCM bytes written.
+    """
+    written = 0
+    with wave.open(filename, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(sample_width)
+        wf.setframerate(rate)
+        for chunk in chunks:
+            if chunk:
+                wf.writeframesraw(chunk)
+                written += len(chunk)
+    return written
+
+
+def save_speech(
+    storage: Storage,
+    target_path: str,
+    chunks: Iterable[bytes],
+    rate: int,
+    audio_format: str = "wav",
+) -> Optional[str]:
+    """Spools PCM chunks to a temporary audio file and uploads it to storage.
+
+    ``wav`` is written directly; other ``TTS_FORMATS`` are encoded by ffmpeg
+    as the chunks arrive. Returns the saved path or link, or None when there
+    was no audio.
+    """
+    extension, _, content_type = TTS_FORMATS[audio_format]
+    fd, tmp_path = tempfile.mkstemp(suffix=f".{extension}")
+    os.close(fd)
+    try:
+        if audio_format == "wav":
+            written = write_wav_chunks(tmp_path, chunks, rate=rate)
         else:
-            current_chunk = (current_chunk + " " + s).strip()
+            written = encode_pcm_stream(chunks, rate, tmp_path, audio_format)
+        if not written:
+            return None
+        return storage.upload_file(tmp_path, target_path, content_type=content_type)
+    finally:
+        os.remove(tmp_path)
 
-    if current_chunk:
-        chunks.append(current_chunk.strip())
 
-    return chunks
+def _speech_chunks(text: str, max_bytes: int) -> List[str]:
+    """Splits text for a TTS request limit, dropping whitespace-only chunks."""
+    return [
+        chunk.strip() for chunk in chunk_text_by_bytes(text, max_bytes) if chunk.strip()
+    ]
 
 
-def generate_speech_gcp(
+def generate_speech_gcp_stream(
     text: str, voice_name: str, language_code: Optional[str] = None
-) -> Tuple[bytes, int]:
+) -> Tuple[Iterator[bytes], int]:
     """
-    Generates speech from text using Google Cloud Text-to-Speech API.
-    Returns (raw PCM audio bytes, sample_rate).
-    Handles text longer than 5000 bytes by chunking and concatenating results.
+    Streams speech from text using Google Cloud Text-to-Speech API.
+    Returns (iterator of raw PCM chunks in order, sample_rate).
+    Text longer than 5000 bytes is chunked and the chunks are synthesized
+    concurrently; synthesis errors are raised while iterating.
     """
     try:
         from google.cloud import texttospeech
@@ -89,172 +162,189 @@ def generate_speech_gcp(
             "Error: google-cloud-texttospeech is required for GCP TTS models. "
             "Install with `pip install '.[gcp]'`"
         )
-        return b"", 0
+        return iter(()), 0
 
-    try:
-        client = get_gcp_client(texttospeech.TextToSpeechClient, "GCP Text-to-Speech")
-        if client is None:
-            return b"", 0
+    client = _get_client(
+        "gcp-tts",
+        lambda: get_gcp_client(texttospeech.TextToSpeechClient, "GCP Text-to-Speech"),
+    )
+    if client is None:
+        return iter(()), 0
+
+    # Build the voice name from language code and voice name
+    # e.g., language_code="en-US", voice_name="Kore" -> "en-US-Chirp3-HD-Kore"
+    if language_code:
+        full_voice_name = f"{language_code}-Chirp3-HD-{voice_name}"
+    else:
+        full_voice_name = f"en-US-Chirp3-HD-{voice_name}"
+
+    voice = texttospeech.VoiceSelectionParams(
+        language_code=language_code or "en-US",
+        name=full_voice_name,
+    )
 
-        # Build the voice name from language code and voice name
-        # e.g., language_code="en-US", voice_name="Kore" -> "en-US-Chirp3-HD-Kore"
-        if language_code:
-            full_voice_name = f"{language_code}-Chirp3-HD-{voice_name}"
-        else:
-            full_voice_name = f"en-US-Chirp3-HD-{voice_name}"
+    # Use LINEAR16 (PCM) to match Gemini TTS output format
+    audio_config = texttospeech.AudioConfig(
+        audio_encoding=texttospeech.AudioEncoding.LINEAR16,
+        sample_rate_hertz=24000,
+    )
 
-        voice = texttospeech.VoiceSelectionParams(
-            language_code=language_code or "en-US",
-            name=full_voice_name,
+    text_bytes = text.encode("utf-8")
+    rprint(
+        f"[cyan]GCP TTS: input text length: {len(text)} chars, "
+        f"{len(text_bytes)} bytes[/cyan]"
+    )
+    rprint(f"[cyan]Snippet: {text[:100]!r}...[/cyan]")
+    if len(text_bytes) <= 5000:
+        chunks = [text]
+    else:
+        # GCP TTS has a 5000 byte limit for synthesize_speech.
+        rprint(
+            f"[yellow]Text is long ({len(text_bytes)} bytes). "
+            "Chunking for GCP TTS...[/yellow]"
         )
+        chunks = _speech_chunks(text, 4800)
 
-        # Use LINEAR16 (PCM) to match Gemini TTS output format
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.LINEAR16,
-            sample_rate_hertz=24000,
+    def _synthesize(chunk: str) -> bytes:
+        response = client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=chunk),
+            voice=voice,
+            audio_config=audio_config,
         )
+        return response.audio_content
 
-        text_bytes = text.encode("utf-8")
-        rprint(
-            f"[cyan]GCP TTS: input text length: {len(text)} chars, "
-            f"{len(text_bytes)} bytes[/cyan]"
-        )
-        rprint(f"[cyan]Snippet: {text[:100]!r}...[/cyan]")
-        if len(text_bytes) <= 5000:
-            input_text = texttospeech.SynthesisInput(text=text)
-            response = client.synthesize_speech(
-                input=input_text,
-                voice=voice,
-                audio_config=audio_config,
-            )
-            return response.audio_content, 24000
-        else:
-            # GCP TTS has a 5000 byte limit for synthesize_speech.
-            # We chunk the text and concatenate the PCM results.
-            rprint(
-                f"[yellow]Text is long ({len(text_bytes)} bytes). "
-                "Chunking for GCP TTS...[/yellow]"
-            )
-            chunks = _chunk_text_by_bytes(text, 4800)
-            all_audio = b""
-            for i, chunk in enumerate(chunks):
-                rprint(f"  Synthesizing chunk {i + 1}/{len(chunks)}...")
-                input_text = texttospeech.SynthesisInput(text=chunk)
-                response = client.synthesize_speech(
-                    input=input_text,
-                    voice=voice,
-                    audio_config=audio_config,
-                )
-                all_audio += response.audio_content
+    return _synthesize_chunks(_synthesize, chunks), 24000
 
-            return all_audio, 24000
 
+def generate_speech_gcp(
+    text: str, voice_name: str, language_code: Optional[str] = None
+) -> Tuple[bytes, int]:
+    """
+    Generates speech from text using Google Cloud Text-to-Speech API.
+    Returns (raw PCM audio bytes, sample_rate).
+    Handles text longer than 5000 bytes by chunking and concatenating results.
+    """
+    try:
+        chunks, rate = generate_speech_gcp_stream(text, voice_name, language_code)
+        # One join copies each chunk once, instead of re-copying on every +=
+        return b"".join(chunks), rate
     except Exception as e:
         print(f"Error generating speech with GCP TTS: {e}")
         return b"", 0
 
 
-def generate_speech_aws_polly(
+def generate_speech_aws_polly_stream(
     text: str, voice_id: str = "Ruth", engine: str = "long-form"
-) -> Tuple[bytes, int]:
+) -> Tuple[Iterator[bytes], int]:
     """
-    Generates speech from text using AWS Polly.
-    Returns (raw PCM audio bytes, sample_rate).
-    Handles text longer than limits by chunking.
+    Streams speech from text using AWS Polly.
+    Returns (iterator of raw PCM chunks in order, sample_rate).
+    Text longer than Polly's limits is chunked and the chunks are synthesized
+    concurrently; synthesis errors are raised while iterating.
     """
     try:
         import boto3
-        from botocore.exceptions import BotoCoreError, ClientError
     except ImportError:
         print(
             "Error: boto3 is required for AWS Polly. Install with `pip install boto3`"
         )
-        return b"", 0
+        return iter(()), 0
 
-    try:
-        polly = boto3.client("polly")
+    polly = _get_client("polly", lambda: boto3.client("polly"))
 
-        # Polly has limits. Safe chunk size ~2000 chars to be safe.
-        # (Limit is typically 3000 chars for standard/neural).
-        chunk_size = 2000
-        text_bytes = text.encode("utf-8")
+    # Polly has limits. Safe chunk size ~2000 chars to be safe.
+    # (Limit is typically 3000 chars for standard/neural).
+    chunk_size = 2000
+    text_bytes = text.encode("utf-8")
+
+    rprint(
+        f"[cyan]AWS Polly: input text length: {len(text)} chars, "
+        f"{len(text_bytes)} bytes[/cyan]"
+    )
 
+    if len(text_bytes) <= chunk_size:
+        chunks = [text]
+    else:
         rprint(
-            f"[cyan]AWS Polly: input text length: {len(text)} chars, "
-            f"{len(text_bytes)} bytes[/cyan]"
+            f"[yellow]Text is long ({len(text_bytes)} bytes). "
+            "Chunking for AWS Polly...[/yellow]"
         )
+        chunks = _speech_chunks(text, chunk_size)
+
+    def _synthesize(chunk: str) -> bytes:
+        response = polly.synthesize_speech(
+            Text=chunk,
+            OutputFormat="pcm",
+            VoiceId=voice_id,
+            Engine=engine,
+        )
+        if "AudioStream" not in response:
+            print("Error: No AudioStream in Polly response")
+            return b""
+        with response["AudioStream"] as stream:
+            return stream.read()
 
-        audio_stream = b""
-
-        if len(text_bytes) <= chunk_size:
-            chunks = [text]
-        else:
-            rprint(
-                f"[yellow]Text is long ({len(text_bytes)} bytes). "
-                "Chunking for AWS Polly...[/yellow]"
-            )
-            chunks = _chunk_text_by_bytes(text, chunk_size)
-
-        for i, chunk in enumerate(chunks):
-            if len(chunks) > 1:
-                rprint(f"  Synthesizing chunk {i + 1}/{len(chunks)}...")
-
-            response = polly.synthesize_speech(
-                Text=chunk,
-                OutputFormat="pcm",
-                VoiceId=voice_id,
-                Engine=engine,
-            )
-            if "AudioStream" in response:
-                with response["AudioStream"] as stream:
-                    audio_stream += stream.read()
-            else:
-                print("Error: No AudioStream in Polly response")
+    return _synthesize_chunks(_synthesize, chunks), 16000
 
-        return audio_stream, 16000
 
-    except (BotoCoreError, ClientError) as error:
-        print(f"Error generating speech with AWS Polly: {error}")
-        return b"", 0
+def generate_speech_aws_polly(
+    text: str, voice_id: str = "Ruth", engine: str = "long-form"
+) -> Tuple[bytes, int]:
+    """
+    Generates speech from text using AWS Polly.
+    Returns (raw PCM audio bytes, sample_rate).
+    Handles text longer than limits by chunking.
+    """
+    try:
+        chunks, rate = generate_speech_aws_polly_stream(text, voice_id, engine)
+        return b"".join(chunks), rate
     except Exception as e:
         print(f"Error generating speech with AWS Polly: {e}")
         return b"", 0
 
 
-def generate_speech(
+def generate_speech_gemini_stream(
     text: str, model_name: str, voice_name: str, language_code: Optional[str] = None
-) -> Tuple[bytes, int]:
+) -> Tuple[Iterator[bytes], int]:
     """
-    Generates speech from text using the specified Gemini model and voice.
-    Returns (raw PCM audio bytes, sample_rate).
+    Streams speech from text using the specified Gemini model and voice.
+    Returns (iterator of raw PCM chunks in order, sample_rate).
+    The text is split at sentence boundaries and the chunks are synthesized
+    concurrently; synthesis errors are raised while iterating.
     """
     try:
         from google import genai
         from google.genai import types
+    except ImportError:
+        print(
+            "Error: google-genai is required for Gemini TTS models. "
+            "Install with `pip install google-genai`"
+        )
+        return iter(()), 0
+
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        print("Error: GEMINI_API_KEY environment variable not set.")
+        return iter(()), 0
+
+    client = _get_client("gemini-tts", lambda: genai.Client(api_key=api_key))
+    config = types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            language_code=language_code,
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                    voice_name=voice_name,
+                )
+            ),
+        ),
+    )
+    chunks = _speech_chunks(text, GEMINI_TTS_CHUNK_BYTES)
 
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
-            print("Error: GEMINI_API_KEY environment variable not set.")
-            return b"", 0
-
-        client = genai.Client(api_key=api_key)
-
+    def _synthesize(chunk: str) -> bytes:
         response = client.models.generate_content(
-            model=model_name,
-            contents=text,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    language_code=language_code,
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=voice_name,
-                        )
-                    ),
-                ),
-            ),
+            model=model_name, contents=chunk, config=config
         )
-
         if (
             response.candidates
             and response.candidates[0].content
@@ -262,11 +352,25 @@ def generate_speech(
             and response.candidates[0].content.parts[0].inline_data
             and response.candidates[0].content.parts[0].inline_data.data
         ):
-            return response.candidates[0].content.parts[0].inline_data.data, 24000
-        else:
-            print("Error: No audio data in response.")
-            return b"", 0
+            return response.candidates[0].content.parts[0].inline_data.data
+        raise RuntimeError("No audio data in response.")
+
+    return _synthesize_chunks(_synthesize, chunks), 24000
 
+
+def generate_speech(
+    text: str, model_name: str, voice_name: str, language_code: Optional[str] = None
+) -> Tuple[bytes, int]:
+    """
+    Generates speech from text using the specified Gemini model and voice.
+    Returns (raw PCM audio bytes, sample_rate); chunks are joined with short
+    crossfades.
+    """
+    try:
+        chunks, rate = generate_speech_gemini_stream(
+            text, model_name, voice_name, language_code
+        )
+        return b"".join(crossfade_pcm(chunks, rate)), rate
     except Exception as e:
         print(f"Error generating speech: {e}")
         return b"", 0
@@ -328,14 +432,22 @@ def process_tts(
     storage: Storage,
     base_dir: str = ".",
     languages: Optional[List[str]] = None,
+    audio_format: str = DEFAULT_TTS_FORMAT,
 ) -> pl.DataFrame:
     """
     Processes the DataFrame to generate TTS for each summary file found.
+    Audio is saved in ``audio_format`` (one of ``TTS_FORMATS``). Raises
+    ImportError up front when that format needs ffmpeg and it is missing.
     """
+    ensure_tts_encoder(audio_format)
+    extension = TTS_FORMATS[audio_format][0]
+    # Extensions checked for existing audio, the requested format first
+    audio_extensions = list(
+        dict.fromkeys([extension, *(fmt[0] for fmt in TTS_FORMATS.values())])
+    )
     model_name, voice_name = parse_tts_arg(tts_arg)
     rprint(f"Using TTS Model: {model_name}, Voice: {voice_name}")
 
-    # Setup Audio Directory
     # Setup Audio Directory
     audio_dir = os.path.join(base_dir, "audio-files")
     storage.ensure_directory(audio_dir)
@@ -362,6 +474,118 @@ def process_tts(
         "ko": "ko-KR",
     }
 
+    # One listing of the audio folder replaces an exists() and get_full_path()
+    # round trip per summary; None when the storage cannot list folders.
+    existing_audio = storage.list_files(audio_dir)
+
+    # Summaries that map to the same audio file are synthesized only once
+    generated: Dict[str, Optional[str]] = {}
+    target_locks: Dict[str, threading.Lock] = {}
+    target_locks_lock = threading.Lock()
+
+    def _audio_for(job: Tuple[str, str, Dict[str, Any]]) -> Optional[str]:
+        col, lang_code, row = job
+        summary_path = row.get(col)
+
+        if (
+            not summary_path
+            or not isinstance(summary_path, str)
+            or not storage.exists(summary_path)
+        ):
+            return None
+
+        if row.get("Title") and row.get("URL"):
+            # Extract Video ID
+            video_id = "unknown"
+            match = re.search(r"v=([a-zA-Z0-9_-]+)", row["URL"])
+            if match:
+                video_id = match.group(1)
+            elif "youtu.be/" in row["URL"]:
+                video_id = row["URL"].split("youtu.be/")[1].split("?")[0]
+
+            # Safe Title
+            safe_title = (
+                re.sub(r'[\\/*?:"><|]', "_", row["Title"])
+                .replace("\n", " ")
+                .replace("\r", "")
+            )
+
+            # Construct Name
+            audio_stem = f"{video_id} - {safe_title} - {tts_arg} ({lang_code})"
+            summary_filename = f"{audio_stem}.{extension}"  # For logging purposes
+        else:
+            summary_filename = os.path.basename(summary_path)
+            base_name = os.path.splitext(summary_filename)[0]
+            audio_stem = f"{base_name} - {tts_arg}"
+
+        # Use relative path for storage
+        target_path = os.path.join(audio_dir, f"{audio_stem}.{extension}")
+
+        # Audio saved earlier in another format (e.g. .wav before the default
+        # became .m4a) is reused rather than synthesized again
+        for ext in audio_extensions:
+            audio_filename = f"{audio_stem}.{ext}"
+            if existing_audio is not None:
+                if audio_filename in existing_audio:
+                    return existing_audio[audio_filename]
+            elif storage.exists(os.path.join(audio_dir, audio_filename)):
+                return storage.get_full_path(os.path.join(audio_dir, audio_filename))
+
+        with target_locks_lock:
+            target_lock = target_locks.setdefault(target_path, threading.Lock())
+        with target_lock:
+            if target_path not in generated:
+                generated[target_path] = _generate(
+                    summary_path, summary_filename, target_path, lang_code
+                )
+            return generated[target_path]
+
+    def _generate(
+        summary_path: str, summary_filename: str, target_path: str, lang_code: str
+    ) -> Optional[str]:
+        rprint(f"Generating audio for: {summary_filename}")
+
+        try:
+            # Read summary from storage
+            text = storage.read_text(summary_path)
+        except Exception as e:
+            print(f"Error reading summary file {summary_path}: {e}")
+            return None
+
+        if not text.strip():
+            print("Empty summary text.")
+            return None
+
+        # Generate audio using the unified provider
+        from youtube_to_docs.providers import TTSProvider, get_provider
+
+        try:
+            provider = get_provider(model_name)
+            if not isinstance(provider, TTSProvider):
+                print(f"Provider {model_name} does not support TTS")
+                return None
+            audio_chunks, rate = provider.generate_speech_stream(
+                text, voice_name, lang_code
+            )
+        except Exception as e:
+            print(f"Error in TTS generation: {e}")
+            return None
+
+        saved_path = None
+        if rate:
+            audio_chunks, rate = postprocess_speech(audio_chunks, rate)
+            try:
+                saved_path = save_speech(
+                    storage, target_path, audio_chunks, rate, audio_format
+                )
+            except Exception as e:
+                print(f"Error writing audio file: {e}")
+        if saved_path:
+            rprint(f"Saved audio: {format_clickable_path(saved_path)}")
+        return saved_path
+
+    new_cols = []
+    jobs = []
     for col in summary_file_cols:
         # Extract language from column name: e.g. "... (es)" -> "es"
         if "(" in col and col.endswith(")"):
@@ -379,105 +603,17 @@ def process_tts(
             col.replace("Summary File", "Summary Audio File") + f" {tts_arg} File"
         )
         rprint(f"Processing column: {col} -> {new_col_name} (Language: {lang_code})")
+        new_cols.append(new_col_name)
+        jobs.extend((col, lang_code, row) for row in df.iter_rows(named=True))
 
-        new_col_values = []
-
-        for row in df.iter_rows(named=True):
-            summary_path = row.get(col)
-
-            if (
-                not summary_path
-                or not isinstance(summary_path, str)
-                or not storage.exists(summary_path)
-            ):
-                new_col_values.append(None)
-                continue
-
-            if row.get("Title") and row.get("URL"):
-                # Extract Video ID
-                video_id = "unknown"
-                match = re.search(r"v=([a-zA-Z0-9_-]+)", row["URL"])
-                if match:
-                    video_id = match.group(1)
-                elif "youtu.be/" in row["URL"]:
-                    video_id = row["URL"].split("youtu.be/")[1].split("?")[0]
-
-                # Safe Title
-                safe_title = (
-                    re.sub(r'[\\/*?:"><|]', "_", row["Title"])
-                    .replace("\n", " ")
-                    .replace("\r", "")
-                )
-
-                # Construct Name
-                audio_filename = (
-                    f"{video_id} - {safe_title} - {tts_arg} ({lang_code}).wav"
-                )
-                summary_filename = audio_filename  # For logging purposes
-            else:
-                summary_filename = os.path.basename(summary_path)
-                base_name = os.path.splitext(summary_filename)[0]
-                audio_filename = f"{base_name} - {tts_arg}.wav"
-
-            # Use relative path for storage
-            target_path = os.path.join(audio_dir, audio_filename)
-
-            if storage.exists(target_path):
-                if hasattr(storage, "get_full_path"):
-                    full_path = storage.get_full_path(target_path)
-                    new_col_values.append(full_path)
-                    continue
-                else:
-                    pass
-
-            rprint(f"Generating audio for: {summary_filename}")
-
-            try:
-                # Read summary from storage
-                text = storage.read_text(summary_path)
-            except Exception as e:
-                print(f"Error reading summary file {summary_path}: {e}")
-                new_col_values.append(None)
-                continue
-
-            if not text.strip():
-                print("Empty summary text.")
-                new_col_values.append(None)
-                continue
-
-            # Generate audio using the unified provider
-            from youtube_to_docs.providers import TTSProvider, get_provider
-
-            try:
-                provider = get_provider(model_name)
-                if isinstance(provider, TTSProvider):
-                    pcm_data, rate = provider.generate_speech(
-                        text, voice_name, lang_code
-                    )
-
-                    if pcm_data:
-                        try:
-                            wav_io = io.BytesIO()
-                            wave_file(wav_io, pcm_data, rate=rate)
-                            wav_bytes = wav_io.getvalue()
-
-                            saved_path = storage.write_bytes(target_path, wav_bytes)
-                            rprint(f"Saved audio: {format_clickable_path(saved_path)}")
-                            new_col_values.append(saved_path)
-                        except Exception as e:
-                            print(f"Error writing audio file: {e}")
-                            new_col_values.append(None)
-                    else:
-                        new_col_values.append(None)
-                else:
-                    print(f"Provider {model_name} does not support TTS")
-                    new_col_values.append(None)
-            except Exception as e:
-                print(f"Error in TTS generation: {e}")
-                new_col_values.append(None)
-
+    # Rows and languages share one bounded pool
+    results = thread_map(_audio_for, jobs, tts_row_max_workers())
+    for i, new_col_name in enumerate(new_cols):
         updated_df = updated_df.with_columns(
-            pl.Series(name=new_col_name, values=new_col_values)
+            pl.Series(
+                name=new_col_name,
+                values=results[i * df.height : (i + 1) * df.height],
+            )
         )
 
     return updated_df
@@ -499,6 +635,12 @@ def main() -> None:
             "Format: {model}-{voice} e.g. 'gemini-3.1-flash-tts-preview-Kore'"
         ),
     )
+    parser.add_argument(
+        "--tts-format",
+        default=DEFAULT_TTS_FORMAT,
+        choices=sorted(TTS_FORMATS),
+        help="Audio format for the generated files. Defaults to 'aac' (.m4a).",
+    )
 
     args = parser.parse_args()
     outfile: str = args.outfile
@@ -526,7 +668,9 @@ def main() -> None:
     storage.ensure_directory(output_dir)
     base_dir = output_dir if output_dir else "."
 
-    updated_df = process_tts(df, tts_arg, storage, base_dir)
+    updated_df = process_tts(
+        df, tts_arg, storage, base_dir, audio_format=args.tts_format
+    )
 
     # Save the updated DataFrame
     # If using local storage, outfile is path
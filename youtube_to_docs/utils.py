@@ -1,6 +1,9 @@
+import hashlib
 import os
 import re
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypeVar
 
@@ -8,6 +11,7 @@ import polars as pl
 from rich import print as rprint
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 def get_gcp_client(
@@ -59,6 +63,146 @@ def get_gcp_client(
             return None
 
 
+def get_cache_dir(*parts: str) -> str:
+    """Returns (and creates) a directory under the local cache.
+
+    Defaults to ``~/.cache/youtube-to-docs``; override with ``YTD_CACHE_DIR``.
+    """
+    root = os.environ.get("YTD_CACHE_DIR") or os.path.join(
+        Path.home(), ".cache", "youtube-to-docs"
+    )
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    """Returns the hex SHA-256 of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def thread_map(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> list[R]:
+    """Applies func to every item on a thread pool, keeping the input order.
+
+    Runs inline when there is a single item or max_workers is 1 or less.
+    Exceptions raised by func propagate to the caller.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def thread_imap(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Iterator[R]:
+    """Like ``thread_map``, but yields results in order as they become ready.
+
+    At most ``max_workers`` items are running or waiting to be consumed, so
+    memory is bounded by the pool size rather than by the number of items.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+    remaining = iter(items)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        pending = deque(
+            executor.submit(func, item)
+            for _, item in zip(range(max_workers), remaining)
+        )
+        while pending:
+            result = pending.popleft().result()
+            for item in remaining:
+                pending.append(executor.submit(func, item))
+                break
+            yield result
+
+
+# Boundaries tried by chunk_text_by_bytes, from most to least preferred. Each
+# separator stays attached to the text before it, so chunks join losslessly.
+_LINE_END = re.compile(r"\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_WORD_END = re.compile(r"\s+")
+
+
+def _split_after(text: str, pattern: re.Pattern) -> Iterator[str]:
+    """Yields the pieces of text ending at each match of pattern."""
+    start = 0
+    for match in pattern.finditer(text):
+        if match.end() > start:
+            yield text[start : match.end()]
+            start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def chunk_text_by_bytes(text: str, max_bytes: int, by_line: bool = False) -> list[str]:
+    """Splits text into chunks of at most max_bytes UTF-8 bytes.
+
+    Chunks are packed greedily with whole sentences; a sentence that does not
+    fit on its own is split between words, and a word that does not fit is
+    split between code points. With by_line, line breaks are preferred over
+    sentence ends (keeping SRT entries and paragraphs together). Every piece
+    is encoded once and byte counts are kept as running totals, so the work
+    is linear in the length of the text. ``"".join(chunks) == text``.
+    """
+    if max_bytes < 1:
+        raise ValueError("max_bytes must be positive.")
+    levels = ([_LINE_END] if by_line else []) + [_SENTENCE_END, _WORD_END]
+    chunks: list[str] = []
+    current: list[str] = []
+    current_bytes = 0
+
+    def _flush() -> None:
+        nonlocal current_bytes
+        if current:
+            chunks.append("".join(current))
+            current.clear()
+            current_bytes = 0
+
+    def _add(piece: str, size: int, level: int) -> None:
+        nonlocal current_bytes
+        if current_bytes + size <= max_bytes:
+            current.append(piece)
+            current_bytes += size
+            return
+        _flush()
+        if size <= max_bytes:
+            current.append(piece)
+            current_bytes = size
+        elif level < len(levels):
+            for part in _split_after(piece, levels[level]):
+                _add(part, len(part.encode("utf-8")), level + 1)
+        else:
+            data = piece.encode("utf-8")
+            start = 0
+            while len(data) - start > max_bytes:
+                end = start + max_bytes
+                # Step back over UTF-8 continuation bytes (10xxxxxx)
+                while data[end] & 0xC0 == 0x80:
+                    end -= 1
+                if end == start:
+                    raise ValueError(
+                        f"A character in the text is longer than {max_bytes} bytes."
+                    )
+                chunks.append(data[start:end].decode("utf-8"))
+                start = end
+            current.append(data[start:].decode("utf-8"))
+            current_bytes = len(data) - start
+
+    if text:
+        _add(text, len(text.encode("utf-8")), 0)
+        _flush()
+    return chunks
+
+
 def format_clickable_path(path: str) -> str:
     """
     Formats a path or URL as a clickable link for Rich.
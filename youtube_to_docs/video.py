@@ -1,18 +1,44 @@
+import hashlib
 import os
 import re
+import shutil
 import subprocess
 import tempfile
+import time
 from collections import defaultdict
+from typing import Optional
 
 import polars as pl
 from rich import print as rprint
 
 from youtube_to_docs.storage import Storage
-from youtube_to_docs.utils import format_clickable_path
+from youtube_to_docs.utils import format_clickable_path, thread_map
+
+# Audio that MP4 can hold as is, so fast mode copies it instead of re-encoding
+_MP4_AUDIO_EXTENSIONS = (".m4a", ".aac", ".mp3")
+# Frame rate of the still image in fast mode
+FAST_VIDEO_FPS = 1
+# Seconds between keyframes in fast mode. x264's default GOP of 250 frames
+# would put one keyframe every ~4 minutes at 1 fps, making seeking useless.
+FAST_VIDEO_KEYFRAME_SEC = 2
+# Videos rendered at once by process_videos (YTD_VIDEO_MAX_WORKERS). Kept
+# small: each ffmpeg encode is already multi-threaded, and the renders share
+# one storage backend whose calls may be serialized.
+DEFAULT_VIDEO_MAX_WORKERS = 2
+
+
+def video_max_workers() -> int:
+    """Returns YTD_VIDEO_MAX_WORKERS, at least 1."""
+    value = os.environ.get("YTD_VIDEO_MAX_WORKERS", str(DEFAULT_VIDEO_MAX_WORKERS))
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        print(f"Warning: Invalid YTD_VIDEO_MAX_WORKERS '{value}', using default.")
+        return DEFAULT_VIDEO_MAX_WORKERS
 
 
-def create_video(image_path: str, audio_path: str, output_path: str) -> bool:
-    """Creates an MP4 video from an image and an audio file using ffmpeg."""
+def _ffmpeg_tools() -> Optional[tuple[str, str]]:
+    """Returns the (ffmpeg, ffprobe) paths, or None if they can't be fetched."""
     # Use static_ffmpeg to ensure ffmpeg is available
     try:
         from static_ffmpeg import run
@@ -23,43 +49,180 @@ def create_video(image_path: str, audio_path: str, output_path: str) -> bool:
         ) from e
 
     try:
-        ffmpeg_path, _ = run.get_or_fetch_platform_executables_else_raise()
+        return run.get_or_fetch_platform_executables_else_raise()
     except Exception as e:
         print(f"Error fetching ffmpeg: {e}")
+        return None
+
+
+def _run_ffmpeg(command: list[str], output_path: str, action: str) -> bool:
+    start = time.perf_counter()
+    try:
+        # Redirect stdout and stderr to devnull to keep output clean
+        subprocess.run(
+            command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"Error {action}: {e}")
+        return False
+    rprint(
+        f"Encoded {os.path.basename(output_path)} in {time.perf_counter() - start:.1f}s"
+    )
+    return True
+
+
+def _audio_codec_args(audio_path: str, copy: bool) -> list[str]:
+    if copy and audio_path.lower().endswith(_MP4_AUDIO_EXTENSIONS):
+        return ["-c:a", "copy"]
+    return ["-c:a", "aac", "-b:a", "192k"]
+
+
+def _fast_keyframe_interval() -> str:
+    """Returns the fast-mode GOP size (``-g``) in frames."""
+    return str(max(FAST_VIDEO_FPS * FAST_VIDEO_KEYFRAME_SEC, 1))
+
+
+def create_video(
+    image_path: str, audio_path: str, output_path: str, fast: bool = True
+) -> bool:
+    """Creates an MP4 video from an image and an audio file using ffmpeg.
+
+    In fast mode the still image is encoded at FAST_VIDEO_FPS with the
+    ultrafast preset and a keyframe every FAST_VIDEO_KEYFRAME_SEC seconds, so
+    the video stays seekable, and AAC or MP3 audio is copied into the MP4
+    unchanged.
+    Otherwise the image is encoded at ffmpeg's default 25 fps and the audio is
+    re-encoded to 192k AAC.
+    """
+    tools = _ffmpeg_tools()
+    if tools is None:
+        return False
+    ffmpeg_path = tools[0]
+
+    # -y overwrites the output file if it exists
+    command = [ffmpeg_path, "-y", "-loop", "1"]
+    if fast:
+        command += ["-framerate", str(FAST_VIDEO_FPS)]
+    command += ["-i", image_path, "-i", audio_path, "-c:v", "libx264"]
+    if fast:
+        command += ["-preset", "ultrafast", "-g", _fast_keyframe_interval()]
+    command += ["-tune", "stillimage"]
+    command += _audio_codec_args(audio_path, fast)
+    command += ["-pix_fmt", "yuv420p", "-shortest", output_path]
+    return _run_ffmpeg(command, output_path, "creating video")
+
+
+def probe_duration(path: str) -> Optional[float]:
+    """Returns the duration of a media file in seconds, or None if unknown."""
+    tools = _ffmpeg_tools()
+    if tools is None:
+        return None
+    try:
+        result = subprocess.run(
+            [
+                tools[1],
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "csv=p=0",
+                path,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return float(result.stdout.strip())
+    except (subprocess.CalledProcessError, ValueError) as e:
+        print(f"Error reading duration of {os.path.basename(path)}: {e}")
+        return None
+
+
+def encode_still(image_path: str, output_path: str, duration: float) -> bool:
+    """Encodes an image as a silent MP4 video stream of ``duration`` seconds.
+
+    The stream is encoded like fast-mode ``create_video`` output, so it can be
+    muxed with any number of audio tracks by ``mux_video`` without encoding
+    the picture again.
+    """
+    tools = _ffmpeg_tools()
+    if tools is None:
         return False
+    ffmpeg_path = tools[0]
 
     command = [
         ffmpeg_path,
-        "-y",  # Overwrite output file if it exists
+        "-y",
         "-loop",
         "1",
+        "-framerate",
+        str(FAST_VIDEO_FPS),
         "-i",
         image_path,
-        "-i",
-        audio_path,
+        "-t",
+        f"{duration:.3f}",
         "-c:v",
         "libx264",
+        "-preset",
+        "ultrafast",
+        "-g",
+        _fast_keyframe_interval(),
         "-tune",
         "stillimage",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "192k",
         "-pix_fmt",
         "yuv420p",
-        "-shortest",
+        "-an",
         output_path,
     ]
+    return _run_ffmpeg(command, output_path, "encoding image")
 
-    try:
-        # Redirect stdout and stderr to devnull to keep output clean
-        subprocess.run(
-            command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error creating video: {e}")
+
+def mux_video(video_path: str, audio_path: str, output_path: str) -> bool:
+    """Combines an encoded video stream with an audio file without re-encoding
+    the picture. AAC or MP3 audio is copied as well."""
+    tools = _ffmpeg_tools()
+    if tools is None:
         return False
+    ffmpeg_path = tools[0]
+
+    command = [
+        ffmpeg_path,
+        "-y",
+        "-i",
+        video_path,
+        "-i",
+        audio_path,
+        "-map",
+        "0:v",
+        "-map",
+        "1:a",
+        "-c:v",
+        "copy",
+    ]
+    command += _audio_codec_args(audio_path, True)
+    command += ["-shortest", output_path]
+    return _run_ffmpeg(command, output_path, "muxing video")
+
+
+def _render_videos(
+    image_path: str, jobs: list[tuple[str, str]], still_path: str
+) -> list[bool]:
+    """Renders one video per (audio path, output path) job from one image.
+
+    A single job is rendered directly. Several jobs share one encode of the
+    image, long enough for the longest audio, and each audio is then muxed
+    against it. If a duration is unknown the jobs are rendered one by one.
+    """
+    if len(jobs) > 1:
+        durations = [probe_duration(audio) for audio, _ in jobs]
+        known = [d for d in durations if d is not None]
+        # One extra second so -shortest always ends with the audio
+        if len(known) == len(jobs) and encode_still(
+            image_path, still_path, max(known) + 1
+        ):
+            return [mux_video(still_path, audio, out) for audio, out in jobs]
+    return [create_video(image_path, audio, out) for audio, out in jobs]
 
 
 def _extract_lang_from_col(col_name: str) -> str:
@@ -76,6 +239,8 @@ def process_videos(
     Supports multiple language pairs: groups infographic and audio columns by
     language suffix (e.g. `(es)`), creates one video per matched language pair,
     and stores results in `Video File` (English) or `Video File (es)` (translated).
+    Languages of a row that share the same infographic image reuse one encode
+    of it, and only their audio is muxed in separately.
     """
 
     # Setup Video Directory in Storage
@@ -107,12 +272,16 @@ def process_videos(
         return df
 
     # video_results[lang] = list of (path or None) per row
-    video_results: dict[str, list] = {lang: [] for lang in paired_langs}
+    video_results: dict[str, list] = {lang: [None] * df.height for lang in paired_langs}
 
     with tempfile.TemporaryDirectory() as temp_dir:
         rprint(f"Using temporary directory for video processing: {temp_dir}")
 
-        for row in df.iter_rows(named=True):
+        # (row_index, [(lang, infographic, audio, video_filename, target)])
+        pending_rows = []
+        for row_index, row in enumerate(df.iter_rows(named=True)):
+            # (lang, infographic, audio, video_filename, target_video_path)
+            pending = []
             for lang in paired_langs:
                 # Find the first valid infographic for this language
                 infographic = None
@@ -131,7 +300,6 @@ def process_videos(
                         break
 
                 if not infographic or not audio:
-                    video_results[lang].append(None)
                     continue
 
                 # Determine output filename
@@ -163,48 +331,123 @@ def process_videos(
                 # Check if video already exists in storage
                 if storage.exists(target_video_path):
                     if hasattr(storage, "get_full_path"):
-                        video_results[lang].append(
-                            storage.get_full_path(target_video_path)
+                        video_results[lang][row_index] = storage.get_full_path(
+                            target_video_path
                         )
                     else:
-                        video_results[lang].append(target_video_path)
+                        video_results[lang][row_index] = target_video_path
                     rprint(f"Video already exists: {video_filename}")
                     continue
 
-                rprint(f"Creating video: {video_filename}")
-
-                local_info_path = os.path.join(temp_dir, f"input_image_{lang}.png")
-                ext = os.path.splitext(audio)[1] or ".m4a"
-                local_audio_path = os.path.join(temp_dir, f"input_audio_{lang}{ext}")
-                local_video_path = os.path.join(temp_dir, f"output_video_{lang}.mp4")
-
+                pending.append(
+                    (lang, infographic, audio, video_filename, target_video_path)
+                )
+
+            if pending:
+                pending_rows.append((row_index, pending))
+
+        def _group_by_image(task):
+            """Fetches each distinct infographic of a row once and groups the
+            row's languages by image content, so a shared image is encoded
+            only once."""
+            row_index, pending = task
+            local_images: dict[str, tuple[str, str, str]] = {}
+            groups: dict[str, list] = defaultdict(list)
+            image_dirs: dict[str, list[str]] = defaultdict(list)
+            for job in pending:
+                infographic = job[1]
                 try:
-                    info_bytes = storage.read_bytes(infographic)
-                    with open(local_info_path, "wb") as f:
-                        f.write(info_bytes)
-
-                    audio_bytes = storage.read_bytes(audio)
-                    with open(local_audio_path, "wb") as f:
-                        f.write(audio_bytes)
-
-                    if create_video(
-                        local_info_path, local_audio_path, local_video_path
-                    ):
-                        uploaded_link = storage.upload_file(
-                            local_video_path,
-                            target_video_path,
-                            content_type="video/mp4",
+                    if infographic not in local_images:
+                        download_dir = os.path.join(
+                            temp_dir, f"row_{row_index}", f"image_{len(local_images)}"
                         )
-                        rprint(
-                            f"Successfully created and uploaded: "
-                            f"{format_clickable_path(uploaded_link)}"
+                        os.makedirs(download_dir, exist_ok=True)
+                        # Local files are used in place, remote ones are
+                        # streamed to download_dir
+                        local_info_path = storage.get_local_file(
+                            infographic, download_dir=download_dir
                         )
-                        video_results[lang].append(uploaded_link)
-                    else:
-                        video_results[lang].append(None)
+                        if not local_info_path:
+                            raise FileNotFoundError(
+                                f"Could not fetch infographic: {infographic}"
+                            )
+                        with open(local_info_path, "rb") as f:
+                            digest = hashlib.file_digest(f, "sha256").hexdigest()[:16]
+                        local_images[infographic] = (
+                            digest,
+                            local_info_path,
+                            download_dir,
+                        )
+                        image_dirs[digest].append(download_dir)
+                    digest, local_info_path, _ = local_images[infographic]
+                    if not groups[digest]:
+                        groups[digest].append(local_info_path)
+                    groups[digest].append(job)
                 except Exception as e:
                     print(f"Error processing video for row: {e}")
-                    video_results[lang].append(None)
+            return [
+                (row_index, digest, image_jobs[0], image_dirs[digest], image_jobs[1:])
+                for digest, image_jobs in groups.items()
+            ]
+
+        def _render_group(task):
+            """Renders and uploads the videos of one image group. Returns
+            (lang, link) for every video that was uploaded."""
+            row_index, digest, local_info_path, image_dirs, jobs = task
+            group_dir = os.path.join(temp_dir, f"row_{row_index}", digest)
+            os.makedirs(group_dir, exist_ok=True)
+            uploaded = []
+            try:
+                renders: list[tuple[str, str]] = []
+                for lang, _, audio, video_filename, _ in jobs:
+                    rprint(f"Creating video: {video_filename}")
+                    local_audio_path = storage.get_local_file(
+                        audio, download_dir=os.path.join(group_dir, f"audio_{lang}")
+                    )
+                    if not local_audio_path:
+                        raise FileNotFoundError(f"Could not fetch audio: {audio}")
+                    renders.append(
+                        (local_audio_path, os.path.join(group_dir, f"{lang}.mp4"))
+                    )
+
+                created = _render_videos(
+                    local_info_path, renders, os.path.join(group_dir, "still.mp4")
+                )
+                for job, (_, local_video_path), ok in zip(jobs, renders, created):
+                    if not ok:
+                        continue
+                    uploaded_link = storage.upload_file(
+                        local_video_path,
+                        job[4],
+                        content_type="video/mp4",
+                    )
+                    rprint(
+                        f"Successfully created and uploaded: "
+                        f"{format_clickable_path(uploaded_link)}"
+                    )
+                    uploaded.append((job[0], uploaded_link))
+            except Exception as e:
+                print(f"Error processing video for row: {e}")
+            finally:
+                # Free the temp space as soon as the group is done. Files of
+                # local storage were used in place and live outside temp_dir.
+                for path in [group_dir, *image_dirs]:
+                    shutil.rmtree(path, ignore_errors=True)
+            return uploaded
+
+        # Encodes run in ffmpeg subprocesses, so threads keep every core busy,
+        # and each upload overlaps with the encodes of the other groups
+        max_workers = video_max_workers()
+        groups = [
+            group
+            for row_groups in thread_map(_group_by_image, pending_rows, max_workers)
+            for group in row_groups
+        ]
+        for (row_index, *_), uploaded in zip(
+            groups, thread_map(_render_group, groups, max_workers)
+        ):
+            for lang, link in uploaded:
+                video_results[lang][row_index] = link
 
     # Add video columns to DataFrame
     for lang in paired_langs: